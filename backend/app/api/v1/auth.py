@@ -3,26 +3,66 @@ Authentication endpoints for the HackOps API.
 Handles login, logout, registration, OAuth flows, and token management.
 """
 
-from datetime import datetime
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from fastapi.security import HTTPBearer
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.core.auth import TokenManager, PasswordManager, SessionManager
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from app.core.database_utils import get_db
+from app.core.auth import TokenManager, SessionManager, password_manager
+from app.core.cache import user_cache
+from app.core.rate_limit import rate_limiter
 from app.core.oauth import OAuthManager
-from app.core.dependencies import get_current_user, get_current_active_user
-from app.models.user import User
-from app.models.user_session import UserSession
-
-router = APIRouter()
+from app.core.dependencies import (
+    get_current_user,
+    get_current_active_user,
+    get_token_manager,
+    get_session_manager,
+    get_oauth_manager
+)
+from app.models.user import PUBLIC_FIELDS, User, UserSession
+
+router = APIRouter(default_response_class=ORJSONResponse)
 security = HTTPBearer()
-token_manager = TokenManager()
-password_manager = PasswordManager()
-session_manager = SessionManager()
-oauth_manager = OAuthManager()
+
+# bcrypt is CPU-bound; run it on worker processes so the event loop stays responsive
+_BCRYPT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# Credential columns are always read from the database, never from the shared user cache
+_CREDENTIAL_COLUMNS = (User.password_hash, User.is_active, User.is_deleted)
+
+# Only the columns needed to authenticate and render the auth response
+_AUTH_USER_COLUMNS = load_only(*(getattr(User, field) for field in PUBLIC_FIELDS), *_CREDENTIAL_COLUMNS)
+
+
+async def _run_bcrypt(func, *args):
+    """Run a blocking bcrypt call on the process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, func, *args)
+
+
+async def _get_auth_user(db: AsyncSession, cached: Optional[Dict[str, Any]], criterion) -> Optional[Dict[str, Any]]:
+    """Load a user's credential columns, plus the public profile when it is not cached."""
+    if cached is not None:
+        result = await db.execute(select(*_CREDENTIAL_COLUMNS).where(criterion))
+        credentials = result.mappings().first()
+        return {**cached, **credentials} if credentials else None
+    
+    result = await db.execute(select(User).options(_AUTH_USER_COLUMNS).where(criterion))
+    db_user = result.scalar_one_or_none()
+    if not db_user:
+        return None
+    
+    profile = await user_cache.set_user(db_user)
+    return {**profile, **{column.key: getattr(db_user, column.key) for column in _CREDENTIAL_COLUMNS}}
 
 
 # Request/Response Models
@@ -39,6 +79,7 @@ class RegisterRequest(BaseModel):
     display_name: Optional[str] = None
 
 
+# Only ever built from server-generated values, so endpoints use model_construct()
 class AuthResponse(BaseModel):
     access_token: str
     refresh_token: str
@@ -69,82 +110,91 @@ class OAuthCallbackRequest(BaseModel):
 @router.post("/login", response_model=AuthResponse)
 async def login(
     request: LoginRequest,
-    db: Session = Depends(get_db),
-    http_request: Request = None
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    http_request: Request = None,
+    token_manager: TokenManager = Depends(get_token_manager),
+    session_manager: SessionManager = Depends(get_session_manager)
 ):
     """Login with email and password."""
-    # Find user by email
-    user = db.query(User).filter(User.email == request.email).first()
-    if not user:
+    # Shed brute-force traffic before it reaches the database or bcrypt
+    client_ip = http_request.client.host if http_request else ""
+    await rate_limiter.check(f"login:{client_ip}:{request.email}", limit=5, window=60)
+    
+    # Find user by email; the cache only spares loading the profile columns
+    user = await _get_auth_user(db, await user_cache.get_user_by_email(request.email), User.email == request.email)
+    if not user or user["is_deleted"]:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not user.is_active:
+    if not user["is_active"]:
         raise HTTPException(status_code=401, detail="Account is disabled")
     
     # Verify password
-    if not password_manager.verify_password(request.password, user.password_hash):
+    if not await _run_bcrypt(
+        password_manager.verify_password, request.password, user["password_hash"]
+    ):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Generate tokens
-    access_token = token_manager.create_access_token(user.id)
-    refresh_token = token_manager.create_refresh_token(user.id)
+    access_token = token_manager.create_access_token(user["id"])
+    refresh_token = token_manager.create_refresh_token(user["id"])
     
     # Create session
     user_agent = http_request.headers.get("user-agent", "") if http_request else ""
     ip_address = http_request.client.host if http_request else ""
     
     session = await session_manager.create_session(
-        user_id=user.id,
+        user_id=user["id"],
         refresh_token=refresh_token,
         user_agent=user_agent,
         ip_address=ip_address,
-        db=db
+        background=background_tasks
     )
     
-    return AuthResponse(
+    return AuthResponse.model_construct(
         access_token=access_token,
         refresh_token=refresh_token,
         expires_in=token_manager.access_token_expire_minutes * 60,
-        user={
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "display_name": user.display_name,
-            "avatar_url": user.avatar_url,
-            "system_role": user.system_role,
-            "is_verified": user.is_verified
-        }
+        user={field: user[field] for field in PUBLIC_FIELDS}
     )
 
 
 @router.post("/register", response_model=AuthResponse)
 async def register(
     request: RegisterRequest,
-    db: Session = Depends(get_db),
-    http_request: Request = None
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    http_request: Request = None,
+    token_manager: TokenManager = Depends(get_token_manager),
+    session_manager: SessionManager = Depends(get_session_manager)
 ):
     """Register a new user account."""
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
-    if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
+    client_ip = http_request.client.host if http_request else ""
+    await rate_limiter.check(f"register:{client_ip}", limit=5, window=60)
+    
+    password_hash = await _run_bcrypt(password_manager.hash_password, request.password)
     
-    # Create new user
-    password_hash = password_manager.hash_password(request.password)
-    user = User(
-        email=request.email,
-        password_hash=password_hash,
-        first_name=request.first_name,
-        last_name=request.last_name,
-        display_name=request.display_name or f"{request.first_name} {request.last_name}",
-        is_active=True,
-        is_verified=False  # Users need to verify their email
+    # Create new user; the unique email index settles concurrent signups in one round trip
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=request.email,
+            password_hash=password_hash,
+            first_name=request.first_name,
+            last_name=request.last_name,
+            display_name=request.display_name or f"{request.first_name} {request.last_name}",
+            is_active=True,
+            is_verified=False  # Users need to verify their email
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
+    user = result.scalar_one_or_none()
+    if user is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await user_cache.invalidate(user.id, user.email)
     
     # Generate tokens
     access_token = token_manager.create_access_token(user.id)
@@ -159,49 +209,42 @@ async def register(
         refresh_token=refresh_token,
         user_agent=user_agent,
         ip_address=ip_address,
-        db=db
+        background=background_tasks
     )
     
-    return AuthResponse(
+    return AuthResponse.model_construct(
         access_token=access_token,
         refresh_token=refresh_token,
         expires_in=token_manager.access_token_expire_minutes * 60,
-        user={
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "display_name": user.display_name,
-            "avatar_url": user.avatar_url,
-            "system_role": user.system_role,
-            "is_verified": user.is_verified
-        }
+        user=user.public_dict()
     )
 
 
 @router.post("/refresh", response_model=AuthResponse)
 async def refresh_token(
     request: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    token_manager: TokenManager = Depends(get_token_manager),
+    session_manager: SessionManager = Depends(get_session_manager)
 ):
     """Refresh access token using refresh token."""
     try:
         # Verify refresh token
-        payload = token_manager.verify_token(request.refresh_token)
+        payload = token_manager.verify_token(request.refresh_token, "refresh")
         user_id = payload.get("sub")
         
         # Check if refresh token is valid and not blacklisted
         if not await session_manager.is_token_valid(request.refresh_token):
             raise HTTPException(status_code=401, detail="Invalid refresh token")
         
-        # Get user
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_active:
+        # Get user; the active and deleted flags always come from the database
+        user = await _get_auth_user(db, await user_cache.get_user_by_id(user_id), User.id == user_id)
+        if not user or not user["is_active"] or user["is_deleted"]:
             raise HTTPException(status_code=401, detail="User not found or inactive")
         
         # Generate new tokens
-        access_token = token_manager.create_access_token(user.id)
-        new_refresh_token = token_manager.create_refresh_token(user.id)
+        access_token = token_manager.create_access_token(user["id"])
+        new_refresh_token = token_manager.create_refresh_token(user["id"])
         
         # Update session with new refresh token
         await session_manager.update_session_token(
@@ -210,20 +253,11 @@ async def refresh_token(
             db=db
         )
         
-        return AuthResponse(
+        return AuthResponse.model_construct(
             access_token=access_token,
             refresh_token=new_refresh_token,
             expires_in=token_manager.access_token_expire_minutes * 60,
-            user={
-                "id": user.id,
-                "email": user.email,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "display_name": user.display_name,
-                "avatar_url": user.avatar_url,
-                "system_role": user.system_role,
-                "is_verified": user.is_verified
-            }
+            user={field: user[field] for field in PUBLIC_FIELDS}
         )
     
     except Exception as e:
@@ -233,9 +267,13 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+    token_manager: TokenManager = Depends(get_token_manager),
+    session_manager: SessionManager = Depends(get_session_manager)
 ):
     """Logout current user and invalidate session."""
+    token_manager.evict_cached_token(credentials.credentials)
     await session_manager.invalidate_user_sessions(current_user.id, db)
     return {"message": "Successfully logged out"}
 
@@ -243,16 +281,23 @@ async def logout(
 @router.post("/logout-all")
 async def logout_all(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+    token_manager: TokenManager = Depends(get_token_manager),
+    session_manager: SessionManager = Depends(get_session_manager)
 ):
     """Logout from all devices by invalidating all user sessions."""
+    token_manager.evict_cached_token(credentials.credentials)
     await session_manager.invalidate_user_sessions(current_user.id, db)
     return {"message": "Successfully logged out from all devices"}
 
 
 # OAuth Endpoints
 @router.get("/oauth/{provider}/url")
-async def get_oauth_url(provider: str):
+async def get_oauth_url(
+    provider: str,
+    oauth_manager: OAuthManager = Depends(get_oauth_manager)
+):
     """Get OAuth authorization URL for the specified provider."""
     try:
         auth_url = oauth_manager.get_authorization_url(provider)
@@ -265,42 +310,44 @@ async def get_oauth_url(provider: str):
 async def oauth_callback(
     provider: str,
     request: OAuthCallbackRequest,
-    db: Session = Depends(get_db),
-    http_request: Request = None
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    http_request: Request = None,
+    token_manager: TokenManager = Depends(get_token_manager),
+    session_manager: SessionManager = Depends(get_session_manager),
+    oauth_manager: OAuthManager = Depends(get_oauth_manager)
 ):
     """Handle OAuth callback and authenticate user."""
     try:
         # Exchange code for user info
         user_info = await oauth_manager.exchange_code_for_user_info(provider, request.code)
         
-        # Find or create user
-        user = db.query(User).filter(
-            User.email == user_info.email
-        ).first()
-        
-        if user:
-            # Update existing user with OAuth info
-            user.auth_provider = provider
-            user.oauth_id = user_info.id
-            user.avatar_url = user_info.avatar_url or user.avatar_url
-            user.is_verified = True  # OAuth users are considered verified
-        else:
-            # Create new user
-            user = User(
-                email=user_info.email,
-                first_name=user_info.first_name,
-                last_name=user_info.last_name,
-                display_name=user_info.name,
-                avatar_url=user_info.avatar_url,
-                auth_provider=provider,
-                oauth_id=user_info.id,
-                is_active=True,
-                is_verified=True
-            )
-            db.add(user)
+        # Find or create user in one statement; the unique email index settles racing callbacks
+        stmt = insert(User).values(
+            email=user_info.email,
+            first_name=user_info.first_name,
+            last_name=user_info.last_name,
+            display_name=f"{user_info.first_name} {user_info.last_name}".strip(),
+            avatar_url=user_info.avatar_url,
+            auth_provider=provider,
+            oauth_id=user_info.oauth_id,
+            is_active=True,
+            is_verified=True  # OAuth users are considered verified
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={
+                "auth_provider": stmt.excluded.auth_provider,
+                "oauth_id": stmt.excluded.oauth_id,
+                "avatar_url": func.coalesce(stmt.excluded.avatar_url, User.avatar_url),
+                "is_verified": True
+            }
+        ).returning(User)
+        result = await db.execute(stmt)
+        user = result.scalar_one()
         
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await user_cache.invalidate(user.id, user.email)
         
         # Generate tokens
         access_token = token_manager.create_access_token(user.id)
@@ -315,23 +362,14 @@ async def oauth_callback(
             refresh_token=refresh_token,
             user_agent=user_agent,
             ip_address=ip_address,
-            db=db
+            background=background_tasks
         )
         
-        return AuthResponse(
+        return AuthResponse.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=token_manager.access_token_expire_minutes * 60,
-            user={
-                "id": user.id,
-                "email": user.email,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "display_name": user.display_name,
-                "avatar_url": user.avatar_url,
-                "system_role": user.system_role,
-                "is_verified": user.is_verified
-            }
+            user=user.public_dict()
         )
     
     except Exception as e:
@@ -343,19 +381,25 @@ async def oauth_callback(
 async def change_password(
     request: ChangePasswordRequest,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    session_manager: SessionManager = Depends(get_session_manager)
 ):
     """Change user password."""
     # Verify current password
-    if not password_manager.verify_password(request.current_password, current_user.password_hash):
+    if not await _run_bcrypt(
+        password_manager.verify_password, request.current_password, current_user.password_hash
+    ):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
     
     # Update password
-    new_password_hash = password_manager.hash_password(request.new_password)
-    current_user.password_hash = new_password_hash
-    current_user.updated_at = datetime.utcnow()
-    
-    db.commit()
+    new_password_hash = await _run_bcrypt(password_manager.hash_password, request.new_password)
+    await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(password_hash=new_password_hash, updated_at=func.now())
+    )
+    await db.commit()
+    await user_cache.invalidate(current_user.id, current_user.email)
     
     # Invalidate all sessions to force re-login
     await session_manager.invalidate_user_sessions(current_user.id, db)
@@ -366,6 +410,8 @@ async def change_password(
 @router.post("/reset-password")
 async def reset_password(request: ResetPasswordRequest):
     """Request password reset (placeholder for email-based reset)."""
+    await rate_limiter.check(f"reset_password:{request.email}", limit=5, window=60)
+    
     # TODO: Implement email-based password reset
     # This would typically:
     # 1. Generate a secure reset token
@@ -402,13 +448,25 @@ async def get_current_user_info(
 @router.get("/sessions")
 async def get_user_sessions(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get user's active sessions."""
-    sessions = db.query(UserSession).filter(
-        UserSession.user_id == current_user.id,
-        UserSession.is_active == True
-    ).all()
+    result = await db.execute(
+        select(UserSession)
+        .options(
+            load_only(
+                UserSession.id,
+                UserSession.user_agent,
+                UserSession.ip_address,
+                UserSession.created_at,
+                UserSession.last_accessed,
+                UserSession.refresh_token
+            )
+        )
+        .where(UserSession.user_id == current_user.id)
+        .where(UserSession.is_active == True)
+    )
+    sessions = result.scalars().all()
     
     return {
         "sessions": [
@@ -429,21 +487,24 @@ async def get_user_sessions(
 async def revoke_session(
     session_id: str,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    session_manager: SessionManager = Depends(get_session_manager)
 ):
     """Revoke a specific session."""
-    session = db.query(UserSession).filter(
-        UserSession.id == session_id,
-        UserSession.user_id == current_user.id
-    ).first()
+    # Deactivate and fetch the token in one statement, without loading the row
+    result = await db.execute(
+        update(UserSession)
+        .where(UserSession.id == session_id)
+        .where(UserSession.user_id == current_user.id)
+        .values(is_active=False, revoked_at=func.now())
+        .returning(UserSession.refresh_token)
+    )
+    refresh_token = result.scalar_one_or_none()
     
-    if not session:
+    if refresh_token is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    await session_manager.invalidate_session(session.refresh_token)
-    session.is_active = False
-    session.revoked_at = datetime.utcnow()
-    
-    db.commit()
+    await db.commit()
+    await session_manager.invalidate_session(refresh_token)
     
     return {"message": "Session revoked successfully"}
\ No newline at end of file
@@ -1,39 +1,104 @@
 """
 Events API endpoints for comprehensive event management
 """
-from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.services.event_service import EventService
+import logging
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from datetime import datetime
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import swr_cache
+from app.core.database_utils import get_db
+from app.core.exceptions import ServiceValidationError
+from app.services.event_service import EventService, encode_event_cursor, serialize_event
 from app.schemas.event import (
     EventCreate, EventUpdate, EventStatusUpdate, EventResponse, EventListResponse,
     EventWizardStep1, EventWizardStep2, EventWizardStep3, EventWizardStep4, 
     EventWizardStep5, EventWizardStep6, ScheduleItem, Room, ConflictDetection,
-    WaitlistEntry, WaitlistStats
+    WaitlistEntry, WaitlistStats, EventOverview
 )
 from app.models.event import EventStatus, EventType, EventVisibility
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-# Dependency to get event service
+# Dependency to get event service; FastAPI caches it per request, so every
+# dependant of one request shares a single instance
 async def get_event_service(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     tenant_id: str = Query("default-tenant", description="Tenant ID")
 ) -> EventService:
     """Get event service instance with tenant context"""
     return EventService(db, tenant_id)
 
 
+def map_service_errors(action: str, value_error_status: int = status.HTTP_400_BAD_REQUEST) -> Callable:
+    """Translate service errors into HTTP responses for an endpoint.
+    
+    ServiceValidationError becomes `value_error_status` with its message, HTTPException
+    passes through, and anything else is logged and returned as a generic 500.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            except HTTPException:
+                raise
+            except ServiceValidationError as e:
+                raise HTTPException(status_code=value_error_status, detail=str(e))
+            except Exception:
+                logger.exception("Failed to %s", action)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to {action}"
+                )
+        return wrapper
+    return decorator
+
+
+# Streamed JSON bodies
+
+def stream_event_rows(
+    events: List[RowMapping],
+    meta: Dict[str, Any],
+    page_size: Optional[int] = None
+) -> Iterator[bytes]:
+    """Stream `{"events": [...], **meta}` one row at a time from an already fetched page.
+    
+    With page_size set, a row past it is not sent and fills meta["next_cursor"] instead.
+    """
+    if page_size is not None and len(events) > page_size:
+        last = events[page_size - 1]
+        meta["next_cursor"] = encode_event_cursor(last["start_at"], last["id"])
+        events = events[:page_size]
+    
+    yield b'{"events":['
+    for index, event in enumerate(events):
+        yield (b"," if index else b"") + orjson.dumps(dict(event))
+    yield b"]," + orjson.dumps(meta)[1:]
+
+
 # Core CRUD endpoints
 
-@router.get("/", response_model=EventListResponse)
+@router.get("/", response_model=None, responses={200: {"model": EventListResponse}})
+@map_service_errors("retrieve events")
 async def list_events(
     skip: int = Query(0, ge=0, description="Number of events to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of events to return"),
-    status: Optional[EventStatus] = Query(None, description="Filter by event status"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor (next_cursor of the previous page; empty for the first page). "
+                    "Replaces skip and drops total/total_pages from the response."
+    ),
+    event_status: Optional[EventStatus] = Query(None, alias="status", description="Filter by event status"),
     event_type: Optional[EventType] = Query(None, description="Filter by event type"),
     visibility: Optional[EventVisibility] = Query(None, description="Filter by visibility"),
     search: Optional[str] = Query(None, description="Search in name and description"),
@@ -42,836 +107,457 @@ async def list_events(
     event_service: EventService = Depends(get_event_service)
 ):
     """Get paginated list of events with filtering"""
-    try:
-        events, total = await event_service.get_events_list(
-            skip=skip,
+    filters = {
+        "status": event_status,
+        "event_type": event_type,
+        "visibility": visibility,
+        "search": search,
+        "upcoming_only": upcoming_only,
+        "published_only": published_only
+    }
+    
+    if cursor is not None:
+        events = await event_service.get_events_page(
+            cursor=cursor,
             limit=limit,
-            status=status,
-            event_type=event_type,
-            visibility=visibility,
-            search=search,
-            upcoming_only=upcoming_only,
-            published_only=published_only
-        )
-        
-        # Convert to response format
-        event_responses = []
-        for event in events:
-            event_response = EventResponse.from_orm(event)
-            # Add computed properties
-            event_response.is_published = event.is_published()
-            event_response.is_registration_open = event.is_registration_open()
-            event_response.is_team_formation_open = event.is_team_formation_open()
-            event_response.is_submission_open = event.is_submission_open()
-            event_response.is_judging_period = event.is_judging_period()
-            event_response.capacity_remaining = event.capacity_remaining()
-            event_response.is_at_capacity = event.is_at_capacity()
-            event_responses.append(event_response)
-        
-        total_pages = (total + limit - 1) // limit
-        
-        return EventListResponse(
-            events=event_responses,
-            total=total,
-            page=(skip // limit) + 1,
-            per_page=limit,
-            total_pages=total_pages
+            **filters
         )
     
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve events: {str(e)}"
+        return StreamingResponse(
+            stream_event_rows(events, {"per_page": limit, "next_cursor": None}, page_size=limit),
+            media_type="application/json"
         )
-
-
-@router.post("/", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
+    
+    events, total = await event_service.get_events_list(
+        skip=skip,
+        limit=limit,
+        **filters
+    )
+    
+    total_pages = (total + limit - 1) // limit
+    
+    return StreamingResponse(
+        stream_event_rows(events, {
+            "total": total,
+            "page": (skip // limit) + 1,
+            "per_page": limit,
+            "total_pages": total_pages
+        }),
+        media_type="application/json"
+    )
+
+
+@router.post("/", response_model=None, status_code=status.HTTP_201_CREATED, responses={201: {"model": EventResponse}})
+@map_service_errors("create event")
 async def create_event(
     event_data: EventCreate,
     creator_id: str = Query(..., description="ID of the user creating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Create a new event"""
-    try:
-        event = await event_service.create_event(event_data, creator_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.create_event(event_data, creator_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create event: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event), status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/{event_id}", response_model=EventResponse)
+@router.get("/{event_id}", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("retrieve event")
 async def get_event(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     event_service: EventService = Depends(get_event_service)
 ):
     """Get event by ID"""
-    try:
-        event = await event_service.get(event_id)
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Event not found"
-            )
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
-    
-    except HTTPException:
-        raise
-    except Exception as e:
+    payload = await event_service.get_event_json(event_id)
+    if payload is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve event: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
         )
+    
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/slug/{slug}", response_model=EventResponse)
+@router.get("/{event_id}/full", response_model=None, responses={200: {"model": EventOverview}})
+@map_service_errors("retrieve event overview", value_error_status=status.HTTP_404_NOT_FOUND)
+async def get_event_overview(
+    event_id: str,
+    event_service: EventService = Depends(get_event_service)
+):
+    """Get event with schedule, rooms, capacity and waitlist stats in one response"""
+    overview = await event_service.get_event_overview(event_id)
+    return ORJSONResponse(overview)
+
+
+@router.get("/slug/{slug}", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("retrieve event")
 async def get_event_by_slug(
-    slug: str = Path(..., description="Event slug"),
+    slug: str,
     event_service: EventService = Depends(get_event_service)
 ):
     """Get event by slug"""
-    try:
-        event = await event_service.get_by_slug(slug)
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Event not found"
-            )
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
-    
-    except HTTPException:
-        raise
-    except Exception as e:
+    payload = await event_service.get_event_json_by_slug(slug)
+    if payload is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve event: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
         )
+    
+    return Response(content=payload, media_type="application/json")
 
 
-@router.put("/{event_id}", response_model=EventResponse)
+@router.put("/{event_id}", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("update event")
 async def update_event(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     update_data: EventUpdate = ...,
     updater_id: str = Query(..., description="ID of the user updating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Update an event"""
-    try:
-        event = await event_service.update_event(event_id, update_data, updater_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.update_event(event_id, update_data, updater_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update event: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
+@map_service_errors("delete event")
 async def delete_event(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     deleter_id: str = Query(..., description="ID of the user deleting the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Soft delete an event"""
-    try:
-        success = await event_service.delete(event_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Event not found"
-            )
-    
-    except HTTPException:
-        raise
-    except Exception as e:
+    success = await event_service.delete(event_id)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete event: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
         )
 
 
 # Event lifecycle management endpoints
 
-@router.patch("/{event_id}/status", response_model=EventResponse)
+@router.patch("/{event_id}/status", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("update event status")
 async def update_event_status(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     status_update: EventStatusUpdate = ...,
     updater_id: str = Query(..., description="ID of the user updating the status"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Update event status with validation"""
-    try:
-        event = await event_service.update_event_status(event_id, status_update, updater_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.update_event_status(event_id, status_update, updater_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update event status: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
-@router.post("/{event_id}/publish", response_model=EventResponse)
+@router.post("/{event_id}/publish", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("publish event")
 async def publish_event(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     publisher_id: str = Query(..., description="ID of the user publishing the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Publish an event (move from DRAFT to PUBLISHED)"""
-    try:
-        event = await event_service.publish_event(event_id, publisher_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.publish_event(event_id, publisher_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to publish event: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
-@router.post("/{event_id}/registration/open", response_model=EventResponse)
+@router.post("/{event_id}/registration/open", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("open registration")
 async def open_registration(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     opener_id: str = Query(..., description="ID of the user opening registration"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Open event registration"""
-    try:
-        event = await event_service.open_registration(event_id, opener_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.open_registration(event_id, opener_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to open registration: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
-@router.post("/{event_id}/registration/close", response_model=EventResponse)
+@router.post("/{event_id}/registration/close", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("close registration")
 async def close_registration(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     closer_id: str = Query(..., description="ID of the user closing registration"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Close event registration"""
-    try:
-        event = await event_service.close_registration(event_id, closer_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.close_registration(event_id, closer_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to close registration: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
-@router.post("/{event_id}/start", response_model=EventResponse)
+@router.post("/{event_id}/start", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("start event")
 async def start_event(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     starter_id: str = Query(..., description="ID of the user starting the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Start event (move to IN_PROGRESS)"""
-    try:
-        event = await event_service.start_event(event_id, starter_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.start_event(event_id, starter_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start event: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
-@router.post("/{event_id}/complete", response_model=EventResponse)
+@router.post("/{event_id}/complete", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("complete event")
 async def complete_event(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     completer_id: str = Query(..., description="ID of the user completing the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Complete event"""
-    try:
-        event = await event_service.complete_event(event_id, completer_id)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.complete_event(event_id, completer_id)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to complete event: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
-@router.post("/{event_id}/cancel", response_model=EventResponse)
+@router.post("/{event_id}/cancel", response_model=None, responses={200: {"model": EventResponse}})
+@map_service_errors("cancel event")
 async def cancel_event(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     reason: str = Query(..., description="Reason for cancellation"),
     canceller_id: str = Query(..., description="ID of the user cancelling the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Cancel event"""
-    try:
-        event = await event_service.cancel_event(event_id, canceller_id, reason)
-        
-        # Convert to response format
-        event_response = EventResponse.from_orm(event)
-        event_response.is_published = event.is_published()
-        event_response.is_registration_open = event.is_registration_open()
-        event_response.is_team_formation_open = event.is_team_formation_open()
-        event_response.is_submission_open = event.is_submission_open()
-        event_response.is_judging_period = event.is_judging_period()
-        event_response.capacity_remaining = event.capacity_remaining()
-        event_response.is_at_capacity = event.is_at_capacity()
-        
-        return event_response
+    event = await event_service.cancel_event(event_id, canceller_id, reason)
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to cancel event: {str(e)}"
-        )
+    return ORJSONResponse(serialize_event(event))
 
 
 # Event wizard endpoints
 
 @router.post("/wizard/step1")
+@map_service_errors("process wizard step 1")
 async def create_event_wizard_step1(
     step_data: EventWizardStep1,
     creator_id: str = Query(..., description="ID of the user creating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Process event creation wizard step 1: Basic information"""
-    try:
-        result = await event_service.create_event_wizard_step1(step_data, creator_id)
-        return result
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process wizard step 1: {str(e)}"
-        )
+    result = await event_service.create_event_wizard_step1(step_data, creator_id)
+    return result
 
 
 @router.put("/wizard/{event_id}/step2")
+@map_service_errors("process wizard step 2", value_error_status=status.HTTP_404_NOT_FOUND)
 async def update_event_wizard_step2(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     step_data: EventWizardStep2 = ...,
     updater_id: str = Query(..., description="ID of the user updating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Process event creation wizard step 2: Timing"""
-    try:
-        result = await event_service.update_event_wizard_step2(event_id, step_data, updater_id)
-        return result
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process wizard step 2: {str(e)}"
-        )
+    result = await event_service.update_event_wizard_step2(event_id, step_data, updater_id)
+    return result
 
 
 @router.put("/wizard/{event_id}/step3")
+@map_service_errors("process wizard step 3", value_error_status=status.HTTP_404_NOT_FOUND)
 async def update_event_wizard_step3(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     step_data: EventWizardStep3 = ...,
     updater_id: str = Query(..., description="ID of the user updating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Process event creation wizard step 3: Venue/Virtual setup"""
-    try:
-        result = await event_service.update_event_wizard_step3(event_id, step_data, updater_id)
-        return result
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process wizard step 3: {str(e)}"
-        )
+    result = await event_service.update_event_wizard_step3(event_id, step_data, updater_id)
+    return result
 
 
 @router.put("/wizard/{event_id}/step4")
+@map_service_errors("process wizard step 4", value_error_status=status.HTTP_404_NOT_FOUND)
 async def update_event_wizard_step4(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     step_data: EventWizardStep4 = ...,
     updater_id: str = Query(..., description="ID of the user updating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Process event creation wizard step 4: Capacity and teams"""
-    try:
-        result = await event_service.update_event_wizard_step4(event_id, step_data, updater_id)
-        return result
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process wizard step 4: {str(e)}"
-        )
+    result = await event_service.update_event_wizard_step4(event_id, step_data, updater_id)
+    return result
 
 
 @router.put("/wizard/{event_id}/step5")
+@map_service_errors("process wizard step 5", value_error_status=status.HTTP_404_NOT_FOUND)
 async def update_event_wizard_step5(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     step_data: EventWizardStep5 = ...,
     updater_id: str = Query(..., description="ID of the user updating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Process event creation wizard step 5: Registration and submission"""
-    try:
-        result = await event_service.update_event_wizard_step5(event_id, step_data, updater_id)
-        return result
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process wizard step 5: {str(e)}"
-        )
+    result = await event_service.update_event_wizard_step5(event_id, step_data, updater_id)
+    return result
 
 
 @router.put("/wizard/{event_id}/step6")
+@map_service_errors("process wizard step 6", value_error_status=status.HTTP_404_NOT_FOUND)
 async def update_event_wizard_step6(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     step_data: EventWizardStep6 = ...,
     updater_id: str = Query(..., description="ID of the user updating the event"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Process event creation wizard step 6: Final settings"""
-    try:
-        result = await event_service.update_event_wizard_step6(event_id, step_data, updater_id)
-        return result
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process wizard step 6: {str(e)}"
-        )
+    result = await event_service.update_event_wizard_step6(event_id, step_data, updater_id)
+    return result
 
 
 # Schedule management endpoints
 
-@router.get("/{event_id}/schedule", response_model=List[ScheduleItem])
+@router.get("/{event_id}/schedule", response_model=None, responses={200: {"model": List[ScheduleItem]}})
+@map_service_errors("retrieve schedule", value_error_status=status.HTTP_404_NOT_FOUND)
 async def get_event_schedule(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     event_service: EventService = Depends(get_event_service)
 ):
     """Get event schedule items"""
-    try:
-        schedule = await event_service.get_event_schedule(event_id)
-        return schedule
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve schedule: {str(e)}"
-        )
+    schedule = await event_service.get_event_schedule(event_id)
+    return ORJSONResponse([item.model_dump() for item in schedule])
 
 
-@router.post("/{event_id}/schedule", response_model=ScheduleItem, status_code=status.HTTP_201_CREATED)
+@router.post("/{event_id}/schedule", response_model=None, status_code=status.HTTP_201_CREATED, responses={201: {"model": ScheduleItem}})
+@map_service_errors("add schedule item")
 async def add_schedule_item(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     schedule_item: ScheduleItem = ...,
     creator_id: str = Query(..., description="ID of the user creating the schedule item"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Add schedule item with conflict detection"""
-    try:
-        item = await event_service.add_schedule_item(event_id, schedule_item, creator_id)
-        return item
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add schedule item: {str(e)}"
-        )
+    item = await event_service.add_schedule_item(event_id, schedule_item, creator_id)
+    return item
 
 
-@router.post("/{event_id}/schedule/conflicts", response_model=ConflictDetection)
+@router.post("/{event_id}/schedule/conflicts", response_model=None, responses={200: {"model": ConflictDetection}})
+@map_service_errors("detect conflicts", value_error_status=status.HTTP_404_NOT_FOUND)
 async def detect_schedule_conflicts(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     schedule_item: ScheduleItem = ...,
     event_service: EventService = Depends(get_event_service)
 ):
     """Detect schedule conflicts for a new item"""
-    try:
-        conflicts = await event_service.detect_schedule_conflicts(event_id, schedule_item)
-        return conflicts
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to detect conflicts: {str(e)}"
-        )
+    conflicts = await event_service.detect_schedule_conflicts(event_id, schedule_item)
+    return conflicts
 
 
 # Room and resource management endpoints
 
-@router.get("/{event_id}/rooms", response_model=List[Room])
+@router.get("/{event_id}/rooms", response_model=None, responses={200: {"model": List[Room]}})
+@map_service_errors("retrieve rooms", value_error_status=status.HTTP_404_NOT_FOUND)
 async def get_event_rooms(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     event_service: EventService = Depends(get_event_service)
 ):
     """Get event rooms/spaces"""
-    try:
-        rooms = await event_service.get_event_rooms(event_id)
-        return rooms
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve rooms: {str(e)}"
-        )
+    rooms = await event_service.get_event_rooms(event_id)
+    return rooms
 
 
-@router.post("/{event_id}/rooms", response_model=Room, status_code=status.HTTP_201_CREATED)
+@router.post("/{event_id}/rooms", response_model=None, status_code=status.HTTP_201_CREATED, responses={201: {"model": Room}})
+@map_service_errors("add room", value_error_status=status.HTTP_404_NOT_FOUND)
 async def add_room(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     room: Room = ...,
     creator_id: str = Query(..., description="ID of the user adding the room"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Add room to event"""
-    try:
-        added_room = await event_service.add_room(event_id, room, creator_id)
-        return added_room
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add room: {str(e)}"
-        )
+    added_room = await event_service.add_room(event_id, room, creator_id)
+    return added_room
 
 
 @router.get("/{event_id}/rooms/{room_id}/availability")
+@map_service_errors("check room availability")
 async def check_room_availability(
-    event_id: str = Path(..., description="Event ID"),
-    room_id: str = Path(..., description="Room ID"),
-    start_at: str = Query(..., description="Start time (ISO format)"),
-    end_at: str = Query(..., description="End time (ISO format)"),
+    event_id: str,
+    room_id: str,
+    start_at: datetime = Query(..., description="Start time (ISO format)"),
+    end_at: datetime = Query(..., description="End time (ISO format)"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Check if room is available for given time period"""
-    try:
-        from datetime import datetime
-        start_datetime = datetime.fromisoformat(start_at.replace('Z', '+00:00'))
-        end_datetime = datetime.fromisoformat(end_at.replace('Z', '+00:00'))
-        
-        is_available = await event_service.check_room_availability(
-            event_id, room_id, start_datetime, end_datetime
-        )
-        
-        return {
-            "room_id": room_id,
-            "start_at": start_at,
-            "end_at": end_at,
-            "is_available": is_available
-        }
+    is_available = await event_service.check_room_availability(
+        event_id, room_id, start_at, end_at
+    )
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to check room availability: {str(e)}"
-        )
+    return {
+        "room_id": room_id,
+        "start_at": start_at,
+        "end_at": end_at,
+        "is_available": is_available
+    }
 
 
 # Capacity and waitlist endpoints
 
 @router.get("/{event_id}/capacity")
+@map_service_errors("retrieve capacity info", value_error_status=status.HTTP_404_NOT_FOUND)
 async def get_capacity_info(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     event_service: EventService = Depends(get_event_service)
 ):
     """Get detailed capacity information"""
-    try:
-        capacity_info = await event_service.get_capacity_info(event_id)
-        return capacity_info
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve capacity info: {str(e)}"
-        )
+    capacity_info = await event_service.get_capacity_info(event_id)
+    return capacity_info
 
 
-@router.post("/{event_id}/waitlist", response_model=WaitlistEntry, status_code=status.HTTP_201_CREATED)
+@router.post("/{event_id}/waitlist", response_model=None, status_code=status.HTTP_201_CREATED, responses={201: {"model": WaitlistEntry}})
+@map_service_errors("add to waitlist")
 async def add_to_waitlist(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     user_id: str = Query(..., description="User ID to add to waitlist"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Add user to event waitlist"""
-    try:
-        entry = await event_service.add_to_waitlist(event_id, user_id)
-        return entry
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add to waitlist: {str(e)}"
-        )
+    entry = await event_service.add_to_waitlist(event_id, user_id)
+    return entry
 
 
-@router.post("/{event_id}/waitlist/process", response_model=List[WaitlistEntry])
+@router.post("/{event_id}/waitlist/process", response_model=None, responses={200: {"model": List[WaitlistEntry]}})
+@map_service_errors("process waitlist", value_error_status=status.HTTP_404_NOT_FOUND)
 async def process_waitlist(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     spots_available: int = Query(1, ge=1, description="Number of spots available"),
     event_service: EventService = Depends(get_event_service)
 ):
     """Process waitlist when spots become available"""
-    try:
-        notified_entries = await event_service.process_waitlist(event_id, spots_available)
-        return notified_entries
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process waitlist: {str(e)}"
-        )
+    notified_entries = await event_service.process_waitlist(event_id, spots_available)
+    return notified_entries
 
 
-@router.get("/{event_id}/waitlist/stats", response_model=WaitlistStats)
+@router.get("/{event_id}/waitlist/stats", response_model=None, responses={200: {"model": WaitlistStats}})
+@map_service_errors("retrieve waitlist stats", value_error_status=status.HTTP_404_NOT_FOUND)
 async def get_waitlist_stats(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
     event_service: EventService = Depends(get_event_service)
 ):
     """Get waitlist statistics"""
-    try:
-        stats = await event_service.get_waitlist_stats(event_id)
-        return stats
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve waitlist stats: {str(e)}"
-        )
+    stats = await event_service.get_waitlist_stats(event_id)
+    return stats
 
 
 # Analytics endpoints
 
 @router.get("/{event_id}/analytics")
+@map_service_errors("retrieve analytics", value_error_status=status.HTTP_404_NOT_FOUND)
 async def get_event_analytics(
-    event_id: str = Path(..., description="Event ID"),
+    event_id: str,
+    response: Response,
     event_service: EventService = Depends(get_event_service)
 ):
-    """Get comprehensive event analytics"""
-    try:
-        analytics = await event_service.get_event_analytics(event_id)
-        return analytics
-    
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve analytics: {str(e)}"
-        )
\ No newline at end of file
+    """Get comprehensive event analytics, served stale-while-revalidate"""
+    tenant_id = event_service.tenant_id
+    analytics = await swr_cache.get(
+        f"event:analytics:{tenant_id}:{event_id}",
+        event_service.db,
+        lambda session: EventService(session, tenant_id).get_event_analytics(event_id),
+        response
+    )
+    return analytics
@@ -8,24 +8,37 @@ This module provides REST API endpoints for tenant management including:
 - Tenant configuration and settings
 """
 
+import hashlib
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel, Field, validator
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, validator
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import swr_cache, tenant_cache
+from app.core.database_utils import get_db
 from app.core.dependencies import get_current_user
-from app.core.rbac import RBACManager, SystemRole, TenantRole, Permission
+from app.core.rbac import SystemRole, TenantRole, Permission, rbac_manager
 from app.models.user import User
 from app.models.tenant import Tenant, TenantUser, TenantStatus, TenantPlan
 from app.services.tenant_service import tenant_service
 from app.schemas.base import BaseResponse, PaginatedResponse
 
 
-router = APIRouter(prefix="/tenants", tags=["tenants"])
+router = APIRouter(prefix="/tenants", tags=["tenants"], default_response_class=ORJSONResponse)
+
+# Validator lookups, built once at import instead of per request
+_SLUG_RE = re.compile(r'^[a-z0-9-]+$')
+_PLAN_VALUES = frozenset(plan.value for plan in TenantPlan)
+_STATUS_VALUES = frozenset(status.value for status in TenantStatus)
+_ROLE_VALUES = frozenset(role.value for role in TenantRole)
+_METRICS = ['events', 'participants', 'storage', 'admins']
+_METRIC_VALUES = frozenset(_METRICS)
 
 
 # Request/Response Schemas
@@ -43,15 +56,14 @@ class TenantCreateRequest(BaseModel):
     @validator('slug')
     def validate_slug(cls, v):
         """Validate slug format."""
-        import re
-        if not re.match(r'^[a-z0-9-]+$', v):
+        if not _SLUG_RE.match(v):
             raise ValueError('Slug must contain only lowercase letters, numbers, and hyphens')
         return v
     
     @validator('plan')
     def validate_plan(cls, v):
         """Validate subscription plan."""
-        if v not in [plan.value for plan in TenantPlan]:
+        if v not in _PLAN_VALUES:
             raise ValueError(f'Plan must be one of: {[plan.value for plan in TenantPlan]}')
         return v
 
@@ -73,14 +85,14 @@ class TenantUpdateRequest(BaseModel):
     @validator('plan')
     def validate_plan(cls, v):
         """Validate subscription plan."""
-        if v and v not in [plan.value for plan in TenantPlan]:
+        if v and v not in _PLAN_VALUES:
             raise ValueError(f'Plan must be one of: {[plan.value for plan in TenantPlan]}')
         return v
     
     @validator('status')
     def validate_status(cls, v):
         """Validate tenant status."""
-        if v and v not in [status.value for status in TenantStatus]:
+        if v and v not in _STATUS_VALUES:
             raise ValueError(f'Status must be one of: {[status.value for status in TenantStatus]}')
         return v
 
@@ -120,8 +132,7 @@ class TenantResponse(BaseModel):
     subscription_ends_at: Optional[datetime]
     trial_ends_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TenantSummaryResponse(BaseModel):
@@ -136,8 +147,7 @@ class TenantSummaryResponse(BaseModel):
     usage_percentage: float
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TenantUserRequest(BaseModel):
@@ -149,8 +159,7 @@ class TenantUserRequest(BaseModel):
     @validator('role')
     def validate_role(cls, v):
         """Validate tenant role."""
-        from app.core.rbac import TenantRole
-        if v not in [role.value for role in TenantRole]:
+        if v not in _ROLE_VALUES:
             raise ValueError(f'Role must be one of: {[role.value for role in TenantRole]}')
         return v
 
@@ -169,8 +178,7 @@ class TenantUserResponse(BaseModel):
     user_email: Optional[str]
     user_name: Optional[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UsageTrackingRequest(BaseModel):
@@ -181,9 +189,8 @@ class UsageTrackingRequest(BaseModel):
     @validator('metric')
     def validate_metric(cls, v):
         """Validate metric type."""
-        valid_metrics = ['events', 'participants', 'storage', 'admins']
-        if v not in valid_metrics:
-            raise ValueError(f'Metric must be one of: {valid_metrics}')
+        if v not in _METRIC_VALUES:
+            raise ValueError(f'Metric must be one of: {_METRICS}')
         return v
 
 
@@ -197,12 +204,52 @@ class UsageStatsResponse(BaseModel):
     trial_ends_at: Optional[str]
 
 
+# Concrete response envelopes, parameterized once at import
+TenantEnvelope = BaseResponse[TenantResponse]
+TenantListResponse = PaginatedResponse[TenantSummaryResponse]
+TenantUserEnvelope = BaseResponse[TenantUserResponse]
+TenantUserListEnvelope = BaseResponse[List[TenantUserResponse]]
+UsageStatsEnvelope = BaseResponse[UsageStatsResponse]
+BoolEnvelope = BaseResponse[bool]
+
+
+def fast_tenant_response(tenant: Tenant) -> TenantResponse:
+    """Build a TenantResponse from a trusted ORM row without revalidating it."""
+    return TenantResponse.model_construct(
+        **{name: getattr(tenant, name) for name in TenantResponse.model_fields}
+    )
+
+
+def fast_tenant_user_response(tenant_user: TenantUser) -> TenantUserResponse:
+    """Build a TenantUserResponse from a trusted ORM row without revalidating it."""
+    return TenantUserResponse.model_construct(
+        **{name: getattr(tenant_user, name, None) for name in TenantUserResponse.model_fields}
+    )
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak validator derived from the values that identify a representation."""
+    digest = hashlib.blake2b(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS), digest_size=8)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Tag the response, or return a bodiless 304 if the client already holds this version."""
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
 # API Endpoints
 
-@router.post("/", response_model=BaseResponse[TenantResponse])
+@router.post("/", response_model=TenantEnvelope)
 async def create_tenant(
     request: TenantCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -211,42 +258,33 @@ async def create_tenant(
     Creates a new tenant with the specified configuration and adds the
     current user as the tenant owner.
     """
-    try:
-        tenant = await tenant_service.create_tenant(
-            db=db,
-            creator_user_id=current_user.id,
-            name=request.name,
-            slug=request.slug,
-            contact_email=request.contact_email,
-            plan=request.plan,
-            organization_type=request.organization_type,
-            website_url=request.website_url,
-            custom_settings=request.custom_settings
-        )
-        
-        return BaseResponse(
-            success=True,
-            message="Tenant created successfully",
-            data=TenantResponse.from_orm(tenant)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create tenant: {str(e)}"
-        )
+    tenant = await tenant_service.create_tenant(
+        db=db,
+        creator_user_id=current_user.id,
+        name=request.name,
+        slug=request.slug,
+        contact_email=request.contact_email,
+        plan=request.plan,
+        organization_type=request.organization_type,
+        website_url=request.website_url,
+        custom_settings=request.custom_settings
+    )
+    
+    return TenantEnvelope(
+        success=True,
+        message="Tenant created successfully",
+        data=fast_tenant_response(tenant)
+    )
 
 
-@router.get("/", response_model=PaginatedResponse[TenantSummaryResponse])
+@router.get("/", response_model=TenantListResponse)
 async def list_tenants(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     status_filter: Optional[str] = Query(None, description="Filter by tenant status"),
     plan_filter: Optional[str] = Query(None, description="Filter by subscription plan"),
     search: Optional[str] = Query(None, description="Search in name, slug, or contact_email"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -255,68 +293,45 @@ async def list_tenants(
     Returns a paginated list of tenants. System administrators can see all tenants,
     while regular users only see tenants they belong to.
     """
-    try:
-        # Check if user is system admin
-        rbac_manager = RBACManager()
-        is_system_admin = await rbac_manager.check_system_permission(
-            current_user.id, Permission.MANAGE_TENANTS
-        )
-        
-        if is_system_admin:
-            # System admin can see all tenants
-            tenants = await tenant_service.list_tenants(
-                db=db,
-                skip=skip,
-                limit=limit,
-                status_filter=status_filter,
-                plan_filter=plan_filter,
-                search=search
-            )
-        else:
-            # Regular users only see their tenants
-            # TODO: Implement user's tenant filtering
-            tenants = []
-        
-        # Convert to summary responses with usage percentage
-        tenant_summaries = []
-        for tenant in tenants:
-            usage_percentage = 0
-            if tenant.max_events > 0:
-                usage_percentage = (tenant.current_events / tenant.max_events) * 100
-            
-            summary = TenantSummaryResponse(
-                id=tenant.id,
-                name=tenant.name,
-                slug=tenant.slug,
-                plan=tenant.plan,
-                status=tenant.status,
-                current_events=tenant.current_events,
-                max_events=tenant.max_events,
-                usage_percentage=round(usage_percentage, 2),
-                created_at=tenant.created_at
-            )
-            tenant_summaries.append(summary)
-        
-        return PaginatedResponse(
-            success=True,
-            message="Tenants retrieved successfully",
-            data=tenant_summaries,
-            total=len(tenants),  # TODO: Get actual total count
-            page=skip // limit + 1,
-            page_size=limit
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list tenants: {str(e)}"
-        )
+    # Check if user is system admin; role permissions are memoized, so this does no I/O
+    is_system_admin = rbac_manager.has_system_permission(
+        current_user.system_role, Permission.TENANT_UPDATE
+    )
+    
+    if is_system_admin:
+        # System admin can see all tenants
+        tenants, total = await tenant_service.list_tenants(
+            db=db,
+            skip=skip,
+            limit=limit,
+            status_filter=status_filter,
+            plan_filter=plan_filter,
+            search=search
+        )
+    else:
+        # Regular users only see their tenants
+        # TODO: Implement user's tenant filtering
+        tenants, total = [], 0
+    
+    # Rows already carry exactly the summary columns, usage percentage included
+    tenant_summaries = [TenantSummaryResponse.model_construct(**row) for row in tenants]
+    
+    return TenantListResponse(
+        success=True,
+        message="Tenants retrieved successfully",
+        data=tenant_summaries,
+        total=total,
+        page=skip // limit + 1,
+        page_size=limit
+    )
 
 
-@router.get("/{tenant_id}", response_model=BaseResponse[TenantResponse])
+@router.get("/{tenant_id}", response_model=TenantEnvelope)
 async def get_tenant(
     tenant_id: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -325,7 +340,10 @@ async def get_tenant(
     Returns detailed information about a specific tenant.
     Users must have access to the tenant to view its details.
     """
-    try:
+    # TODO: Check user access to tenant
+    
+    data = await tenant_cache.get_tenant(tenant_id)
+    if data is None:
         tenant = await tenant_service.get_tenant(db, tenant_id)
         if not tenant:
             raise HTTPException(
@@ -333,27 +351,28 @@ async def get_tenant(
                 detail="Tenant not found"
             )
         
-        # TODO: Check user access to tenant
-        
-        return BaseResponse(
-            success=True,
-            message="Tenant retrieved successfully",
-            data=TenantResponse.from_orm(tenant)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get tenant: {str(e)}"
-        )
+        data = fast_tenant_response(tenant).model_dump(mode="json")
+        await tenant_cache.set_tenant(data)
+    
+    # Polling clients get a 304 until the tenant row changes
+    etag = weak_etag(data["id"], data["updated_at"] or data["created_at"])
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    
+    return TenantEnvelope(
+        success=True,
+        message="Tenant retrieved successfully",
+        data=data
+    )
 
 
-@router.get("/slug/{slug}", response_model=BaseResponse[TenantResponse])
+@router.get("/slug/{slug}", response_model=TenantEnvelope)
 async def get_tenant_by_slug(
     slug: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -362,7 +381,10 @@ async def get_tenant_by_slug(
     Returns detailed information about a specific tenant identified by its slug.
     Users must have access to the tenant to view its details.
     """
-    try:
+    # TODO: Check user access to tenant
+    
+    data = await tenant_cache.get_tenant_by_slug(slug)
+    if data is None:
         tenant = await tenant_service.get_tenant_by_slug(db, slug)
         if not tenant:
             raise HTTPException(
@@ -370,28 +392,27 @@ async def get_tenant_by_slug(
                 detail="Tenant not found"
             )
         
-        # TODO: Check user access to tenant
-        
-        return BaseResponse(
-            success=True,
-            message="Tenant retrieved successfully",
-            data=TenantResponse.from_orm(tenant)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get tenant: {str(e)}"
-        )
+        data = fast_tenant_response(tenant).model_dump(mode="json")
+        await tenant_cache.set_tenant(data)
+    
+    # Polling clients get a 304 until the tenant row changes
+    etag = weak_etag(data["id"], data["updated_at"] or data["created_at"])
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    
+    return TenantEnvelope(
+        success=True,
+        message="Tenant retrieved successfully",
+        data=data
+    )
 
 
-@router.put("/{tenant_id}", response_model=BaseResponse[TenantResponse])
+@router.put("/{tenant_id}", response_model=TenantEnvelope)
 async def update_tenant(
     tenant_id: UUID,
     request: TenantUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -400,72 +421,59 @@ async def update_tenant(
     Updates the specified tenant's configuration.
     Users must have admin access to the tenant to update it.
     """
-    try:
-        # TODO: Check user permissions for tenant admin
-        
-        # Convert request to dict, excluding None values
-        update_data = request.dict(exclude_unset=True, exclude_none=True)
-        
-        tenant = await tenant_service.update_tenant(
-            db=db,
-            tenant_id=tenant_id,
-            update_data=update_data
-        )
-        
-        return BaseResponse(
-            success=True,
-            message="Tenant updated successfully",
-            data=TenantResponse.from_orm(tenant)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update tenant: {str(e)}"
-        )
+    # TODO: Check user permissions for tenant admin
+    
+    # Fields the client actually sent, dropping explicit nulls in the same pass
+    update_data = {
+        field: value
+        for field, value in request.model_dump(exclude_unset=True).items()
+        if value is not None
+    }
+    
+    tenant = await tenant_service.update_tenant(
+        db=db,
+        tenant_id=tenant_id,
+        update_data=update_data
+    )
+    
+    return TenantEnvelope(
+        success=True,
+        message="Tenant updated successfully",
+        data=fast_tenant_response(tenant)
+    )
 
 
-@router.delete("/{tenant_id}", response_model=BaseResponse[bool])
+@router.delete("/{tenant_id}", response_model=BoolEnvelope, status_code=status.HTTP_202_ACCEPTED)
 async def delete_tenant(
     tenant_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Delete a tenant.
     
-    Soft deletes the specified tenant and all associated data.
+    Schedules soft deletion of the specified tenant and all associated data;
+    the cascade runs in a background worker.
     Only tenant owners and system administrators can delete tenants.
     """
-    try:
-        # TODO: Check user permissions for tenant deletion
-        
-        success = await tenant_service.delete_tenant(db, tenant_id)
-        
-        return BaseResponse(
-            success=success,
-            message="Tenant deleted successfully" if success else "Failed to delete tenant",
-            data=success
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete tenant: {str(e)}"
-        )
+    # TODO: Check user permissions for tenant deletion
+    
+    success = await tenant_service.delete_tenant(db, tenant_id)
+    
+    return BoolEnvelope(
+        success=success,
+        message="Deletion scheduled" if success else "Failed to delete tenant",
+        data=success
+    )
 
 
 # Tenant User Management Endpoints
 
-@router.post("/{tenant_id}/users", response_model=BaseResponse[TenantUserResponse])
+@router.post("/{tenant_id}/users", response_model=TenantUserEnvelope)
 async def add_tenant_user(
     tenant_id: UUID,
     request: TenantUserRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -474,39 +482,30 @@ async def add_tenant_user(
     Adds the specified user to the tenant with the given role.
     Users must have admin access to the tenant to add new users.
     """
-    try:
-        # TODO: Check user permissions for tenant admin
-        
-        tenant_user = await tenant_service.add_tenant_user(
-            db=db,
-            tenant_id=tenant_id,
-            user_id=request.user_id,
-            role=request.role,
-            invited_by_user_id=current_user.id,
-            permissions=request.permissions
-        )
-        
-        return BaseResponse(
-            success=True,
-            message="User added to tenant successfully",
-            data=TenantUserResponse.from_orm(tenant_user)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add user to tenant: {str(e)}"
-        )
+    # TODO: Check user permissions for tenant admin
+    
+    tenant_user = await tenant_service.add_tenant_user(
+        db=db,
+        tenant_id=tenant_id,
+        user_id=request.user_id,
+        role=request.role,
+        invited_by_user_id=current_user.id,
+        permissions=request.permissions
+    )
+    
+    return TenantUserEnvelope(
+        success=True,
+        message="User added to tenant successfully",
+        data=fast_tenant_user_response(tenant_user)
+    )
 
 
-@router.get("/{tenant_id}/users", response_model=BaseResponse[List[TenantUserResponse]])
+@router.get("/{tenant_id}/users", response_model=TenantUserListEnvelope)
 async def get_tenant_users(
     tenant_id: UUID,
     role_filter: Optional[str] = Query(None, description="Filter by user role"),
     active_only: bool = Query(True, description="Only return active users"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -515,37 +514,33 @@ async def get_tenant_users(
     Returns a list of all users associated with the tenant.
     Users must have access to the tenant to view its user list.
     """
-    try:
-        # TODO: Check user access to tenant
-        
-        tenant_users = await tenant_service.get_tenant_users(
+    # TODO: Check user access to tenant
+    
+    data = await tenant_cache.get_users(tenant_id, role_filter, active_only)
+    if data is None:
+        rows = await tenant_service.get_tenant_user_details(
             db=db,
             tenant_id=tenant_id,
             role_filter=role_filter,
             active_only=active_only
         )
         
-        return BaseResponse(
-            success=True,
-            message="Tenant users retrieved successfully",
-            data=[TenantUserResponse.from_orm(tu) for tu in tenant_users]
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get tenant users: {str(e)}"
-        )
+        data = [TenantUserResponse.model_construct(**row).model_dump(mode="json") for row in rows]
+        await tenant_cache.set_users(tenant_id, role_filter, active_only, data)
+    
+    return TenantUserListEnvelope(
+        success=True,
+        message="Tenant users retrieved successfully",
+        data=data
+    )
 
 
-@router.put("/{tenant_id}/users/{user_id}", response_model=BaseResponse[TenantUserResponse])
+@router.put("/{tenant_id}/users/{user_id}", response_model=TenantUserEnvelope)
 async def update_tenant_user_role(
     tenant_id: UUID,
     user_id: UUID,
     request: TenantUserRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -554,37 +549,28 @@ async def update_tenant_user_role(
     Updates the role and permissions for the specified user in the tenant.
     Users must have admin access to the tenant to update user roles.
     """
-    try:
-        # TODO: Check user permissions for tenant admin
-        
-        tenant_user = await tenant_service.update_tenant_user_role(
-            db=db,
-            tenant_id=tenant_id,
-            user_id=user_id,
-            new_role=request.role,
-            permissions=request.permissions
-        )
-        
-        return BaseResponse(
-            success=True,
-            message="Tenant user role updated successfully",
-            data=TenantUserResponse.from_orm(tenant_user)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update tenant user role: {str(e)}"
-        )
+    # TODO: Check user permissions for tenant admin
+    
+    tenant_user = await tenant_service.update_tenant_user_role(
+        db=db,
+        tenant_id=tenant_id,
+        user_id=user_id,
+        new_role=request.role,
+        permissions=request.permissions
+    )
+    
+    return TenantUserEnvelope(
+        success=True,
+        message="Tenant user role updated successfully",
+        data=fast_tenant_user_response(tenant_user)
+    )
 
 
-@router.delete("/{tenant_id}/users/{user_id}", response_model=BaseResponse[bool])
+@router.delete("/{tenant_id}/users/{user_id}", response_model=BoolEnvelope)
 async def remove_tenant_user(
     tenant_id: UUID,
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -593,37 +579,28 @@ async def remove_tenant_user(
     Removes the specified user from the tenant.
     Users must have admin access to the tenant to remove users.
     """
-    try:
-        # TODO: Check user permissions for tenant admin
-        
-        success = await tenant_service.remove_tenant_user(
-            db=db,
-            tenant_id=tenant_id,
-            user_id=user_id
-        )
-        
-        return BaseResponse(
-            success=success,
-            message="User removed from tenant successfully" if success else "Failed to remove user from tenant",
-            data=success
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to remove user from tenant: {str(e)}"
-        )
+    # TODO: Check user permissions for tenant admin
+    
+    success = await tenant_service.remove_tenant_user(
+        db=db,
+        tenant_id=tenant_id,
+        user_id=user_id
+    )
+    
+    return BoolEnvelope(
+        success=success,
+        message="User removed from tenant successfully" if success else "Failed to remove user from tenant",
+        data=success
+    )
 
 
 # Usage Tracking and Billing Endpoints
 
-@router.post("/{tenant_id}/usage", response_model=BaseResponse[bool])
+@router.post("/{tenant_id}/usage", response_model=BoolEnvelope)
 async def track_usage(
     tenant_id: UUID,
     request: UsageTrackingRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -632,58 +609,54 @@ async def track_usage(
     Records usage for the specified metric and checks against tenant limits.
     This endpoint is typically called by internal services.
     """
-    try:
-        # TODO: Check if this should be restricted to internal services
-        
-        success = await tenant_service.track_usage(
-            db=db,
-            tenant_id=tenant_id,
-            metric=request.metric,
-            amount=request.amount
-        )
-        
-        return BaseResponse(
-            success=success,
-            message=f"Usage tracked successfully for {request.metric}",
-            data=success
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to track usage: {str(e)}"
-        )
+    # TODO: Check if this should be restricted to internal services
+    
+    success = await tenant_service.track_usage(
+        db=db,
+        tenant_id=tenant_id,
+        metric=request.metric,
+        amount=request.amount
+    )
+    
+    return BoolEnvelope(
+        success=success,
+        message=f"Usage tracked successfully for {request.metric}",
+        data=success
+    )
 
 
-@router.get("/{tenant_id}/usage", response_model=BaseResponse[UsageStatsResponse])
+@router.get("/{tenant_id}/usage", response_model=UsageStatsEnvelope)
 async def get_usage_stats(
     tenant_id: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get usage statistics for a tenant.
     
     Returns detailed usage statistics including current usage,
-    limits, and percentage utilization for all metrics.
+    limits, and percentage utilization for all metrics. Served
+    stale-while-revalidate; the X-Cache header reports which path was used.
     """
-    try:
-        # TODO: Check user access to tenant
-        
-        stats = await tenant_service.get_usage_stats(db, tenant_id)
-        
-        return BaseResponse(
-            success=True,
-            message="Usage statistics retrieved successfully",
-            data=UsageStatsResponse(**stats)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get usage statistics: {str(e)}"
-        )
+    # TODO: Check user access to tenant
+    
+    # Keyed per user so a cached entry never outlives that user's access check
+    stats = await swr_cache.get(
+        tenant_cache.usage_key(tenant_id, current_user.id),
+        db,
+        lambda session: tenant_service.get_usage_stats(session, tenant_id),
+        response
+    )
+    
+    # Usage has no version column, so the validator is taken from the stats themselves
+    cached = not_modified(request, response, weak_etag(stats))
+    if cached is not None:
+        return cached
+    
+    return UsageStatsEnvelope(
+        success=True,
+        message="Usage statistics retrieved successfully",
+        data=UsageStatsResponse(**stats)
+    )
@@ -9,115 +9,211 @@ This module provides:
 """
 
 import jwt
+import hmac
+import time
+import orjson
 import secrets
 import hashlib
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, Union
-from uuid import UUID
+from typing import Optional, Dict, Any, Iterable, Union
 
-from fastapi import HTTPException, status
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, HTTPException, status
 from passlib.context import CryptContext
+from redis.exceptions import RedisError
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from app.core.config import settings
-# from app.core.redis_client import session_store  # Temporarily disabled due to aioredis issues
+from app.core.redis import redis_manager
+from app.core.database_utils import db_manager
 from app.models.user import User, UserSession
 
 
-# Mock session store for development (replace with Redis later)
-class MockSessionStore:
-    """Mock session store for development without Redis."""
+class RedisSessionStore:
+    """Revoked refresh token registry shared by every worker through Redis."""
     
     def __init__(self):
-        self._sessions = {}
-        self._user_sessions = {}
-        self._blacklist = set()
+        self.blacklist_prefix = "blacklist:"
+        # blake2b keys are capped at 64 bytes, so key with a digest of the app secret
+        self._digest_key = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+        # Process-local fallback used only while Redis is unavailable: jti digest -> revoked-until
+        # timestamp. Other workers never see these entries and they are not replayed to Redis.
+        self._local_blacklist = TTLCache(maxsize=100_000, ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400)
     
-    async def store_session(self, session_id: str, session_data: dict, expire_seconds: int) -> bool:
-        self._sessions[session_id] = session_data
-        return True
-    
-    async def get_session(self, session_id: str) -> dict:
-        return self._sessions.get(session_id)
+    def _digest(self, jti: str) -> bytes:
+        """Keyed fixed-size form of a jti; lookups can only leak timing about this digest, never the token id."""
+        return hashlib.blake2b(jti.encode(), key=self._digest_key, digest_size=16).digest()
     
-    async def add_user_session(self, user_id: int, session_id: str) -> bool:
-        if user_id not in self._user_sessions:
-            self._user_sessions[user_id] = set()
-        self._user_sessions[user_id].add(session_id)
-        return True
+    def _key(self, digest: bytes) -> str:
+        """Redis key for a revoked jti digest."""
+        return f"{self.blacklist_prefix}{digest.hex()}"
     
-    async def get_user_sessions(self, user_id: int) -> set:
-        return self._user_sessions.get(user_id, set())
+    async def is_token_blacklisted(self, jti: str) -> bool:
+        """Check whether a refresh token has been revoked."""
+        digest = self._digest(jti)
+        if self._local_blacklist.get(digest, 0) > time.time():
+            return True
+        
+        redis = redis_manager.redis_client
+        if not redis:
+            return False
+        
+        try:
+            return await redis.exists(self._key(digest)) > 0
+        except RedisError:
+            return False
     
-    async def is_token_blacklisted(self, token: str) -> bool:
-        return token in self._blacklist
+    async def blacklist_token(self, jti: str, expire_seconds: int) -> bool:
+        """Revoke a refresh token until it would have expired anyway."""
+        return await self.blacklist_tokens([jti], expire_seconds)
     
-    async def blacklist_token(self, token: str, expire_seconds: int) -> bool:
-        self._blacklist.add(token)
+    async def blacklist_tokens(self, jtis: Iterable[str], expire_seconds: int) -> bool:
+        """Revoke several refresh tokens in one round trip."""
+        digests = [self._digest(jti) for jti in jtis]
+        if not digests:
+            return True
+        
+        redis = redis_manager.redis_client
+        if redis:
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for digest in digests:
+                        pipe.setex(self._key(digest), expire_seconds, 1)
+                    await pipe.execute()
+                return True
+            except RedisError:
+                pass
+        
+        revoked_until = time.time() + expire_seconds
+        for digest in digests:
+            self._local_blacklist[digest] = revoked_until
         return True
-    
-    async def cleanup_user_sessions(self, user_id: int) -> int:
-        if user_id in self._user_sessions:
-            count = len(self._user_sessions[user_id])
-            del self._user_sessions[user_id]
-            return count
-        return 0
 
 
-session_store = MockSessionStore()
+session_store = RedisSessionStore()
+
+# Password hashing context; bcrypt work factor applies to user passwords only
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__ident="2b"
+)
+
+
+def hash_session_token(token: str) -> str:
+    """Keyed hash for high-entropy session/refresh tokens (no bcrypt needed)."""
+    return hmac.new(settings.SECRET_KEY.encode(), token.encode(), hashlib.sha256).hexdigest()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 class TokenManager:
     """Manages JWT tokens and refresh tokens."""
     
+    # Fixed attribute layout: a process-wide singleton on every authenticated request
+    __slots__ = (
+        "algorithm",
+        "secret_key",
+        "access_token_expire_minutes",
+        "refresh_token_expire_days",
+        "_access_td",
+        "_refresh_td",
+        "_algs",
+        "_decode_options",
+        "_jws",
+        "_verified_cache",
+        "_cache_lock",
+    )
+    
     def __init__(self):
         self.algorithm = settings.ALGORITHM
         self.secret_key = settings.SECRET_KEY
         self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = settings.REFRESH_TOKEN_EXPIRE_DAYS
+        self._access_td = timedelta(minutes=self.access_token_expire_minutes)
+        self._refresh_td = timedelta(days=self.refresh_token_expire_days)
+        
+        # Built once for every decode; our tokens carry no audience or issuer to check
+        self._algs = (self.algorithm,)
+        self._decode_options = {
+            "require": ["exp", "iat", "type", "sub"],
+            "verify_aud": False,
+            "verify_iss": False,
+        }
+        
+        # Dedicated signer limited to the configured algorithm
+        self._jws = jwt.PyJWS(algorithms=[self.algorithm])
+        
+        # Recently verified token digests -> decoded payload; the short TTL bounds staleness
+        self._verified_cache = TTLCache(maxsize=50_000, ttl=30)
+        self._cache_lock = threading.Lock()
+    
+    def _encode(self, claims: Dict[str, Any]) -> str:
+        """Sign claims, serializing them with orjson instead of PyJWT's stdlib json pass."""
+        # JWT NumericDate: whole seconds since the epoch, as PyJWT itself would emit
+        for claim in ("exp", "iat"):
+            if isinstance(claims.get(claim), datetime):
+                claims[claim] = int(claims[claim].timestamp())
+        return self._jws.encode(orjson.dumps(claims), self.secret_key, algorithm=self.algorithm)
     
     def create_access_token(self, user_id: Union[int, str], expires_delta: Optional[timedelta] = None) -> str:
         """Create a new access token."""
         data = {"sub": str(user_id)}
         to_encode = data.copy()
+        now = datetime.now(timezone.utc)
         
         if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.now(timezone.utc) + timedelta(minutes=self.access_token_expire_minutes)
+            expire = now + self._access_td
         
         to_encode.update({
             "exp": expire,
-            "iat": datetime.now(timezone.utc),
+            "iat": now,
             "type": "access"
         })
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
     
     def create_refresh_token(self, user_id: Union[int, str]) -> str:
         """Create a new refresh token."""
         data = {"sub": str(user_id)}
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days)
+        now = datetime.now(timezone.utc)
+        expire = now + self._refresh_td
         
         to_encode.update({
             "exp": expire,
-            "iat": datetime.now(timezone.utc),
+            "iat": now,
             "type": "refresh",
             "jti": secrets.token_urlsafe(32)  # Unique identifier for token revocation
         })
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
+    
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        """Fixed-size cache key, so the cache never holds whole JWTs."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
     
     def verify_token(self, token: str, token_type: str = "access") -> Dict[str, Any]:
         """Verify and decode a JWT token."""
+        key = self._cache_key(token)
+        with self._cache_lock:
+            payload = self._verified_cache.get(key)
+        
+        # Never serve a cached payload past its own expiry
+        if payload is not None and payload.get("exp", 0) <= time.time():
+            with self._cache_lock:
+                self._verified_cache.pop(key, None)
+            payload = None
+        
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            if payload is None:
+                payload = jwt.decode(token, self.secret_key, algorithms=self._algs, options=self._decode_options)
+                with self._cache_lock:
+                    self._verified_cache[key] = payload
             
             # Verify token type
             if payload.get("type") != token_type:
@@ -139,6 +235,11 @@ class TokenManager:
                 detail="Invalid token"
             )
     
+    def evict_cached_token(self, token: str) -> None:
+        """Drop a token from the verification cache (e.g. on logout)."""
+        with self._cache_lock:
+            self._verified_cache.pop(self._cache_key(token), None)
+    
     def extract_user_data(self, token: str) -> Dict[str, Any]:
         """Extract user data from access token."""
         payload = self.verify_token(token, "access")
@@ -180,10 +281,46 @@ class PasswordManager:
         return secrets.token_urlsafe(32)
 
 class SessionManager:
-    """Manages user sessions with Redis storage."""
+    """Manages user sessions with Redis storage.
+    
+    A Redis error is handled like Redis being disconnected: session lookups fail open
+    and revocations fall back to the session store's local blacklist.
+    """
     
     def __init__(self):
-        self.session_ttl = 60 * 60 * 24 * 7  # 7 days
+        self.session_ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+        self.session_key_prefix = "session:"
+        self.user_sessions_key_prefix = "user_sessions:"
+    
+    @staticmethod
+    def hash_token(refresh_token: str) -> str:
+        """Derive the storage key for a refresh token."""
+        return hash_session_token(refresh_token)
+    
+    @staticmethod
+    def token_jti(refresh_token: str) -> str:
+        """Revocation id of a refresh token; callers verify the signature separately."""
+        return jwt.decode(refresh_token, options={"verify_signature": False}).get("jti") or refresh_token
+    
+    async def _store_session(self, user_id: Any, token_hash: str, session_data: dict) -> None:
+        """Write a session record and index it under its user."""
+        redis = redis_manager.redis_client
+        if not redis:
+            return
+        
+        user_key = f"{self.user_sessions_key_prefix}{user_id}"
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.setex(
+                    f"{self.session_key_prefix}{token_hash}",
+                    self.session_ttl,
+                    orjson.dumps(session_data)
+                )
+                pipe.sadd(user_key, token_hash)
+                pipe.expire(user_key, self.session_ttl)
+                await pipe.execute()
+        except RedisError:
+            pass
     
     async def create_session(
         self, 
@@ -191,99 +328,151 @@ class SessionManager:
         refresh_token: str,
         user_agent: Optional[str] = None,
         ip_address: Optional[str] = None,
-        db: Optional[Session] = None
+        db: Optional[AsyncSession] = None,
+        background: Optional[BackgroundTasks] = None
     ) -> UserSession:
         """Create a new user session."""
-        # Generate session ID
-        session_id = secrets.token_urlsafe(32)
+        token_hash = self.hash_token(refresh_token)
+        now = datetime.now(timezone.utc)
         
         # Calculate expiration
-        expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        expires_at = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
         
-        # Create session record in database
+        # Append-only audit record; never read on the token validation path
         session = UserSession(
-            id=session_id,
             user_id=user_id,
+            session_token=token_hash,
             refresh_token=refresh_token,
             expires_at=expires_at,
             user_agent=user_agent,
             ip_address=ip_address,
-            last_accessed=datetime.now(timezone.utc),
+            last_accessed=now,
             is_active=True
         )
         
-        if db:
-            db.add(session)
-            db.commit()
-            db.refresh(session)
-        
-        # Store in Redis for fast lookup
+        # Redis is the source of truth for refresh token validity, so write it before responding
         session_data = {
-            "user_id": user_id,
-            "refresh_token": refresh_token,
-            "expires_at": expires_at.isoformat(),
+            "user_id": str(user_id),
             "user_agent": user_agent or "",
             "ip_address": ip_address or "",
-            "is_active": True,
-            "last_accessed": datetime.now(timezone.utc).isoformat()
+            "created": now.isoformat()
         }
         
-        await session_store.store_session(session_id, session_data, self.session_ttl)
-        await session_store.add_user_session(user_id, session_id)
+        await self._store_session(user_id, token_hash, session_data)
+        
+        if background is not None:
+            background.add_task(self.persist_session, session)
+        elif db:
+            db.add(session)
+            await db.commit()
+            await db.refresh(session)
         
         return session
     
-    async def get_session(self, session_id: str) -> Optional[dict]:
+    async def persist_session(self, session: UserSession) -> None:
+        """Write a session audit row using its own database session."""
+        async with db_manager.get_session() as db:
+            db.add(session)
+            await db.commit()
+    
+    async def get_session(self, refresh_token: str) -> Optional[dict]:
         """Get session data."""
-        return await session_store.get_session(session_id)
+        redis = redis_manager.redis_client
+        if not redis:
+            return None
+        
+        try:
+            value = await redis.get(f"{self.session_key_prefix}{self.hash_token(refresh_token)}")
+        except RedisError:
+            return None
+        
+        return orjson.loads(value) if value else None
     
     async def is_token_valid(self, refresh_token: str) -> bool:
         """Check if refresh token is valid and not blacklisted."""
         # Check if token is blacklisted
-        if await session_store.is_token_blacklisted(refresh_token):
+        if await session_store.is_token_blacklisted(self.token_jti(refresh_token)):
             return False
         
-        # Check if session exists (this validates the token indirectly)
-        user_sessions = await session_store.get_user_sessions(0)  # This needs user_id
-        # For now, we'll just check if it's not blacklisted
-        return True
+        redis = redis_manager.redis_client
+        if not redis:
+            return True
+        
+        try:
+            return await redis.exists(
+                f"{self.session_key_prefix}{self.hash_token(refresh_token)}"
+            ) > 0
+        except RedisError:
+            return True
     
     async def invalidate_session(self, refresh_token: str) -> bool:
         """Invalidate a specific session."""
-        # Add token to blacklist
-        expire_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
-        return await session_store.blacklist_token(refresh_token, expire_seconds)
+        return await self._invalidate_session(
+            refresh_token, self.hash_token(refresh_token), await self.get_session(refresh_token)
+        )
     
-    async def invalidate_user_sessions(self, user_id: int, db: Optional[Session] = None) -> int:
-        """Invalidate all sessions for a user."""
-        # Get all user sessions from Redis
-        session_ids = await session_store.get_user_sessions(user_id)
+    async def _invalidate_session(self, refresh_token: str, token_hash: str, session_data: Optional[dict]) -> bool:
+        """Drop an already loaded session and blacklist its refresh token."""
+        redis = redis_manager.redis_client
+        if redis:
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    pipe.delete(f"{self.session_key_prefix}{token_hash}")
+                    if session_data:
+                        pipe.srem(
+                            f"{self.user_sessions_key_prefix}{session_data['user_id']}",
+                            token_hash
+                        )
+                    await pipe.execute()
+            except RedisError:
+                pass
         
+        # Add token to blacklist until it would have expired anyway
+        return await session_store.blacklist_token(self.token_jti(refresh_token), self.session_ttl)
+    
+    async def invalidate_user_sessions(
+        self,
+        user_id: int,
+        db: Optional[AsyncSession] = None
+    ) -> int:
+        """Invalidate all sessions for a user."""
         count = 0
-        for session_id in session_ids:
-            session_data = await session_store.get_session(session_id)
-            if session_data and session_data.get("refresh_token"):
-                # Blacklist the refresh token
-                refresh_token = session_data["refresh_token"]
-                expire_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
-                await session_store.blacklist_token(refresh_token, expire_seconds)
-                count += 1
-        
-        # Clean up session data
-        await session_store.cleanup_user_sessions(user_id)
-        
-        # Update database if provided
+        
+        # Drop every session indexed under the user
+        redis = redis_manager.redis_client
+        if redis:
+            user_key = f"{self.user_sessions_key_prefix}{user_id}"
+            try:
+                token_hashes = await redis.smembers(user_key)
+                count = len(token_hashes)
+                
+                # One round trip regardless of how many devices the user has
+                async with redis.pipeline(transaction=False) as pipe:
+                    if token_hashes:
+                        pipe.delete(*(f"{self.session_key_prefix}{h}" for h in token_hashes))
+                    pipe.delete(user_key)
+                    await pipe.execute()
+            except RedisError:
+                pass
+        
+        # Update database if provided; one statement deactivates every row and hands back its token
         if db:
-            sessions = db.query(UserSession).filter(
-                UserSession.user_id == user_id,
-                UserSession.is_active == True
-            ).all()
-            
-            for session in sessions:
-                session.is_active = False
-                session.revoked_at = datetime.now(timezone.utc)
+            result = await db.execute(
+                update(UserSession)
+                .where(UserSession.user_id == user_id)
+                .where(UserSession.is_active == True)
+                .values(is_active=False, revoked_at=func.now())
+                .returning(UserSession.refresh_token)
+            )
+            refresh_tokens = result.scalars().all()
+            await db.commit()
             
-            db.commit()
+            # Blacklist the tokens too, so they stay revoked even if a session key outlives this call
+            await session_store.blacklist_tokens(
+                (self.token_jti(refresh_token) for refresh_token in refresh_tokens),
+                self.session_ttl
+            )
+            count = max(count, len(refresh_tokens))
         
         return count
     
@@ -291,113 +480,33 @@ class SessionManager:
         self, 
         old_token: str, 
         new_token: str, 
-        db: Optional[Session] = None
+        db: Optional[AsyncSession] = None
     ) -> bool:
         """Update session with new refresh token."""
-        # Blacklist old token
-        await self.invalidate_session(old_token)
-        
-        # The new session will be created separately
-        return True
-        from sqlalchemy import select
-        result = await db.execute(
-            select(UserSession)
-            .where(UserSession.session_token == session_token)
-            .where(UserSession.is_active == True)
-            .where(UserSession.expires_at > datetime.now(timezone.utc))
-        )
-        session = result.scalar_one_or_none()
-        
-        if session:
-            # Update last activity
-            session.last_activity_at = datetime.now(timezone.utc)
-            await db.commit()
-            
-            # Update Redis cache
-            if self.redis:
-                await self.redis.hset(
-                    f"{self.session_prefix}{session_token}",
-                    "last_activity",
-                    datetime.now(timezone.utc).isoformat()
-                )
-        
-        return session
-    
-    async def revoke_session(self, db: AsyncSession, session_token: str) -> bool:
-        """Revoke a specific session."""
-        from sqlalchemy import select, update
-        
-        # Update database
-        result = await db.execute(
-            update(UserSession)
-            .where(UserSession.session_token == session_token)
-            .values(is_active=False, revoked_at=datetime.now(timezone.utc))
-        )
-        
-        success = result.rowcount > 0
-        
-        if success:
-            await db.commit()
-            
-            # Remove from Redis
-            if self.redis:
-                await self.redis.delete(f"{self.session_prefix}{session_token}")
-        
-        return success
-    
-    async def revoke_all_user_sessions(self, db: AsyncSession, user_id: UUID) -> int:
-        """Revoke all sessions for a user."""
-        from sqlalchemy import select, update
+        old_hash = self.hash_token(old_token)
+        session_data = await self.get_session(old_token)
         
-        # Get all active sessions for user
-        result = await db.execute(
-            select(UserSession.session_token)
-            .where(UserSession.user_id == user_id)
-            .where(UserSession.is_active == True)
-        )
-        session_tokens = [row[0] for row in result.fetchall()]
-        
-        # Update database
-        result = await db.execute(
-            update(UserSession)
-            .where(UserSession.user_id == user_id)
-            .where(UserSession.is_active == True)
-            .values(is_active=False, revoked_at=datetime.now(timezone.utc))
-        )
+        # Blacklist old token, reusing the session record loaded above
+        await self._invalidate_session(old_token, old_hash, session_data)
         
-        revoked_count = result.rowcount
+        # Carry the session over to the rotated token
+        new_hash = self.hash_token(new_token)
+        if session_data:
+            await self._store_session(session_data["user_id"], new_hash, session_data)
         
-        if revoked_count > 0:
+        if db:
+            await db.execute(
+                update(UserSession)
+                .where(UserSession.session_token == old_hash)
+                .values(
+                    session_token=new_hash,
+                    refresh_token=new_token,
+                    last_accessed=datetime.now(timezone.utc)
+                )
+            )
             await db.commit()
-            
-            # Remove from Redis
-            if self.redis:
-                for token in session_tokens:
-                    await self.redis.delete(f"{self.session_prefix}{token}")
-        
-        return revoked_count
-    
-    async def is_token_blacklisted(self, token_jti: str) -> bool:
-        """Check if a token is blacklisted."""
-        if not self.redis:
-            return False
         
-        exists = await self.redis.exists(f"{self.blacklist_prefix}{token_jti}")
-        return bool(exists)
-    
-    async def blacklist_token(self, token_jti: str, expires_at: datetime) -> None:
-        """Add a token to the blacklist."""
-        if not self.redis:
-            return
-        
-        # Calculate TTL until token naturally expires
-        ttl = int((expires_at - datetime.now(timezone.utc)).total_seconds())
-        if ttl > 0:
-            await self.redis.setex(
-                f"{self.blacklist_prefix}{token_jti}",
-                ttl,
-                "blacklisted"
-            )
+        return True
 
 # Global instances
 token_manager = TokenManager()
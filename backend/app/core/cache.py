@@ -0,0 +1,342 @@
+"""
+Read-through caches for hot lookups on the authentication path
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import orjson
+from fastapi import Response
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database_utils import db_manager
+from app.core.redis import redis_manager
+from app.models.user import PUBLIC_FIELDS, User
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """Cache-aside store for public user profiles keyed by email and id"""
+
+    # Profile columns only; credentials and account state are always read from the database
+    fields = PUBLIC_FIELDS
+
+    def __init__(self, ttl: int = 60):
+        self.ttl = ttl
+        self.email_prefix = "user:email:"
+        self.id_prefix = "user:id:"
+
+    @property
+    def client(self):
+        """Underlying Redis client, or None when Redis is not connected"""
+        return redis_manager.redis_client
+
+    def serialize(self, user: User) -> Dict[str, Any]:
+        """Convert a user row into the cached dict"""
+        data = {field: getattr(user, field) for field in self.fields}
+        data["id"] = str(data["id"])
+        return data
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read and decode a cached entry, treating Redis errors as a miss"""
+        if not self.client:
+            return None
+
+        try:
+            value = await self.client.get(key)
+        except RedisError:
+            return None
+
+        return orjson.loads(value) if value else None
+
+    async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Get cached user data by email"""
+        return await self._get(f"{self.email_prefix}{email}")
+
+    async def get_user_by_id(self, user_id: Any) -> Optional[Dict[str, Any]]:
+        """Get cached user data by id"""
+        return await self._get(f"{self.id_prefix}{user_id}")
+
+    async def set_user(self, user: User) -> Dict[str, Any]:
+        """Cache a user under both keys and return the cached dict"""
+        data = self.serialize(user)
+        if not self.client:
+            return data
+
+        payload = orjson.dumps(data)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(f"{self.email_prefix}{data['email']}", payload, ex=self.ttl)
+                pipe.set(f"{self.id_prefix}{data['id']}", payload, ex=self.ttl)
+                await pipe.execute()
+        except RedisError:
+            pass
+
+        return data
+
+    async def invalidate(self, user_id: Any, email: str) -> None:
+        """Drop cached entries for a user after it changes"""
+        if not self.client:
+            return
+
+        try:
+            await self.client.delete(f"{self.email_prefix}{email}", f"{self.id_prefix}{user_id}")
+        except RedisError:
+            pass
+
+
+class WizardCache:
+    """Draft event state kept between the steps of the event creation wizard"""
+
+    def __init__(self, ttl: int = 3600):
+        self.ttl = ttl
+        self.prefix = "wizard:"
+
+    @property
+    def client(self):
+        """Underlying Redis client, or None when Redis is not connected"""
+        return redis_manager.redis_client
+
+    def _key(self, tenant_id: Any, event_id: Any) -> str:
+        """Redis key for a tenant's draft event"""
+        return f"{self.prefix}{tenant_id}:{event_id}"
+
+    async def get(self, tenant_id: Any, event_id: Any) -> Optional[Dict[str, Any]]:
+        """Get the cached draft columns, treating Redis errors as a miss"""
+        if not self.client:
+            return None
+        
+        try:
+            value = await self.client.get(self._key(tenant_id, event_id))
+        except RedisError:
+            return None
+        
+        return orjson.loads(value) if value else None
+
+    async def set(self, tenant_id: Any, event_id: Any, data: Dict[str, Any]) -> None:
+        """Cache the draft columns for the next wizard step"""
+        if not self.client:
+            return
+        
+        try:
+            await self.client.set(self._key(tenant_id, event_id), orjson.dumps(data), ex=self.ttl)
+        except RedisError:
+            pass
+
+    async def invalidate(self, tenant_id: Any, event_id: Any) -> None:
+        """Drop the cached draft once the wizard finishes or the event changes elsewhere"""
+        if not self.client:
+            return
+        
+        try:
+            await self.client.delete(self._key(tenant_id, event_id))
+        except RedisError:
+            pass
+
+
+class TenantCache:
+    """Cache-aside store for tenant read endpoints, invalidated per tenant on writes"""
+
+    def __init__(self, ttl: int = 60):
+        self.ttl = ttl
+        self.prefix = "tenant:"
+        self.slug_prefix = "tenant:slug:"
+        self.users_prefix = "tenant:users:"
+        self.usage_prefix = "tenant:usage:"
+
+    @property
+    def client(self):
+        """Underlying Redis client, or None when Redis is not connected"""
+        return redis_manager.redis_client
+
+    async def _get(self, key: str) -> Optional[Any]:
+        """Read and decode a cached entry, treating Redis errors as a miss"""
+        if not self.client:
+            return None
+
+        try:
+            value = await self.client.get(key)
+        except RedisError:
+            return None
+
+        return orjson.loads(value) if value else None
+
+    async def _set(self, key: str, data: Any) -> None:
+        """Encode and store an entry with the cache TTL"""
+        if not self.client:
+            return
+
+        try:
+            await self.client.set(key, orjson.dumps(data), ex=self.ttl)
+        except RedisError:
+            pass
+
+    def _users_key(self, tenant_id: Any, role_filter: Optional[str], active_only: bool) -> str:
+        """Redis key for one filtered view of a tenant's user list"""
+        return f"{self.users_prefix}{tenant_id}:{role_filter or '*'}:{int(active_only)}"
+
+    async def get_tenant(self, tenant_id: Any) -> Optional[Dict[str, Any]]:
+        """Get the cached tenant payload by id"""
+        return await self._get(f"{self.prefix}{tenant_id}")
+
+    async def get_tenant_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Resolve a slug through the slug -> id index and return the cached payload"""
+        tenant_id = await self._get(f"{self.slug_prefix}{slug}")
+        return await self.get_tenant(tenant_id) if tenant_id else None
+
+    async def set_tenant(self, data: Dict[str, Any]) -> None:
+        """Cache a tenant payload under its id, plus the slug -> id index"""
+        if not self.client:
+            return
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(f"{self.prefix}{data['id']}", orjson.dumps(data), ex=self.ttl)
+                pipe.set(f"{self.slug_prefix}{data['slug']}", orjson.dumps(data["id"]), ex=self.ttl)
+                await pipe.execute()
+        except RedisError:
+            pass
+
+    async def get_users(
+        self, tenant_id: Any, role_filter: Optional[str], active_only: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get a cached tenant user list for the given filters"""
+        return await self._get(self._users_key(tenant_id, role_filter, active_only))
+
+    async def set_users(
+        self, tenant_id: Any, role_filter: Optional[str], active_only: bool, data: List[Dict[str, Any]]
+    ) -> None:
+        """Cache a tenant user list for the given filters"""
+        await self._set(self._users_key(tenant_id, role_filter, active_only), data)
+
+    def usage_key(self, tenant_id: Any, user_id: Any) -> str:
+        """Key for usage stats, scoped to the requesting user and cleared by invalidate"""
+        return f"{self.usage_prefix}{tenant_id}:{user_id}"
+
+    async def invalidate(self, tenant_id: Any, slug: Optional[str] = None) -> None:
+        """Drop every cached read for a tenant after it changes"""
+        if not self.client:
+            return
+
+        keys = [f"{self.prefix}{tenant_id}"]
+        if slug:
+            keys.append(f"{self.slug_prefix}{slug}")
+
+        try:
+            for prefix in (self.users_prefix, self.usage_prefix):
+                async for key in self.client.scan_iter(match=f"{prefix}{tenant_id}:*", count=100):
+                    keys.append(key)
+            await self.client.delete(*keys)
+        except RedisError:
+            pass
+
+    async def invalidate_users(self, tenant_id: Any) -> None:
+        """Drop cached user lists for a tenant after its membership changes"""
+        if not self.client:
+            return
+
+        try:
+            keys = [
+                key async for key in self.client.scan_iter(match=f"{self.users_prefix}{tenant_id}:*", count=100)
+            ]
+            if keys:
+                await self.client.delete(*keys)
+        except RedisError:
+            pass
+
+
+class StaleWhileRevalidateCache:
+    """Serves cached aggregates past their freshness window while refreshing them in the background"""
+
+    def __init__(self, fresh_ttl: int = 30, stale_ttl: int = 300, fallback_ttl: int = 86400):
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.fallback_ttl = fallback_ttl
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def client(self):
+        """Underlying Redis client, or None when Redis is not connected"""
+        return redis_manager.redis_client
+
+    async def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the cached entry, treating Redis errors as a miss"""
+        if not self.client:
+            return None
+
+        try:
+            value = await self.client.get(key)
+        except RedisError:
+            return None
+
+        return orjson.loads(value) if value else None
+
+    async def _write(self, key: str, value: Any) -> None:
+        """Store a value with its freshness deadlines; kept past them for DB-error fallback"""
+        if not self.client:
+            return
+
+        now = time.time()
+        entry = {"value": value, "fresh_until": now + self.fresh_ttl, "stale_until": now + self.stale_ttl}
+        try:
+            await self.client.set(key, orjson.dumps(entry), ex=self.stale_ttl + self.fallback_ttl)
+        except RedisError:
+            pass
+
+    async def _refresh(self, key: str, compute: Callable[[AsyncSession], Awaitable[Any]]) -> None:
+        """Recompute an entry on its own session once the request has returned"""
+        try:
+            # Only one worker refreshes a given key at a time
+            if not await self.client.set(f"{key}:refreshing", 1, nx=True, ex=self.fresh_ttl):
+                return
+            async with db_manager.get_session() as session:
+                await self._write(key, await compute(session))
+        except Exception:
+            logger.exception("Background refresh failed for %s", key)
+
+    async def get(
+        self,
+        key: str,
+        db: AsyncSession,
+        compute: Callable[[AsyncSession], Awaitable[Any]],
+        response: Optional[Response] = None
+    ) -> Any:
+        """Return a fresh or stale cached value, recomputing only when it has fully expired"""
+        entry = await self._read(key)
+        now = time.time()
+        state = "miss"
+
+        if entry is not None and now < entry["stale_until"]:
+            state = "hit"
+            if now >= entry["fresh_until"]:
+                state = "stale"
+                task = asyncio.create_task(self._refresh(key, compute))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            value = entry["value"]
+        else:
+            try:
+                value = await compute(db)
+            except SQLAlchemyError:
+                if entry is None:
+                    raise
+                logger.warning("Serving last known value for %s after a database error", key)
+                state = "stale-fallback"
+                value = entry["value"]
+            else:
+                await self._write(key, value)
+
+        if response is not None:
+            response.headers["X-Cache"] = state
+        return value
+
+
+# Global instances
+user_cache = UserCache()
+wizard_cache = WizardCache()
+tenant_cache = TenantCache()
+swr_cache = StaleWhileRevalidateCache()
@@ -0,0 +1,94 @@
+"""
+Background warming of tenant read caches after deploys and on a fixed schedule
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+
+from app.core.cache import tenant_cache
+from app.core.database_utils import db_manager
+from app.core.redis import redis_manager
+from app.models.tenant import Tenant, TenantStatus
+
+logger = logging.getLogger(__name__)
+
+
+class TenantCacheWarmer:
+    """Fills the tenant payload cache for the newest active tenants so dashboards never start cold"""
+
+    def __init__(self, interval: float = 300.0, limit: int = 100):
+        self.interval = interval
+        self.limit = limit
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def client(self):
+        """Underlying Redis client, or None when Redis is not connected"""
+        return redis_manager.redis_client
+
+    async def warm(self) -> int:
+        """Cache every tenant on the first admin list page that is not cached yet; returns tenants warmed"""
+        # Imported here: the cached payload is the API response shape, and the API imports core
+        from app.api.v1.tenants import fast_tenant_response
+
+        if not self.client:
+            return 0
+
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                select(Tenant.id)
+                .where(Tenant.is_deleted == False, Tenant.status == TenantStatus.ACTIVE.value)
+                .order_by(Tenant.created_at.desc())
+                .limit(self.limit)
+            )
+            tenant_ids = result.scalars().all()
+            if not tenant_ids:
+                return 0
+
+            # Entries that are still cached are left alone, so a warm never stampedes the database
+            try:
+                cached = await self.client.mget([f"{tenant_cache.prefix}{tenant_id}" for tenant_id in tenant_ids])
+            except RedisError:
+                return 0
+            missing = [tenant_id for tenant_id, value in zip(tenant_ids, cached) if value is None]
+            if not missing:
+                return 0
+
+            result = await session.execute(select(Tenant).where(Tenant.id.in_(missing)))
+            for tenant in result.scalars():
+                await tenant_cache.set_tenant(fast_tenant_response(tenant).model_dump(mode="json"))
+
+        return len(missing)
+
+    async def _run(self) -> None:
+        """Warm loop started with the application"""
+        while True:
+            try:
+                warmed = await self.warm()
+                if warmed:
+                    logger.info("Warmed cache for %d tenants", warmed)
+            except Exception:
+                logger.exception("Tenant cache warm failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start warming in the background without delaying startup"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the warm loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global instances
+tenant_cache_warmer = TenantCacheWarmer()
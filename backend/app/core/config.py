@@ -2,14 +2,17 @@
 Application configuration management
 """
 import os
+from functools import lru_cache
 from typing import List, Optional
-from pydantic_settings import BaseSettings
-from pydantic import validator, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import field_validator, Field
 
 
 class Settings(BaseSettings):
     """Application settings"""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+    
     # Application
     APP_NAME: str = "HackOps"
     DEBUG: bool = False
@@ -20,15 +23,31 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12  # Password hashing cost; tune per deployment hardware
     
     # Database
     DATABASE_URL: str = Field(..., description="PostgreSQL database URL")
-    DATABASE_POOL_SIZE: int = 10
+    # Per worker the async pool holds max(POOL_SIZE, MAX_CONCURRENCY) connections and the sync pool
+    # POOL_SIZE + MAX_OVERFLOW; keep their sum times workers below Postgres max_connections
+    DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_MAX_CONCURRENCY: int = 40  # DB-bound requests a worker runs at once; the async pool never holds fewer connections
+    DATABASE_POOL_TIMEOUT: int = 5
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_QUERY_CACHE_SIZE: int = 1024
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500
+    DATABASE_BULK_BATCH_SIZE: int = 500  # Rows per multi-row INSERT in bulk operations
+    DATABASE_COPY_THRESHOLD: int = 5000  # Bulk inserts above this many rows use COPY
+    DATABASE_INSERTMANYVALUES_PAGE_SIZE: int = 1000
+    DATABASE_HEALTHCHECK_MAX_AGE: float = 5.0  # Skip the probe query if traffic reached the DB this recently
+    DATABASE_HEALTHCHECK_TIMEOUT: float = 1.0
     
     @property
     def database_url(self) -> str:
-        """Get database URL for SQLAlchemy."""
+        """Get database URL for the async engine, always on the asyncpg driver."""
+        scheme, sep, rest = self.DATABASE_URL.partition("://")
+        if scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+            return f"postgresql+asyncpg://{rest}"
         return self.DATABASE_URL
     
     @property
@@ -38,8 +57,8 @@ class Settings(BaseSettings):
     
     @property
     def db_pool_size(self) -> int:
-        """Get database pool size."""
-        return self.DATABASE_POOL_SIZE
+        """Get database pool size, large enough that concurrent requests never queue on checkout."""
+        return max(self.DATABASE_POOL_SIZE, self.DATABASE_MAX_CONCURRENCY)
     
     @property
     def db_max_overflow(self) -> int:
@@ -49,6 +68,10 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     
+    # Per-process tenant slug -> id cache; invalidation is local, so other workers see changes after the TTL
+    TENANT_LOCAL_CACHE_ENABLED: bool = False
+    TENANT_LOCAL_CACHE_TTL: int = 30
+    
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
@@ -81,15 +104,18 @@ class Settings(BaseSettings):
     # Monitoring
     SENTRY_DSN: Optional[str] = None
     
-    @validator("ALLOWED_HOSTS", pre=True)
+    @field_validator("ALLOWED_HOSTS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v):
         if isinstance(v, str):
             return [i.strip() for i in v.split(",")]
         return v
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment and .env once per process"""
+    return Settings()
+
+
+settings = get_settings()
@@ -2,20 +2,34 @@
 Database configuration and session management
 """
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from typing import Generator
 
 from app.core.config import settings
 
+# Only the psycopg2 dialect accepts executemany_mode; it batches executemany UPDATE/DELETE
+# into few round trips (INSERTs already batch through insertmanyvalues)
+_dialect_kwargs = (
+    {"executemany_mode": "values_plus_batch"}
+    if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2"
+    else {}
+)
+
 # Create database engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
     poolclass=QueuePool,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,
-    echo=settings.DEBUG
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=settings.DATABASE_INSERTMANYVALUES_PAGE_SIZE,
+    echo=settings.DEBUG,
+    **_dialect_kwargs
 )
 
 # Create session factory
@@ -11,16 +11,25 @@ This module provides utilities for:
 """
 
 import asyncio
+import hashlib
 import logging
+import re
+import time
+from collections import defaultdict
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type, TypeVar
+from functools import lru_cache
+from itertools import chain
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Set, Tuple, Type, TypeVar
 from datetime import datetime
 
-from sqlalchemy import text, func, inspect
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import orjson
+from cachetools import LRUCache, TTLCache
+from sqlalchemy import JSON, event, text, func, inspect
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine, AsyncEngine
+from sqlalchemy.orm import Session, declarative_base
 from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.sql import Select
+from sqlalchemy.sql.util import find_tables
 from sqlalchemy.dialects.postgresql import insert
 
 from app.core.config import settings
@@ -30,13 +39,21 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=Base)
 
+# Postgres caps a statement at 32767 bind parameters
+MAX_BIND_PARAMS = 32767
+
+# Sentinel for cache lookups, so cached None results still count as hits
+_MISSING = object()
+
 class DatabaseManager:
     """Manages database connections, pooling, and operations."""
     
     def __init__(self):
         self.engine: Optional[AsyncEngine] = None
-        self.session_factory: Optional[sessionmaker] = None
+        self.session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._is_initialized = False
+        # Monotonic time of the last connection checkout that passed pre-ping
+        self._last_ok = 0.0
     
     async def initialize(self) -> None:
         """Initialize database engine and session factory."""
@@ -47,21 +64,32 @@ class DatabaseManager:
         self.engine = create_async_engine(
             settings.database_url,
             echo=settings.debug,
+            # Fixed-size pool sized to request concurrency: no overflow connections opened and dropped under bursts
             pool_size=settings.db_pool_size,
-            max_overflow=settings.db_max_overflow,
+            max_overflow=0,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
             pool_pre_ping=True,
-            pool_recycle=3600,  # 1 hour
+            pool_use_lifo=True,  # Reuse the warmest connections so idle ones can be recycled
+            pool_reset_on_return="rollback",
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,  # Compiled SQL cache shared across sessions
+            insertmanyvalues_page_size=settings.DATABASE_INSERTMANYVALUES_PAGE_SIZE,  # Rows per batched executemany INSERT
             connect_args={
+                # Per-connection prepared statements, so hot queries skip server-side parsing
+                "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+                "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
                 "server_settings": {
                     "jit": "off",  # Disable JIT for better performance with many short queries
                 }
             }
         )
         
-        # Create session factory
-        self.session_factory = sessionmaker(
+        # Normal traffic doubles as a liveness signal: checkouts only succeed after pre-ping
+        event.listen(self.engine.sync_engine.pool, "checkout", self._mark_ok)
+        
+        # Create session factory; rows stay loaded after commit, so no refresh SELECT is needed
+        self.session_factory = async_sessionmaker(
             bind=self.engine,
-            class_=AsyncSession,
             expire_on_commit=False
         )
         
@@ -90,28 +118,41 @@ class DatabaseManager:
             finally:
                 await session.close()
     
+    def _mark_ok(self, *args) -> None:
+        """Pool checkout listener recording that a live connection was just handed out."""
+        self._last_ok = time.monotonic()
+    
+    async def _ping(self) -> None:
+        """Round-trip SELECT 1 on a pooled connection."""
+        async with self.get_session() as session:
+            result = await session.execute(text("SELECT 1"))
+            result.scalar()
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check database health and connectivity."""
         try:
-            async with self.get_session() as session:
-                result = await session.execute(text("SELECT 1"))
-                result.scalar()
-                
-                # Check connection pool status
-                pool = self.engine.pool
-                pool_status = {
-                    "size": pool.size(),
-                    "checked_in": pool.checkedin(),
-                    "checked_out": pool.checkedout(),
-                    "overflow": pool.overflow(),
-                    "invalidated": pool.invalidated()
-                }
-                
-                return {
-                    "status": "healthy",
-                    "pool": pool_status,
-                    "timestamp": datetime.utcnow()
-                }
+            if not self._is_initialized:
+                await self.initialize()
+            
+            # Only probe when no request has proven the database reachable recently
+            if time.monotonic() - self._last_ok > settings.DATABASE_HEALTHCHECK_MAX_AGE:
+                await asyncio.wait_for(self._ping(), timeout=settings.DATABASE_HEALTHCHECK_TIMEOUT)
+            
+            # Check connection pool status
+            pool = self.engine.pool
+            pool_status = {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "invalidated": pool.invalidated()
+            }
+            
+            return {
+                "status": "healthy",
+                "pool": pool_status,
+                "timestamp": datetime.utcnow()
+            }
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
             return {
@@ -184,43 +225,112 @@ class QueryBuilder:
         
         return query
 
+@lru_cache(maxsize=None)
+def _insert_statement(model: Type[T]):
+    """INSERT for a model, built once; rows are bound per execute."""
+    return insert(model)
+
+
+@lru_cache(maxsize=None)
+def _upsert_statement(model: Type[T], index_elements: tuple):
+    """INSERT ... ON CONFLICT DO UPDATE for a model and conflict target, built once."""
+    stmt = insert(model)
+    
+    # Create update dict excluding the index elements
+    update_dict = {
+        column.name: getattr(stmt.excluded, column.name)
+        for column in model.__table__.columns
+        if column.name not in index_elements and column.name != "id"
+    }
+    
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_=update_dict
+    )
+
+
 class BulkOperations:
     """Utilities for bulk database operations."""
     
+    @staticmethod
+    def _batches(model: Type[T], data: List[Dict[str, Any]],
+                 batch_size: Optional[int]) -> Iterator[List[Dict[str, Any]]]:
+        """Split rows into multi-row VALUES batches that stay under Postgres' bind parameter limit."""
+        # Column defaults are bound per row too, so budget for every column of the table
+        batch_size = batch_size or settings.DATABASE_BULK_BATCH_SIZE
+        batch_size = max(1, min(batch_size, MAX_BIND_PARAMS // len(model.__table__.columns)))
+        for start in range(0, len(data), batch_size):
+            yield data[start:start + batch_size]
+    
     @staticmethod
     async def bulk_insert(session: AsyncSession, model: Type[T], 
-                         data: List[Dict[str, Any]]) -> None:
+                         data: List[Dict[str, Any]],
+                         batch_size: Optional[int] = None) -> None:
         """Perform bulk insert operation."""
         if not data:
             return
         
-        stmt = insert(model).values(data)
-        await session.execute(stmt)
+        # Large loads go through COPY, which skips SQL parsing entirely
+        if len(data) > settings.DATABASE_COPY_THRESHOLD:
+            await BulkOperations.bulk_insert_copy(session, model, data)
+        else:
+            stmt = _insert_statement(model)
+            for batch in BulkOperations._batches(model, data, batch_size):
+                await session.execute(stmt, batch)
         await session.commit()
     
+    @staticmethod
+    async def bulk_insert_copy(session: AsyncSession, model: Type[T],
+                               data: List[Dict[str, Any]]) -> None:
+        """Load rows with asyncpg's binary COPY in the session's transaction; the caller commits."""
+        if not data:
+            return
+        
+        table = model.__table__
+        # COPY bypasses SQLAlchemy, so Python-side column defaults are filled in here
+        columns = [
+            column for column in table.columns
+            if column.key in data[0] or (column.default is not None and not column.default.is_sequence)
+        ]
+        
+        records = []
+        for row in data:
+            record = []
+            for column in columns:
+                if column.key in row:
+                    value = row[column.key]
+                elif column.default.is_callable:
+                    value = column.default.arg(None)
+                else:
+                    value = column.default.arg
+                if isinstance(column.type, JSON) and value is not None:
+                    value = orjson.dumps(value).decode()
+                record.append(value)
+            records.append(tuple(record))
+        
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[column.name for column in columns],
+            schema_name=table.schema
+        )
+        # COPY never reaches the ORM events, so record the write for cached select invalidation
+        _written_tables(session.sync_session).add(table.name)
+    
     @staticmethod
     async def bulk_upsert(session: AsyncSession, model: Type[T], 
                          data: List[Dict[str, Any]], 
-                         index_elements: List[str]) -> None:
+                         index_elements: List[str],
+                         batch_size: Optional[int] = None) -> None:
         """Perform bulk upsert (insert or update) operation."""
         if not data:
             return
         
-        stmt = insert(model).values(data)
-        
-        # Create update dict excluding the index elements
-        update_dict = {
-            column.name: getattr(stmt.excluded, column.name)
-            for column in model.__table__.columns
-            if column.name not in index_elements and column.name != "id"
-        }
-        
-        stmt = stmt.on_conflict_do_update(
-            index_elements=index_elements,
-            set_=update_dict
-        )
-        
-        await session.execute(stmt)
+        stmt = _upsert_statement(model, tuple(index_elements))
+        for batch in BulkOperations._batches(model, data, batch_size):
+            await session.execute(stmt, batch)
         await session.commit()
     
     @staticmethod
@@ -231,27 +341,68 @@ class BulkOperations:
         if not updates:
             return
         
-        from sqlalchemy import update
+        from sqlalchemy import bindparam, update
         
+        # Group rows by the columns they set, so each group is one executemany of a single statement
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
         for update_data in updates:
             if id_field not in update_data:
                 continue
             
-            record_id = update_data.pop(id_field)
-            stmt = update(model).where(
-                getattr(model, id_field) == record_id
-            ).values(**update_data)
-            
-            await session.execute(stmt)
+            params = {key: value for key, value in update_data.items() if key != id_field}
+            if not params:
+                continue
+            params["_record_id"] = update_data[id_field]
+            groups.setdefault(tuple(sorted(params)), []).append(params)
+        
+        # The SET clause is derived from each group's parameter keys
+        table = model.__table__
+        stmt = update(table).where(table.c[id_field] == bindparam("_record_id"))
+        for params in groups.values():
+            await session.execute(stmt, params)
         
         await session.commit()
 
+class QueryStats:
+    """Running totals for one normalized query."""
+    
+    __slots__ = ("count", "total_ns", "max_ns")
+    
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Report the totals in seconds."""
+        return {
+            "count": self.count,
+            "total_time": self.total_ns / 1e9,
+            "avg_time": self.total_ns / self.count / 1e9 if self.count else 0.0,
+            "max_time": self.max_ns / 1e9
+        }
+
+
+# Literals stripped from SQL so one statement shape maps to one stats entry
+_SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
 class PerformanceMonitor:
     """Monitor database query performance."""
     
-    def __init__(self):
+    def __init__(self, maxsize: int = 1000, top_n: int = 10):
         self.slow_query_threshold = 1.0  # seconds
-        self.query_stats = {}
+        self.top_n = top_n
+        self.query_stats: LRUCache = LRUCache(maxsize=maxsize)
+        self.total_queries = 0
+        self.slow_queries = 0
+        # (max_ns, query) of the slowest statements, kept sorted slowest first
+        self._top: List[Tuple[int, str]] = []
+    
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Replace literal values with placeholders."""
+        return _SQL_LITERALS.sub("?", query)
     
     def log_query(self, query: str, duration: float, params: Optional[Dict] = None):
         """Log query execution statistics."""
@@ -261,41 +412,54 @@ class PerformanceMonitor:
             )
         
         # Update statistics
-        if query not in self.query_stats:
-            self.query_stats[query] = {
-                "count": 0,
-                "total_time": 0.0,
-                "avg_time": 0.0,
-                "max_time": 0.0
-            }
-        
-        stats = self.query_stats[query]
-        stats["count"] += 1
-        stats["total_time"] += duration
-        stats["avg_time"] = stats["total_time"] / stats["count"]
-        stats["max_time"] = max(stats["max_time"], duration)
+        query = self.normalize(query)
+        stats = self.query_stats.get(query)
+        if stats is None:
+            stats = self.query_stats[query] = QueryStats()
+        
+        duration_ns = int(duration * 1e9)
+        was_slow = stats.max_ns > self.slow_query_threshold * 1e9
+        stats.count += 1
+        stats.total_ns += duration_ns
+        self.total_queries += 1
+        
+        if duration_ns > stats.max_ns:
+            stats.max_ns = duration_ns
+            if not was_slow and duration > self.slow_query_threshold:
+                self.slow_queries += 1
+            self._update_top(query, duration_ns)
+    
+    def _update_top(self, query: str, max_ns: int) -> None:
+        """Re-rank a query whose max time grew; touches at most top_n entries."""
+        if len(self._top) >= self.top_n and max_ns <= self._top[-1][0]:
+            return
+        self._top = [entry for entry in self._top if entry[1] != query]
+        self._top.append((max_ns, query))
+        self._top.sort(reverse=True)
+        del self._top[self.top_n:]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get query performance statistics."""
         return {
-            "total_queries": sum(stats["count"] for stats in self.query_stats.values()),
-            "slow_queries": sum(
-                1 for stats in self.query_stats.values() 
-                if stats["max_time"] > self.slow_query_threshold
-            ),
-            "top_slow_queries": sorted(
-                [
-                    {
-                        "query": query[:100] + "..." if len(query) > 100 else query,
-                        "stats": stats
-                    }
-                    for query, stats in self.query_stats.items()
-                ],
-                key=lambda x: x["stats"]["max_time"],
-                reverse=True
-            )[:10]
+            "total_queries": self.total_queries,
+            "slow_queries": self.slow_queries,
+            "top_slow_queries": [
+                {
+                    "query": query[:100] + "..." if len(query) > 100 else query,
+                    "stats": self.query_stats[query].as_dict()
+                }
+                for _, query in self._top
+                if query in self.query_stats
+            ]
         }
 
+# Tenant context statements, built once; set_config(..., true) lasts until the transaction ends
+_SET_TENANT_SQL = text("SELECT set_config('app.current_tenant_id', :tenant_id, true)")
+_CLEAR_TENANT_SQL = text("SELECT set_config('app.current_tenant_id', NULL, true)")
+_SET_SYSTEM_ADMIN_SQL = text("SELECT set_config('app.is_system_admin', :is_admin, true)")
+_CURRENT_TENANT_SQL = text("SELECT current_setting('app.current_tenant_id', true)")
+
+
 class TenantManager:
     """
     Enhanced utilities for multi-tenant database operations with RLS support.
@@ -316,10 +480,9 @@ class TenantManager:
             session: Database session
             tenant_id: ID of the tenant to set as context
         """
-        await session.execute(
-            text("SELECT set_config('app.current_tenant_id', :tenant_id, true)"),
-            {"tenant_id": tenant_id}
-        )
+        await session.execute(_SET_TENANT_SQL, {"tenant_id": tenant_id})
+        # Remember which transaction carries the context, see tenant_execute
+        session.info["tenant_context"] = (session.sync_session.get_transaction(), tenant_id)
         self._current_tenant_id = tenant_id
     
     async def clear_tenant_context(self, session: AsyncSession) -> None:
@@ -329,9 +492,8 @@ class TenantManager:
         Args:
             session: Database session
         """
-        await session.execute(
-            text("SELECT set_config('app.current_tenant_id', NULL, true)")
-        )
+        await session.execute(_CLEAR_TENANT_SQL)
+        session.info.pop("tenant_context", None)
         self._current_tenant_id = None
     
     async def set_system_admin_context(self, session: AsyncSession, is_admin: bool = True) -> None:
@@ -342,10 +504,7 @@ class TenantManager:
             session: Database session
             is_admin: Whether to enable system admin context
         """
-        await session.execute(
-            text("SELECT set_config('app.is_system_admin', :is_admin, true)"),
-            {"is_admin": str(is_admin).lower()}
-        )
+        await session.execute(_SET_SYSTEM_ADMIN_SQL, {"is_admin": str(is_admin).lower()})
     
     async def get_current_tenant_id(self, session: AsyncSession) -> Optional[str]:
         """
@@ -357,13 +516,32 @@ class TenantManager:
         Returns:
             Current tenant ID as string or None if not set
         """
-        result = await session.execute(
-            text("SELECT current_setting('app.current_tenant_id', true)")
-        )
+        result = await session.execute(_CURRENT_TENANT_SQL)
         
         tenant_id = result.scalar()
         return tenant_id if tenant_id != '' else None
     
+    async def tenant_execute(self, session: AsyncSession, tenant_id: str, stmt, params: Optional[Dict[str, Any]] = None):
+        """
+        Execute a statement under a tenant's row-level security context.
+        
+        The context is set at most once per transaction, so a run of tenant
+        queries costs one extra round trip in total rather than one each.
+        
+        Args:
+            session: Database session
+            tenant_id: ID of the tenant to scope the statement to
+            stmt: Statement to execute
+            params: Optional bound parameters
+        
+        Returns:
+            The statement result
+        """
+        transaction = session.sync_session.get_transaction()
+        if transaction is None or session.info.get("tenant_context") != (transaction, tenant_id):
+            await self.set_tenant_context(session, tenant_id)
+        return await session.execute(stmt, params)
+    
     @asynccontextmanager
     async def tenant_session(self, tenant_id: str) -> AsyncGenerator[AsyncSession, None]:
         """
@@ -375,20 +553,11 @@ class TenantManager:
         Yields:
             Database session with tenant context set
         """
+        # A fresh session has no context to save, and the transaction-local setting
+        # is discarded when the session closes, so one round trip is all it takes
         async with db_manager.get_session() as session:
-            # Store original tenant context
-            original_tenant_id = await self.get_current_tenant_id(session)
-            
-            try:
-                # Set tenant context
-                await self.set_tenant_context(session, tenant_id)
-                yield session
-            finally:
-                # Restore original tenant context
-                if original_tenant_id:
-                    await self.set_tenant_context(session, original_tenant_id)
-                else:
-                    await self.clear_tenant_context(session)
+            await self.set_tenant_context(session, tenant_id)
+            yield session
     
     @asynccontextmanager
     async def system_admin_session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -398,14 +567,10 @@ class TenantManager:
         Yields:
             Database session with system admin context
         """
+        # Transaction-local like the tenant context, so closing the session clears it
         async with db_manager.get_session() as session:
-            try:
-                # Set system admin context
-                await self.set_system_admin_context(session, True)
-                yield session
-            finally:
-                # Clear system admin context
-                await self.set_system_admin_context(session, False)
+            await self.set_system_admin_context(session, True)
+            yield session
     
     async def verify_tenant_isolation(self, tenant_id: str) -> Dict[str, Any]:
         """
@@ -457,26 +622,90 @@ class TenantManager:
 class CacheManager:
     """Database-level caching utilities."""
     
-    def __init__(self):
-        self.cache = {}
-        self.cache_ttl = 300  # 5 minutes
+    def __init__(self, maxsize: int = 10_000, ttl: int = 300):
+        # Bounded, with monotonic-clock expiry handled by the cache itself
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.cache_ttl = ttl
+        # Key prefix (text before the first ':') -> keys, so prefix invalidation skips a full scan
+        self._tags: Dict[str, Set[str]] = defaultdict(set)
+    
+    @staticmethod
+    def _tag(cache_key: str) -> str:
+        """Invalidation tag for a cache key."""
+        return cache_key.split(":", 1)[0]
     
     async def get_cached_query(self, cache_key: str, query_func, *args, **kwargs):
         """Get cached query result or execute and cache."""
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if (datetime.utcnow() - timestamp).seconds < self.cache_ttl:
-                return cached_data
+        cached = self.cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
         
         # Execute query and cache result
         result = await query_func(*args, **kwargs)
-        self.cache[cache_key] = (result, datetime.utcnow())
+        self.cache[cache_key] = result
+        self._index(cache_key, (self._tag(cache_key),))
         return result
     
+    def _index(self, cache_key: str, tags) -> None:
+        """Record a cached key under its invalidation tags."""
+        for tag in tags:
+            keys = self._tags[tag]
+            keys.add(cache_key)
+            if len(keys) > self.cache.maxsize:
+                # Drop keys the cache has already expired or evicted
+                keys.intersection_update(self.cache.keys())
+    
+    async def execute_cached(self, session: AsyncSession, stmt: Select) -> List[Any]:
+        """
+        Run a read-only select through the cache and return its rows as mappings.
+        
+        Entries are keyed on the compiled SQL, its parameters and the tenant context
+        of the session's current transaction; without a tenant context the select
+        runs uncached, since RLS makes its rows depend on who asks. Entries are
+        tagged with every table the statement reads, so committed writes to any of
+        them drop the entry in this process. Other workers see changes after the TTL,
+        and writes issued as raw text() SQL must call invalidate_tables themselves.
+        
+        Args:
+            session: Database session
+            stmt: Select to execute, typically built with QueryBuilder
+        
+        Returns:
+            List of row mappings
+        """
+        transaction, tenant_id = session.info.get("tenant_context", (None, None))
+        if tenant_id is None or transaction is not session.sync_session.get_transaction():
+            return (await session.execute(stmt)).mappings().all()
+        
+        compiled = stmt.compile(dialect=session.get_bind().dialect)
+        digest = hashlib.blake2b(compiled.string.encode(), digest_size=16)
+        digest.update(orjson.dumps(compiled.params, default=str, option=orjson.OPT_SORT_KEYS))
+        digest.update(str(tenant_id).encode())
+        cache_key = f"select:{digest.hexdigest()}"
+        
+        cached = self.cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
+        rows = (await session.execute(stmt)).mappings().all()
+        self.cache[cache_key] = rows
+        self._index(cache_key, {table.name for table in find_tables(stmt)})
+        return rows
+    
+    def invalidate_tables(self, tables) -> None:
+        """Drop cached selects that read from any of the given tables."""
+        for table in tables:
+            for key in self._tags.pop(table, ()):
+                self.cache.pop(key, None)
+    
     def invalidate_cache(self, pattern: Optional[str] = None):
-        """Invalidate cache entries matching pattern."""
+        """Invalidate entries under a key-prefix tag, or otherwise any key containing pattern."""
         if pattern is None:
             self.cache.clear()
+            self._tags.clear()
+        elif pattern in self._tags:
+            for key in self._tags.pop(pattern):
+                self.cache.pop(key, None)
         else:
             keys_to_remove = [
                 key for key in self.cache.keys() 
@@ -492,6 +721,36 @@ perf_monitor = PerformanceMonitor()
 tenant_manager = TenantManager()
 cache_manager = CacheManager()
 
+# Cached select invalidation: collect the tables a session writes, drop them once it commits
+def _written_tables(session: Session) -> Set[str]:
+    """Tables written in the session's current transaction."""
+    return session.info.setdefault("written_tables", set())
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session, flush_context):
+    """Record tables touched by an ORM flush."""
+    _written_tables(session).update(
+        obj.__table__.name for obj in chain(session.new, session.dirty, session.deleted)
+    )
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement_tables(orm_execute_state):
+    """Record the table targeted by an INSERT, UPDATE or DELETE statement."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _written_tables(orm_execute_state.session).add(orm_execute_state.statement.table.name)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written_tables(session):
+    """Drop cached selects over tables the committed transaction wrote."""
+    tables = session.info.pop("written_tables", None)
+    if tables:
+        cache_manager.invalidate_tables(tables)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_tables(session):
+    """Forget writes that were rolled back."""
+    session.info.pop("written_tables", None)
+
 # Database event handlers
 async def startup_database():
     """Initialize database on application startup."""
@@ -10,6 +10,7 @@ This module provides FastAPI dependencies and middleware for:
 """
 
 import secrets
+import time
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 
@@ -19,7 +20,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.database_utils import get_db
-from app.core.auth import token_manager, session_manager
+from app.core.auth import TokenManager, SessionManager, token_manager, session_manager
+from app.core.oauth import OAuthManager
 from app.core.rbac import permission_checker, Permission, rbac_manager
 from app.models.user import User, UserSession
 from app.models.tenant import TenantUser
@@ -27,6 +29,19 @@ from app.models.tenant import TenantUser
 # Security scheme for token authentication
 security = HTTPBearer(auto_error=False)
 
+# Shared service dependencies; the instances are attached to app.state at startup
+def get_token_manager(request: Request) -> TokenManager:
+    """Get the application's token manager."""
+    return request.app.state.token_manager
+
+def get_session_manager(request: Request) -> SessionManager:
+    """Get the application's session manager."""
+    return request.app.state.session_manager
+
+def get_oauth_manager(request: Request) -> OAuthManager:
+    """Get the application's OAuth manager."""
+    return request.app.state.oauth_manager
+
 class AuthContext:
     """Authentication context for current request."""
     
@@ -135,6 +150,14 @@ async def require_authenticated_user(
         )
     return current_user
 
+async def get_current_active_user(
+    current_user: User = Depends(require_authenticated_user)
+) -> User:
+    """Require an authenticated, active user."""
+    # Token lookup already filters is_active/is_deleted in a single SELECT and
+    # User has no relationships, so nothing further is loaded here
+    return current_user
+
 async def get_current_tenant_id(
     request: Request,
     current_user: Optional[User] = Depends(get_current_user)
@@ -260,7 +283,7 @@ class StateManager:
         state = secrets.token_urlsafe(32)
         self.states[state] = {
             "redirect_url": redirect_url,
-            "created_at": secrets.token_urlsafe(16)  # Simple timestamp placeholder
+            "created_at": time.time()
         }
         return state
     
@@ -14,10 +14,12 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import SessionLocal
+from app.core.database_utils import get_db as get_async_db
 from app.models.user import User
 from app.models.tenant import Tenant
 from app.services.tenant_service import tenant_service
@@ -130,7 +132,7 @@ async def get_optional_user(
 
 async def get_tenant_from_path(
     tenant_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Tenant:
     """
     Get tenant from path parameter.
@@ -157,7 +159,7 @@ async def get_tenant_from_path(
 
 async def get_tenant_from_header(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Optional[Tenant]:
     """
     Get tenant from X-Tenant-ID header.
@@ -196,7 +198,7 @@ async def get_tenant_from_header(
 
 async def get_tenant_from_subdomain(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Optional[Tenant]:
     """
     Get tenant from subdomain.
@@ -285,7 +287,7 @@ async def get_optional_tenant(
 async def verify_tenant_access(
     current_user: User = Depends(get_current_user),
     current_tenant: Tenant = Depends(get_current_tenant),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Tenant:
     """
     Verify that current user has access to current tenant.
@@ -326,7 +328,7 @@ async def verify_tenant_access(
 async def require_tenant_admin(
     current_user: User = Depends(get_current_user),
     current_tenant: Tenant = Depends(get_current_tenant),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Tenant:
     """
     Require that current user has admin access to current tenant.
@@ -373,7 +375,7 @@ async def require_tenant_admin(
 async def require_tenant_owner(
     current_user: User = Depends(get_current_user),
     current_tenant: Tenant = Depends(get_current_tenant),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Tenant:
     """
     Require that current user is owner of current tenant.
@@ -0,0 +1,7 @@
+"""
+Domain exceptions raised by the service layer
+"""
+
+
+class ServiceValidationError(ValueError):
+    """Request rejected by service-layer business rules; its message is safe to show to clients"""
@@ -9,6 +9,7 @@ This module provides OAuth integration with multiple providers:
 """
 
 import asyncio
+import importlib.util
 import httpx
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlencode
@@ -16,6 +17,9 @@ from dataclasses import dataclass
 
 from app.core.config import settings
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 @dataclass
 class OAuthUserInfo:
     """Standardized OAuth user information."""
@@ -31,11 +35,12 @@ class OAuthUserInfo:
 class OAuthProvider:
     """Base OAuth provider class."""
     
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
+    def __init__(self, client_id: str, client_secret: str, redirect_uri: str,
+                 http_client: Optional[httpx.AsyncClient] = None):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
-        self.http_client = httpx.AsyncClient()
+        self.http_client = http_client or httpx.AsyncClient()
     
     async def get_authorization_url(self, state: str, scopes: List[str] = None) -> str:
         """Generate OAuth authorization URL."""
@@ -60,8 +65,9 @@ class OAuthProvider:
 class GoogleOAuthProvider(OAuthProvider):
     """Google OAuth 2.0 provider."""
     
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
-        super().__init__(client_id, client_secret, redirect_uri)
+    def __init__(self, client_id: str, client_secret: str, redirect_uri: str,
+                 http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client_id, client_secret, redirect_uri, http_client)
         self.auth_url = "https://accounts.google.com/o/oauth2/auth"
         self.token_url = "https://oauth2.googleapis.com/token"
         self.userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
@@ -138,8 +144,9 @@ class GoogleOAuthProvider(OAuthProvider):
 class GitHubOAuthProvider(OAuthProvider):
     """GitHub OAuth 2.0 provider."""
     
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
-        super().__init__(client_id, client_secret, redirect_uri)
+    def __init__(self, client_id: str, client_secret: str, redirect_uri: str,
+                 http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client_id, client_secret, redirect_uri, http_client)
         self.auth_url = "https://github.com/login/oauth/authorize"
         self.token_url = "https://github.com/login/oauth/access_token"
         self.userinfo_url = "https://api.github.com/user"
@@ -229,8 +236,9 @@ class GitHubOAuthProvider(OAuthProvider):
 class MicrosoftOAuthProvider(OAuthProvider):
     """Microsoft Azure AD OAuth 2.0 provider."""
     
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str, tenant: str = "common"):
-        super().__init__(client_id, client_secret, redirect_uri)
+    def __init__(self, client_id: str, client_secret: str, redirect_uri: str, tenant: str = "common",
+                 http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client_id, client_secret, redirect_uri, http_client)
         self.tenant = tenant
         self.auth_url = f"https://login.microsoftonline.com/{tenant}/oauth2/v2.0/authorize"
         self.token_url = f"https://login.microsoftonline.com/{tenant}/oauth2/v2.0/token"
@@ -306,6 +314,11 @@ class OAuthManager:
     
     def __init__(self):
         self.providers: Dict[str, OAuthProvider] = {}
+        # One pooled client shared by all providers so callbacks reuse TLS connections
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=HTTP2_AVAILABLE
+        )
         self._initialize_providers()
     
     def _initialize_providers(self):
@@ -317,7 +330,8 @@ class OAuthManager:
             self.providers["google"] = GoogleOAuthProvider(
                 client_id=settings.GOOGLE_CLIENT_ID,
                 client_secret=settings.GOOGLE_CLIENT_SECRET,
-                redirect_uri=f"{base_redirect_uri}/google"
+                redirect_uri=f"{base_redirect_uri}/google",
+                http_client=self._client
             )
         
         # GitHub OAuth
@@ -325,7 +339,8 @@ class OAuthManager:
             self.providers["github"] = GitHubOAuthProvider(
                 client_id=settings.GITHUB_CLIENT_ID,
                 client_secret=settings.GITHUB_CLIENT_SECRET,
-                redirect_uri=f"{base_redirect_uri}/github"
+                redirect_uri=f"{base_redirect_uri}/github",
+                http_client=self._client
             )
         
         # Microsoft OAuth
@@ -333,7 +348,8 @@ class OAuthManager:
             self.providers["microsoft"] = MicrosoftOAuthProvider(
                 client_id=settings.MICROSOFT_CLIENT_ID,
                 client_secret=settings.MICROSOFT_CLIENT_SECRET,
-                redirect_uri=f"{base_redirect_uri}/microsoft"
+                redirect_uri=f"{base_redirect_uri}/microsoft",
+                http_client=self._client
             )
     
     def get_provider(self, provider_name: str) -> Optional[OAuthProvider]:
@@ -364,6 +380,19 @@ class OAuthManager:
         if provider:
             return await provider.get_user_info(access_token)
         return None
+    
+    async def exchange_code_for_user_info(self, provider_name: str, code: str) -> OAuthUserInfo:
+        """Exchange an authorization code and fetch the provider's user info."""
+        provider = self.get_provider(provider_name)
+        if not provider:
+            raise ValueError(f"Unsupported OAuth provider: {provider_name}")
+        
+        token_data = await provider.exchange_code_for_token(code)
+        return await provider.get_user_info(token_data["access_token"])
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self._client.aclose()
 
 # Global OAuth manager instance
 oauth_manager = OAuthManager()
@@ -0,0 +1,62 @@
+"""
+Redis-backed fixed-window rate limiting for expensive endpoints
+"""
+from typing import Optional
+
+from fastapi import HTTPException, status
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+
+from app.core.redis import redis_manager
+
+# Atomic INCR + EXPIRE so the window starts with the first hit
+_INCR_WITH_EXPIRE = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return current
+"""
+
+
+class RateLimiter:
+    """Counts hits per key and rejects requests over the limit"""
+
+    def __init__(self):
+        self.key_prefix = "ratelimit:"
+        self._script: Optional[AsyncScript] = None
+        self._script_client = None
+
+    def _get_script(self, client) -> AsyncScript:
+        """Register the Lua script once per Redis client"""
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(_INCR_WITH_EXPIRE)
+            self._script_client = client
+        return self._script
+
+    async def hit(self, key: str, window: int) -> Optional[int]:
+        """Record a hit and return the count in the current window"""
+        client = redis_manager.redis_client
+        if not client:
+            return None
+
+        try:
+            script = self._get_script(client)
+            return int(await script(keys=[f"{self.key_prefix}{key}"], args=[window]))
+        except RedisError:
+            # Fail open: rate limiting must not take auth down with Redis
+            return None
+
+    async def check(self, key: str, limit: int, window: int) -> None:
+        """Raise 429 if the key exceeded `limit` hits within `window` seconds"""
+        count = await self.hit(key, window)
+        if count is not None and count > limit:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests, please try again later",
+                headers={"Retry-After": str(window)}
+            )
+
+
+# Global instances
+rate_limiter = RateLimiter()
@@ -301,6 +301,10 @@ class RBACManager:
         """Check if user has all of the specified permissions."""
         return all(self.has_permission(user_roles, perm, tenant_id) for perm in permissions)
     
+    def has_system_permission(self, system_role: Optional[str], permission: Permission) -> bool:
+        """Check a permission granted by a user's system-level role."""
+        return bool(system_role) and permission in self.get_role_permissions(system_role)
+    
     def get_user_permissions(self, user_roles: List[str]) -> Set[Permission]:
         """Get all permissions for a user based on their roles."""
         permissions = set()
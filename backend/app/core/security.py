@@ -13,7 +13,12 @@ from app.core.config import settings
 from app.core.database import get_db
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__ident="2b"
+)
 
 # JWT token security
 security = HTTPBearer()
@@ -0,0 +1,160 @@
+"""
+Redis-buffered tenant usage counters, flushed to Postgres in batches
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from sqlalchemy import update
+
+from app.core.cache import tenant_cache
+from app.core.database_utils import db_manager
+from app.core.redis import redis_manager
+from app.models.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+# Tracked metric -> (usage column, limit column) on the tenants table
+USAGE_METRICS = {
+    "events": ("current_events", "max_events"),
+    "participants": ("current_participants", "max_participants_per_event"),
+    "storage": ("current_storage_gb", "max_storage_gb"),
+    "admins": ("current_admins", "max_admins"),
+}
+
+# Atomically take a tenant's pending deltas and clear its dirty flag
+_DRAIN = """
+local data = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+redis.call('SREM', KEYS[2], ARGV[1])
+return data
+"""
+
+
+class UsageCounter:
+    """Accumulates usage increments in Redis and applies them to tenants periodically"""
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self.key_prefix = "usage:"
+        self.dirty_key = "usage:dirty"
+        self._script: Optional[AsyncScript] = None
+        self._script_client = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def client(self):
+        """Underlying Redis client, or None when Redis is not connected"""
+        return redis_manager.redis_client
+
+    def _get_script(self, client) -> AsyncScript:
+        """Register the Lua script once per Redis client"""
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(_DRAIN)
+            self._script_client = client
+        return self._script
+
+    async def incr(self, tenant_id: Any, metric: str, amount: int) -> Optional[int]:
+        """Buffer an increment and return the pending delta, or None when Redis is unavailable"""
+        if not self.client:
+            return None
+
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hincrby(f"{self.key_prefix}{tenant_id}", metric, amount)
+                pipe.sadd(self.dirty_key, str(tenant_id))
+                pending, _ = await pipe.execute()
+        except RedisError:
+            return None
+
+        return int(pending)
+
+    async def pending(self, tenant_id: Any) -> Dict[str, int]:
+        """Deltas buffered for a tenant that have not been flushed yet"""
+        if not self.client:
+            return {}
+
+        try:
+            data = await self.client.hgetall(f"{self.key_prefix}{tenant_id}")
+        except RedisError:
+            return {}
+
+        return {metric: int(value) for metric, value in data.items()}
+
+    async def _drain(self, tenant_id: str) -> Dict[str, int]:
+        """Take and clear the pending deltas for one tenant"""
+        script = self._get_script(self.client)
+        flat: List[str] = await script(keys=[f"{self.key_prefix}{tenant_id}", self.dirty_key], args=[tenant_id])
+        return {flat[i]: int(flat[i + 1]) for i in range(0, len(flat), 2)}
+
+    async def flush(self) -> int:
+        """Apply every tenant's buffered deltas in one UPDATE each; returns tenants flushed"""
+        if not self.client:
+            return 0
+
+        try:
+            tenant_ids = await self.client.smembers(self.dirty_key)
+        except RedisError:
+            return 0
+
+        flushed = 0
+        for tenant_id in tenant_ids:
+            try:
+                deltas = await self._drain(tenant_id)
+            except RedisError:
+                continue
+
+            values = {
+                USAGE_METRICS[metric][0]: getattr(Tenant, USAGE_METRICS[metric][0]) + delta
+                for metric, delta in deltas.items()
+                if metric in USAGE_METRICS and delta
+            }
+            if not values:
+                continue
+
+            try:
+                async with db_manager.get_session() as session:
+                    await session.execute(update(Tenant).where(Tenant.id == tenant_id).values(**values))
+                    await session.commit()
+            except Exception:
+                logger.exception("Failed to flush usage for tenant %s, re-queueing", tenant_id)
+                for metric, delta in deltas.items():
+                    await self.incr(tenant_id, metric, delta)
+                continue
+
+            await tenant_cache.invalidate(tenant_id)
+            flushed += 1
+
+        return flushed
+
+    async def _run(self) -> None:
+        """Flush loop started with the application"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Usage flush failed")
+
+    def start(self) -> None:
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write out whatever is still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+
+# Global instances
+usage_counter = UsageCounter()
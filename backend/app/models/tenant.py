@@ -2,7 +2,7 @@
 Tenant model for multi-tenancy support
 """
 from typing import Any, Dict, List, Optional
-from sqlalchemy import Column, String, Boolean, Text, Integer, DateTime
+from sqlalchemy import Column, String, Boolean, Text, Integer, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 from enum import Enum as PyEnum
@@ -16,6 +16,7 @@ class TenantStatus(PyEnum):
     SUSPENDED = "suspended"
     TRIAL = "trial"
     EXPIRED = "expired"
+    DELETING = "deleting"
 
 
 class TenantPlan(PyEnum):
@@ -33,7 +34,7 @@ class Tenant(Base, SoftDeleteMixin):
     
     # Basic information
     name = Column(String(200), nullable=False)
-    slug = Column(String(100), unique=True, nullable=False, index=True)
+    slug = Column(String(100), nullable=False)  # unique among live tenants, see ux_tenants_slug_live
     description = Column(Text, nullable=True)
     
     # Contact information
@@ -165,10 +166,31 @@ class Tenant(Base, SoftDeleteMixin):
         return f"<Tenant {self.slug}>"
 
 
+# Text searched by list_tenants; must match the trigram index expression below
+TENANT_SEARCH_TEXT = Tenant.name + " " + Tenant.slug + " " + Tenant.contact_email
+
+# Slugs are reusable once a tenant is deleted; create_tenant relies on this for its conflict check
+TENANT_SLUG_INDEX = "ux_tenants_slug_live"
+Index(TENANT_SLUG_INDEX, Tenant.slug, unique=True, postgresql_where=text("NOT is_deleted"))
+
+# Filtered, newest-first listing and substring search (requires pg_trgm)
+Index("ix_tenants_status_plan_created", Tenant.status, Tenant.plan, Tenant.created_at.desc())
+Index(
+    "ix_tenants_search_trgm",
+    TENANT_SEARCH_TEXT.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
+
+
 class TenantUser(Base):
     """Many-to-many relationship between tenants and users with roles"""
     
     __tablename__ = "tenant_users"
+    __table_args__ = (
+        # Filtered member listings (active only, by role) within a tenant
+        Index("ix_tenant_users_tenant_active_role", "tenant_id", "is_active", "role"),
+    )
     
     tenant_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
@@ -3,7 +3,7 @@ User model for authentication and profile management
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -11,6 +11,18 @@ from sqlalchemy.sql import func
 from app.models.base import Base, SoftDeleteMixin
 
 
+# Fields exposed in auth responses
+PUBLIC_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "display_name",
+    "avatar_url",
+    "system_role",
+    "is_verified",
+)
+
 class User(Base, SoftDeleteMixin):
     """User model with authentication and profile data"""
     
@@ -97,6 +109,12 @@ class User(Base, SoftDeleteMixin):
         self.last_login_at = datetime.utcnow()
         self.login_count += 1
     
+    def public_dict(self) -> Dict[str, Any]:
+        """Get the public profile fields returned by auth endpoints"""
+        # Read loaded state directly to skip instrumented attribute access
+        state = self.__dict__
+        return {field: state.get(field) for field in PUBLIC_FIELDS}
+    
     @property
     def full_name(self) -> str:
         """Get full name"""
@@ -159,12 +177,19 @@ class UserSession(Base):
     """User session management"""
     
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        # Active-session listing and per-user revocation lookups
+        Index("ix_user_sessions_user_id_active", "user_id", postgresql_where=text("is_active")),
+        Index("ix_user_sessions_id_user_id", "id", "user_id"),
+    )
     
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     session_token = Column(String(255), unique=True, nullable=False, index=True)
     refresh_token = Column(String(255), unique=True, nullable=True, index=True)
     expires_at = Column(DateTime, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+    last_accessed = Column(DateTime, nullable=True)
+    revoked_at = Column(DateTime, nullable=True)
     
     # Session metadata
     ip_address = Column(String(45), nullable=True)  # IPv6 compatible
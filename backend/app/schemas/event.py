@@ -3,7 +3,7 @@ Event schemas for request/response validation
 """
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, Field, field_validator, validator, root_validator
 from enum import Enum
 
 from app.models.event import EventType, EventStatus, EventVisibility
@@ -271,6 +271,9 @@ class EventStats(BaseModel):
 # Response schemas
 class EventResponse(EventBase):
     """Schema for event responses"""
+    # Documents the payload built by event_service.serialize_event; not validated from ORM rows,
+    # since the Event flags are methods there and are computed by event_flags instead
+    
     id: str = Field(..., description="Event ID")
     tenant_id: str = Field(..., description="Tenant ID")
     
@@ -342,7 +345,7 @@ class EventResponse(EventBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    # Computed properties
+    # Computed properties, filled in by event_service.event_flags
     is_published: bool = Field(..., description="Whether event is published")
     is_registration_open: bool = Field(..., description="Whether registration is open")
     is_team_formation_open: bool = Field(..., description="Whether team formation is open")
@@ -351,13 +354,49 @@ class EventResponse(EventBase):
     capacity_remaining: Optional[int] = Field(None, description="Remaining capacity")
     is_at_capacity: bool = Field(..., description="Whether at capacity")
     
-    class Config:
-        from_attributes = True
+    @field_validator('id', 'tenant_id', mode='before')
+    @classmethod
+    def stringify_uuid(cls, v):
+        """Accept UUID primary keys straight from the ORM row"""
+        return str(v)
+
+
+class EventSummary(BaseModel):
+    """Schema for the narrow event rows returned by list endpoints"""
+    id: str = Field(..., description="Event ID")
+    tenant_id: str = Field(..., description="Tenant ID")
+    name: str
+    slug: str
+    short_description: Optional[str] = None
+    event_type: EventType
+    status: EventStatus
+    visibility: EventVisibility
+    timezone: str
+    start_at: datetime
+    end_at: datetime
+    registration_start_at: Optional[datetime] = None
+    registration_end_at: Optional[datetime] = None
+    capacity: Optional[int] = None
+    registered_count: int = 0
+    venue_city: Optional[str] = None
+    venue_country: Optional[str] = None
+    logo_url: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    # Computed in SQL by the list query
+    is_published: bool
+    is_registration_open: bool
+    is_team_formation_open: bool
+    is_submission_open: bool
+    is_judging_period: bool
+    capacity_remaining: Optional[int] = None
+    is_at_capacity: bool
 
 
 class EventListResponse(BaseModel):
     """Schema for paginated event list responses"""
-    events: List[EventResponse] = Field(..., description="List of events")
+    events: List[EventSummary] = Field(..., description="List of events")
     total: int = Field(..., description="Total number of events")
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Events per page")
@@ -484,3 +523,12 @@ class WaitlistStats(BaseModel):
     total_converted: int
     conversion_rate: float
     average_wait_time: Optional[float] = None  # in hours
+
+
+class EventOverview(BaseModel):
+    """Combined payload for the event detail page"""
+    event: EventResponse
+    schedule: List[ScheduleItem]
+    rooms: List[Room]
+    capacity: Dict[str, Any]
+    waitlist: WaitlistStats
@@ -1,32 +1,174 @@
 """
 Event management service with comprehensive business logic
 """
+import base64
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, text
+
+import orjson
+from cachetools import LRUCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, case, func, lambda_stmt, select, text, tuple_, update
+from sqlalchemy.engine import Row, RowMapping
 from sqlalchemy.exc import IntegrityError
 
 from app.models.event import Event, EventStatus, EventType, EventVisibility
 from app.models.user import User
 from app.schemas.event import (
-    EventCreate, EventUpdate, EventStatusUpdate, EventResponse,
+    EventCreate, EventUpdate, EventStatusUpdate, EventResponse, EventSummary,
     EventWizardStep1, EventWizardStep2, EventWizardStep3, 
     EventWizardStep4, EventWizardStep5, EventWizardStep6,
     ScheduleItem, Room, ConflictDetection, WaitlistEntry, WaitlistStats
 )
 from app.services.base_tenant_service import TenantScopedService
+from app.core.cache import wizard_cache
 from app.core.database_utils import TenantManager
+from app.core.exceptions import ServiceValidationError
+
+
+# Event columns exposed by EventResponse
+EVENT_RESPONSE_COLUMNS = tuple(
+    name for name in EventResponse.model_fields if name in Event.__table__.columns
+)
+
+# Narrow projection for list endpoints; skips the long text and JSONB columns
+EVENT_LIST_COLUMNS = tuple(
+    name for name in EventSummary.model_fields if name in Event.__table__.columns
+)
+
+# Status values used by serialize_event, resolved once instead of per call
+_DRAFT = EventStatus.DRAFT.value
+_IN_PROGRESS = EventStatus.IN_PROGRESS.value
+_REGISTRATION_STATUSES = frozenset({EventStatus.REGISTRATION_OPEN.value, EventStatus.PUBLISHED.value})
+
+# Columns the EventResponse flags are computed from
+EVENT_FLAG_INPUTS = (
+    "status", "capacity", "registered_count", "team_formation_enabled",
+    "registration_start_at", "registration_end_at",
+    "team_formation_start_at", "team_formation_end_at",
+    "submission_start_at", "submission_end_at",
+    "judging_start_at", "judging_end_at"
+)
+
+# Serialized event columns keyed by (tenant_id, id, updated_at). Every write bumps
+# updated_at, so entries never go stale; the time-dependent flags are added per request.
+event_payload_cache = LRUCache(maxsize=4096)
+
+# Upper bound for the upcoming-events total; counting further adds cost but no UI value
+UPCOMING_COUNT_LIMIT = 10_000
+
+
+def encode_event_cursor(start_at: datetime, event_id: Any) -> str:
+    """Encode the (start_at, id) keyset position of the last row on a page"""
+    return base64.urlsafe_b64encode(orjson.dumps([start_at.isoformat(), str(event_id)])).decode()
+
+
+def decode_event_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_event_cursor"""
+    try:
+        start_at, event_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(start_at), UUID(event_id)
+    except (ValueError, TypeError) as e:
+        raise ServiceValidationError("Invalid cursor") from e
+
+
+def _in_window(now: datetime, start: Optional[datetime], end: Optional[datetime]) -> bool:
+    """Whether now falls inside an optional [start, end] window"""
+    return not (start and now < start) and not (end and now > end)
+
+
+def event_flags(values: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """Compute the EventResponse flags from an event's column values"""
+    # Same rules as the Event flag methods, evaluated once against a single `now`
+    event_status = values["status"]
+    capacity = values["capacity"]
+    registered = values["registered_count"]
+    
+    return {
+        "is_published": event_status != _DRAFT,
+        "is_registration_open": (
+            event_status in _REGISTRATION_STATUSES
+            and _in_window(now, values["registration_start_at"], values["registration_end_at"])
+            and not (capacity and registered >= capacity)
+        ),
+        "is_team_formation_open": bool(values["team_formation_enabled"]) and _in_window(
+            now, values["team_formation_start_at"], values["team_formation_end_at"]
+        ),
+        "is_submission_open": (
+            _in_window(now, values["submission_start_at"], values["submission_end_at"])
+            and event_status == _IN_PROGRESS
+        ),
+        "is_judging_period": _in_window(now, values["judging_start_at"], values["judging_end_at"]),
+        "capacity_remaining": None if capacity is None else max(0, capacity - registered),
+        "is_at_capacity": capacity is not None and registered >= capacity
+    }
+
+
+def serialize_event(event: Event) -> Dict[str, Any]:
+    """Build the EventResponse payload directly from an Event row"""
+    # orjson handles the datetime/UUID values natively
+    data = {name: getattr(event, name) for name in EVENT_RESPONSE_COLUMNS}
+    data.update(event_flags(data, datetime.utcnow()))
+    return data
+
+
+def _payload_entry(event: Event) -> Tuple[bytes, Dict[str, Any]]:
+    """Pre-serialize an event's columns, keeping the inputs the flags need"""
+    data = {name: getattr(event, name) for name in EVENT_RESPONSE_COLUMNS}
+    # Drop the closing brace so the flags can be appended per request
+    return orjson.dumps(data)[:-1] + b",", {name: data[name] for name in EVENT_FLAG_INPUTS}
+
+
+def _window_open(start_column, end_column, now: datetime):
+    """SQL form of the model's "not before start, not after end" checks"""
+    return and_(
+        or_(start_column.is_(None), start_column <= now),
+        or_(end_column.is_(None), end_column >= now)
+    )
+
+
+def event_flag_columns(now: datetime) -> List[Any]:
+    """SQL equivalents of the Event flag methods, labelled as response keys"""
+    return [
+        (Event.status != EventStatus.DRAFT.value).label("is_published"),
+        and_(
+            Event.status.in_([EventStatus.REGISTRATION_OPEN.value, EventStatus.PUBLISHED.value]),
+            _window_open(Event.registration_start_at, Event.registration_end_at, now),
+            or_(Event.capacity.is_(None), Event.registered_count < Event.capacity)
+        ).label("is_registration_open"),
+        and_(
+            Event.team_formation_enabled.is_(True),
+            _window_open(Event.team_formation_start_at, Event.team_formation_end_at, now)
+        ).label("is_team_formation_open"),
+        and_(
+            Event.status == EventStatus.IN_PROGRESS.value,
+            _window_open(Event.submission_start_at, Event.submission_end_at, now)
+        ).label("is_submission_open"),
+        _window_open(Event.judging_start_at, Event.judging_end_at, now).label("is_judging_period"),
+        case(
+            (Event.capacity.is_(None), None),
+            else_=func.greatest(Event.capacity - Event.registered_count, 0)
+        ).label("capacity_remaining"),
+        and_(
+            Event.capacity.isnot(None),
+            Event.registered_count >= Event.capacity
+        ).label("is_at_capacity"),
+    ]
 
 
 class EventService:
     """Event management service with full lifecycle support"""
     
-    def __init__(self, db: Session, tenant_id: str):
+    def __init__(self, db: AsyncSession, tenant_id: str):
         self.db = db
         self.tenant_id = tenant_id
-        self.tenant_manager = TenantManager(db, tenant_id)
+    
+    @cached_property
+    def tenant_manager(self) -> TenantManager:
+        """Tenant RLS helper, created on first use"""
+        return TenantManager()
     
     # Basic CRUD operations
     
@@ -37,32 +179,80 @@ class EventService:
         
         event = Event(**event_dict)
         self.db.add(event)
-        self.db.commit()
-        self.db.refresh(event)
+        await self.db.commit()
+        await self.db.refresh(event)
         return event
     
     async def get(self, event_id: str) -> Optional[Event]:
         """Get event by ID"""
-        return self.db.query(Event).filter(
-            and_(
+        # lambda_stmt caches the built statement too; the closure values become bound params
+        tenant_id = self.tenant_id
+        return await self.db.scalar(lambda_stmt(
+            lambda: select(Event).where(
+                Event.id == event_id,
+                Event.tenant_id == tenant_id,
+                Event.deleted_at.is_(None)
+            )
+        ))
+    
+    async def get_event_json(self, event_id: str) -> Optional[bytes]:
+        """Get the serialized event by ID, reusing cached bytes while it is unchanged"""
+        tenant_id = self.tenant_id
+        version = (await self.db.execute(lambda_stmt(
+            lambda: select(Event.id, Event.updated_at).where(
                 Event.id == event_id,
-                Event.tenant_id == self.tenant_id,
+                Event.tenant_id == tenant_id,
                 Event.deleted_at.is_(None)
             )
-        ).first()
+        ))).first()
+        return await self._render_event_json(version)
+    
+    async def get_event_json_by_slug(self, slug: str) -> Optional[bytes]:
+        """Get the serialized event by slug, reusing cached bytes while it is unchanged"""
+        tenant_id = self.tenant_id
+        version = (await self.db.execute(lambda_stmt(
+            lambda: select(Event.id, Event.updated_at).where(
+                Event.tenant_id == tenant_id,
+                Event.slug == slug,
+                Event.deleted_at.is_(None)
+            )
+        ))).first()
+        return await self._render_event_json(version)
+    
+    async def _render_event_json(self, version: Optional[Row]) -> Optional[bytes]:
+        """Render an event from its (id, updated_at) version, loading the row only on a miss"""
+        if version is None:
+            return None
+        
+        entry = event_payload_cache.get((self.tenant_id, version.id, version.updated_at))
+        if entry is None:
+            event = await self.get(version.id)
+            if not event:
+                return None
+            entry = _payload_entry(event)
+            event_payload_cache[(self.tenant_id, event.id, event.updated_at)] = entry
+        
+        columns, flag_inputs = entry
+        return columns + orjson.dumps(event_flags(flag_inputs, datetime.utcnow()))[1:]
+    
+    async def _invalidate_cached_event(self, event: Event) -> None:
+        """Drop cached state for an event after it changes"""
+        # Serialized payloads are keyed by updated_at, so only the wizard draft needs dropping
+        await wizard_cache.invalidate(self.tenant_id, event.id)
     
     async def update(self, event_id: str, update_dict: Dict[str, Any]) -> Event:
         """Update event"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         for key, value in update_dict.items():
             if hasattr(event, key):
                 setattr(event, key, value)
         
-        self.db.commit()
-        self.db.refresh(event)
+        await self.db.commit()
+        await self.db.refresh(event)
+        await self._invalidate_cached_event(event)
         return event
     
     async def delete(self, event_id: str) -> bool:
@@ -72,7 +262,8 @@ class EventService:
             return False
         
         event.deleted_at = datetime.utcnow()
-        self.db.commit()
+        await self.db.commit()
+        await self._invalidate_cached_event(event)
         return True
     
     # Core CRUD operations
@@ -82,7 +273,7 @@ class EventService:
         # Check slug uniqueness within tenant
         existing = await self.get_by_slug(event_data.slug)
         if existing:
-            raise ValueError(f"Event with slug '{event_data.slug}' already exists")
+            raise ServiceValidationError(f"Event with slug '{event_data.slug}' already exists")
         
         # Create event data dictionary
         event_dict = event_data.dict(exclude_unset=True, exclude={
@@ -187,70 +378,135 @@ class EventService:
     
     async def get_by_slug(self, slug: str) -> Optional[Event]:
         """Get event by slug within tenant"""
-        return self.db.query(Event).filter(
-            and_(
-                Event.tenant_id == self.tenant_id,
+        tenant_id = self.tenant_id
+        return await self.db.scalar(lambda_stmt(
+            lambda: select(Event).where(
+                Event.tenant_id == tenant_id,
                 Event.slug == slug,
                 Event.deleted_at.is_(None)
             )
-        ).first()
+        ))
     
-    async def get_events_list(
+    def _list_filters(
         self,
-        skip: int = 0,
-        limit: int = 100,
+        now: datetime,
         status: Optional[EventStatus] = None,
         event_type: Optional[EventType] = None,
         visibility: Optional[EventVisibility] = None,
         search: Optional[str] = None,
         upcoming_only: bool = False,
         published_only: bool = False
-    ) -> Tuple[List[Event], int]:
-        """Get paginated list of events with filtering"""
-        query = self.db.query(Event).filter(
-            and_(
-                Event.tenant_id == self.tenant_id,
-                Event.deleted_at.is_(None)
-            )
-        )
+    ) -> List[Any]:
+        """Build the WHERE clauses shared by the list endpoints"""
+        filters = [
+            Event.tenant_id == self.tenant_id,
+            Event.deleted_at.is_(None)
+        ]
         
-        # Apply filters
         if status:
-            query = query.filter(Event.status == status.value)
+            filters.append(Event.status == status.value)
         
         if event_type:
-            query = query.filter(Event.event_type == event_type.value)
+            filters.append(Event.event_type == event_type.value)
         
         if visibility:
-            query = query.filter(Event.visibility == visibility.value)
+            filters.append(Event.visibility == visibility.value)
         
         if search:
-            search_filter = or_(
+            filters.append(or_(
                 Event.name.ilike(f"%{search}%"),
                 Event.description.ilike(f"%{search}%"),
                 Event.short_description.ilike(f"%{search}%")
-            )
-            query = query.filter(search_filter)
+            ))
         
         if upcoming_only:
-            query = query.filter(Event.start_at > datetime.utcnow())
+            filters.append(Event.start_at > now)
         
         if published_only:
-            query = query.filter(Event.status != EventStatus.DRAFT.value)
+            filters.append(Event.status != EventStatus.DRAFT.value)
         
-        # Get total count
-        total = query.count()
+        return filters
+    
+    def _list_select(self, now: datetime):
+        """Select the summary columns with the flags computed in SQL"""
+        # Computed flags come back as columns, so no Event entities are built for lists
+        return select(
+            *(getattr(Event, name) for name in EVENT_LIST_COLUMNS),
+            *event_flag_columns(now)
+        )
+    
+    async def get_events_list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[EventStatus] = None,
+        event_type: Optional[EventType] = None,
+        visibility: Optional[EventVisibility] = None,
+        search: Optional[str] = None,
+        upcoming_only: bool = False,
+        published_only: bool = False
+    ) -> Tuple[List[RowMapping], int]:
+        """Get offset-paginated list of events with filtering"""
+        now = datetime.utcnow()
+        filters = self._list_filters(
+            now, status, event_type, visibility, search, upcoming_only, published_only
+        )
         
-        # Apply pagination and ordering
-        events = query.order_by(Event.start_at.desc()).offset(skip).limit(limit).all()
+        # Get total count, bounded for the open-ended upcoming listing
+        counted = select(Event.id).where(*filters)
+        if upcoming_only:
+            counted = counted.limit(UPCOMING_COUNT_LIMIT)
+        total = await self.db.scalar(select(func.count()).select_from(counted.subquery()))
+        
+        stmt = (
+            self._list_select(now)
+            .where(*filters)
+            .order_by(Event.start_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        # Fetched up front so the connection is released before the body is sent
+        events = (await self.db.execute(stmt)).mappings().all()
         
         return events, total
     
+    async def get_events_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        status: Optional[EventStatus] = None,
+        event_type: Optional[EventType] = None,
+        visibility: Optional[EventVisibility] = None,
+        search: Optional[str] = None,
+        upcoming_only: bool = False,
+        published_only: bool = False
+    ) -> List[RowMapping]:
+        """Get keyset-paginated list of events; no COUNT(*) is issued.
+        
+        Fetches up to limit + 1 rows: an extra row means another page exists.
+        """
+        now = datetime.utcnow()
+        filters = self._list_filters(
+            now, status, event_type, visibility, search, upcoming_only, published_only
+        )
+        
+        if cursor:
+            cursor_start_at, cursor_id = decode_event_cursor(cursor)
+            filters.append(tuple_(Event.start_at, Event.id) < tuple_(cursor_start_at, cursor_id))
+        
+        stmt = (
+            self._list_select(now)
+            .where(*filters)
+            .order_by(Event.start_at.desc(), Event.id.desc())
+            .limit(limit + 1)
+        )
+        return (await self.db.execute(stmt)).mappings().all()
+    
     async def update_event(self, event_id: str, update_data: EventUpdate, updater_id: str) -> Event:
         """Update event with validation"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         # Validate status transitions
         if hasattr(update_data, 'status') and update_data.status:
@@ -276,7 +532,7 @@ class EventService:
         """Update event status with validation and logging"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         old_status = event.status
         new_status = status_update.status
@@ -286,8 +542,9 @@ class EventService:
         
         # Update status
         event.status = new_status.value
-        self.db.commit()
-        self.db.refresh(event)
+        await self.db.commit()
+        await self.db.refresh(event)
+        await self._invalidate_cached_event(event)
         
         # Log status change
         await self._log_event_action(
@@ -309,15 +566,15 @@ class EventService:
         """Publish an event (move from DRAFT to PUBLISHED)"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         if event.status != EventStatus.DRAFT.value:
-            raise ValueError("Only draft events can be published")
+            raise ServiceValidationError("Only draft events can be published")
         
         # Validate event is ready for publishing
         validation_errors = await self._validate_event_for_publishing(event)
         if validation_errors:
-            raise ValueError(f"Event validation failed: {', '.join(validation_errors)}")
+            raise ServiceValidationError(f"Event validation failed: {', '.join(validation_errors)}")
         
         # Update status to published
         await self.update_event_status(
@@ -391,6 +648,9 @@ class EventService:
         
         event = await self.create_event(event_data, creator_id)
         
+        # The UI moves straight on to step 2, so keep the draft at hand for it
+        await wizard_cache.set(self.tenant_id, event.id, event.to_dict())
+        
         return {
             "success": True,
             "event_id": str(event.id),
@@ -417,9 +677,9 @@ class EventService:
         )
         
         try:
-            await self.update_event(event_id, update_data, updater_id)
+            await self._apply_wizard_step(event_id, update_data, updater_id)
             return {"success": True, "next_step": 3}
-        except ValueError as e:
+        except ServiceValidationError as e:
             return {"success": False, "error": str(e)}
     
     async def update_event_wizard_step3(
@@ -435,9 +695,9 @@ class EventService:
         )
         
         try:
-            await self.update_event(event_id, update_data, updater_id)
+            await self._apply_wizard_step(event_id, update_data, updater_id)
             return {"success": True, "next_step": 4}
-        except ValueError as e:
+        except ServiceValidationError as e:
             return {"success": False, "error": str(e)}
     
     async def update_event_wizard_step4(
@@ -456,9 +716,9 @@ class EventService:
         )
         
         try:
-            await self.update_event(event_id, update_data, updater_id)
+            await self._apply_wizard_step(event_id, update_data, updater_id)
             return {"success": True, "next_step": 5}
-        except ValueError as e:
+        except ServiceValidationError as e:
             return {"success": False, "error": str(e)}
     
     async def update_event_wizard_step5(
@@ -478,9 +738,9 @@ class EventService:
         )
         
         try:
-            await self.update_event(event_id, update_data, updater_id)
+            await self._apply_wizard_step(event_id, update_data, updater_id)
             return {"success": True, "next_step": 6}
-        except ValueError as e:
+        except ServiceValidationError as e:
             return {"success": False, "error": str(e)}
     
     async def update_event_wizard_step6(
@@ -501,7 +761,9 @@ class EventService:
         )
         
         try:
+            # Final step goes through the regular path for one definitive read
             event = await self.update_event(event_id, update_data, updater_id)
+            await wizard_cache.invalidate(self.tenant_id, event.id)
             
             # Check if event is ready for publishing
             validation_errors = await self._validate_event_for_publishing(event)
@@ -513,17 +775,55 @@ class EventService:
                 "can_publish": can_publish,
                 "validation_errors": validation_errors if not can_publish else []
             }
-        except ValueError as e:
+        except ServiceValidationError as e:
             return {"success": False, "error": str(e)}
     
+    async def _apply_wizard_step(self, event_id: str, update_data: EventUpdate, updater_id: str) -> None:
+        """Apply a wizard step as a single UPDATE on top of the draft cached by the previous step"""
+        state = await wizard_cache.get(self.tenant_id, event_id)
+        if state is not None:
+            update_dict = update_data.dict(exclude_unset=True, exclude_none=True)
+            values = {key: value for key, value in update_dict.items() if key in Event.__table__.columns}
+            values["custom_fields"] = self._with_audit_entry(
+                state["custom_fields"], "updated", updater_id, update_dict
+            )
+            
+            # The draft is only current while the row is untouched; any other write bumps updated_at
+            result = await self.db.execute(
+                update(Event)
+                .where(
+                    Event.id == event_id,
+                    Event.tenant_id == self.tenant_id,
+                    Event.deleted_at.is_(None),
+                    Event.updated_at == datetime.fromisoformat(state["updated_at"])
+                )
+                .values(**values)
+                .returning(Event.updated_at)
+            )
+            updated_at = result.scalar_one_or_none()
+            await self.db.commit()
+            
+            if updated_at is not None:
+                state.update(values, updated_at=updated_at)
+                await wizard_cache.set(self.tenant_id, event_id, state)
+                return
+        
+        # No draft, or the row changed since it was cached: take the regular path and re-prime
+        event = await self.update_event(event_id, update_data, updater_id)
+        await wizard_cache.set(self.tenant_id, event.id, event.to_dict())
+    
     # Schedule management
     
     async def get_event_schedule(self, event_id: str) -> List[ScheduleItem]:
         """Get event schedule items"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
+        return self._schedule_items(event)
+    
+    def _schedule_items(self, event: Event) -> List[ScheduleItem]:
+        """Parse the schedule stored on an event row"""
         # Get schedule from custom_fields or dedicated schedule table
         schedule_data = event.custom_fields.get('schedule', [])
         return [ScheduleItem(**item) for item in schedule_data]
@@ -537,12 +837,12 @@ class EventService:
         """Add schedule item with conflict detection"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         # Check for conflicts
         conflicts = await self.detect_schedule_conflicts(event_id, schedule_item)
         if conflicts.has_conflicts:
-            raise ValueError(f"Schedule conflicts detected: {conflicts.conflicts}")
+            raise ServiceValidationError(f"Schedule conflicts detected: {conflicts.conflicts}")
         
         # Add to schedule
         schedule_data = event.custom_fields.get('schedule', [])
@@ -612,16 +912,21 @@ class EventService:
         """Get event rooms/spaces"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
+        return self._rooms(event)
+    
+    def _rooms(self, event: Event) -> List[Room]:
+        """Read the rooms stored on an event row"""
+        # Stored rooms were validated by add_room, so skip revalidating them
         rooms_data = event.custom_fields.get('rooms', [])
-        return [Room(**room) for room in rooms_data]
+        return [Room.model_construct(**room) for room in rooms_data]
     
     async def add_room(self, event_id: str, room: Room, creator_id: str) -> Room:
         """Add room to event"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         rooms_data = event.custom_fields.get('rooms', [])
         
@@ -664,8 +969,12 @@ class EventService:
         """Get detailed capacity information"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
+        return self._capacity_info(event)
+    
+    def _capacity_info(self, event: Event) -> Dict[str, Any]:
+        """Summarize capacity from an event row"""
         return {
             "capacity": event.capacity,
             "registered": event.registered_count,
@@ -680,10 +989,10 @@ class EventService:
         """Add user to event waitlist"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         if not event.is_at_capacity():
-            raise ValueError("Event is not at capacity, no waitlist needed")
+            raise ServiceValidationError("Event is not at capacity, no waitlist needed")
         
         # Get current waitlist
         waitlist_data = event.custom_fields.get('waitlist', [])
@@ -691,7 +1000,7 @@ class EventService:
         # Check if user already on waitlist
         for entry in waitlist_data:
             if entry['user_id'] == user_id:
-                raise ValueError("User already on waitlist")
+                raise ServiceValidationError("User already on waitlist")
         
         # Create waitlist entry
         position = len(waitlist_data) + 1
@@ -718,7 +1027,7 @@ class EventService:
         """Process waitlist when spots become available"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         waitlist_data = event.custom_fields.get('waitlist', [])
         waiting_entries = [entry for entry in waitlist_data if entry['status'] == 'waiting']
@@ -734,7 +1043,8 @@ class EventService:
             entry['notified_at'] = datetime.utcnow().isoformat()
             entry['expires_at'] = (datetime.utcnow() + timedelta(hours=24)).isoformat()
             
-            notified_entries.append(WaitlistEntry(**entry))
+            # Entries come from our own stored waitlist and are only echoed back
+            notified_entries.append(WaitlistEntry.model_construct(**entry))
         
         # Update waitlist
         await self.update_event(
@@ -749,8 +1059,12 @@ class EventService:
         """Get waitlist statistics"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
+        return self._waitlist_stats(event)
+    
+    def _waitlist_stats(self, event: Event) -> WaitlistStats:
+        """Compute waitlist statistics from an event row"""
         waitlist_data = event.custom_fields.get('waitlist', [])
         
         total_waiting = len([e for e in waitlist_data if e['status'] == 'waiting'])
@@ -780,13 +1094,28 @@ class EventService:
             average_wait_time=average_wait_time
         )
     
+    async def get_event_overview(self, event_id: str) -> Dict[str, Any]:
+        """Get the event with its schedule, rooms, capacity and waitlist in one read"""
+        # All four sections live on the event row, so one SELECT serves them all
+        event = await self.get(event_id)
+        if not event:
+            raise ServiceValidationError("Event not found")
+        
+        return {
+            "event": serialize_event(event),
+            "schedule": [item.dict() for item in self._schedule_items(event)],
+            "rooms": [room.dict() for room in self._rooms(event)],
+            "capacity": self._capacity_info(event),
+            "waitlist": self._waitlist_stats(event).dict()
+        }
+    
     # Event statistics and analytics
     
     async def get_event_analytics(self, event_id: str) -> Dict[str, Any]:
         """Get comprehensive event analytics"""
         event = await self.get(event_id)
         if not event:
-            raise ValueError("Event not found")
+            raise ServiceValidationError("Event not found")
         
         capacity_info = await self.get_capacity_info(event_id)
         waitlist_stats = await self.get_waitlist_stats(event_id)
@@ -847,7 +1176,7 @@ class EventService:
         }
         
         if new_status not in allowed_transitions.get(current_status, []):
-            raise ValueError(
+            raise ServiceValidationError(
                 f"Invalid status transition from {current_status.value} to {new_status.value}"
             )
     
@@ -897,17 +1226,26 @@ class EventService:
         # For now, we'll add to event custom_fields
         event = await self.get(event_id)
         if event:
-            audit_log = event.custom_fields.get('audit_log', [])
-            audit_log.append({
-                "timestamp": datetime.utcnow().isoformat(),
-                "action": action,
-                "user_id": user_id,
-                "metadata": metadata
-            })
-            
-            # Keep only last 100 audit entries
-            if len(audit_log) > 100:
-                audit_log = audit_log[-100:]
-            
-            event.custom_fields = {**event.custom_fields, 'audit_log': audit_log}
-            self.db.commit()
+            event.custom_fields = self._with_audit_entry(event.custom_fields, action, user_id, metadata)
+            await self.db.commit()
+            await self._invalidate_cached_event(event)
+    
+    def _with_audit_entry(
+        self,
+        custom_fields: Dict[str, Any],
+        action: str,
+        user_id: str,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Return custom_fields with an audit entry appended"""
+        audit_log = list(custom_fields.get('audit_log', []))
+        audit_log.append({
+            "timestamp": datetime.utcnow().isoformat(),
+            "action": action,
+            "user_id": user_id,
+            # Round-trip through orjson so datetimes and enums are JSONB-safe
+            "metadata": orjson.loads(orjson.dumps(metadata))
+        })
+        
+        # Keep only last 100 audit entries
+        return {**custom_fields, 'audit_log': audit_log[-100:]}
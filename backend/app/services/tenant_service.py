@@ -10,21 +10,47 @@ This service handles all tenant-related operations including:
 
 import secrets
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from uuid import UUID, uuid4
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, func, select, update
+from sqlalchemy import Float, Numeric, and_, cast, func, select, update
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.exc import IntegrityError
 
+from app.core.cache import tenant_cache
 from app.core.config import settings
-from app.models.tenant import Tenant, TenantUser, TenantStatus, TenantPlan
+from app.core.usage import USAGE_METRICS, usage_counter
+from app.models.tenant import TENANT_SEARCH_TEXT, TENANT_SLUG_INDEX, Tenant, TenantUser, TenantStatus, TenantPlan
 from app.models.user import User
 from app.core.rbac import RBACManager, SystemRole, TenantRole, Permission
 
 
+# Columns projected by list_tenants; the JSONB config columns are never loaded
+TENANT_SUMMARY_COLUMNS = (
+    Tenant.id,
+    Tenant.name,
+    Tenant.slug,
+    Tenant.plan,
+    Tenant.status,
+    Tenant.current_events,
+    Tenant.max_events,
+    Tenant.created_at,
+    cast(
+        func.coalesce(
+            func.round(cast(Tenant.current_events, Numeric) * 100 / func.nullif(Tenant.max_events, 0), 2),
+            0
+        ),
+        Float
+    ).label("usage_percentage"),
+)
+
+# Per-process slug -> id cache for get_tenant_by_slug; rows are always loaded through the caller's session
+_slug_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.TENANT_LOCAL_CACHE_TTL)
+
+
 class TenantService:
     """Comprehensive tenant management service."""
     
@@ -33,7 +59,7 @@ class TenantService:
     
     async def create_tenant(
         self,
-        db: Session,
+        db: AsyncSession,
         creator_user_id: UUID,
         name: str,
         slug: str,
@@ -64,14 +90,6 @@ class TenantService:
             HTTPException: If tenant creation fails or slug already exists
         """
         try:
-            # Validate slug is unique
-            existing_tenant = db.query(Tenant).filter(Tenant.slug == slug).first()
-            if existing_tenant:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Tenant slug '{slug}' already exists"
-                )
-            
             # Create tenant with default configuration
             tenant = Tenant(
                 name=name,
@@ -94,7 +112,7 @@ class TenantService:
             )
             
             db.add(tenant)
-            db.flush()  # Get tenant ID without committing
+            await db.flush()  # Get tenant ID without committing; a taken slug fails here
             
             # Add creator as tenant owner
             await self._add_tenant_user(
@@ -106,12 +124,11 @@ class TenantService:
             )
             
             # Set contact name from creator user
-            creator_user = db.query(User).filter(User.id == creator_user_id).first()
+            creator_user = await db.get(User, creator_user_id)
             if creator_user:
                 tenant.contact_name = f"{creator_user.first_name} {creator_user.last_name}"
             
-            db.commit()
-            db.refresh(tenant)
+            await db.commit()
             
             # Initialize tenant-specific data
             await self._initialize_tenant_data(db, tenant)
@@ -119,39 +136,53 @@ class TenantService:
             return tenant
             
         except IntegrityError as e:
-            db.rollback()
+            await db.rollback()
+            if TENANT_SLUG_INDEX in str(e.orig):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Tenant slug '{slug}' already exists"
+                )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to create tenant due to data conflict"
             )
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to create tenant: {str(e)}"
-            )
+        except Exception:
+            # Unexpected errors reach the app-wide handler, which logs them and returns a generic 500
+            await db.rollback()
+            raise
     
-    async def get_tenant(self, db: Session, tenant_id: UUID) -> Optional[Tenant]:
-        """Get tenant by ID."""
-        return db.query(Tenant).filter(
-            and_(Tenant.id == tenant_id, Tenant.is_deleted == False)
-        ).first()
+    async def get_tenant(self, db: AsyncSession, tenant_id: UUID) -> Optional[Tenant]:
+        """Get tenant by ID, from the session identity map when already loaded."""
+        tenant = await db.get(Tenant, tenant_id)
+        return tenant if tenant is not None and not tenant.is_deleted else None
     
-    async def get_tenant_by_slug(self, db: Session, slug: str) -> Optional[Tenant]:
-        """Get tenant by slug."""
-        return db.query(Tenant).filter(
-            and_(Tenant.slug == slug, Tenant.is_deleted == False)
-        ).first()
+    async def get_tenant_by_slug(self, db: AsyncSession, slug: str) -> Optional[Tenant]:
+        """Get tenant by slug, served from the per-process cache when enabled."""
+        if settings.TENANT_LOCAL_CACHE_ENABLED:
+            tenant_id = _slug_cache.get(slug)
+            tenant = await db.get(Tenant, tenant_id) if tenant_id else None
+            # The slug may have moved since it was cached by another worker's view
+            if tenant is not None and tenant.slug == slug and not tenant.is_deleted:
+                return tenant
+        
+        result = await db.execute(
+            select(Tenant).where(and_(Tenant.slug == slug, Tenant.is_deleted == False))
+        )
+        tenant = result.scalar_one_or_none()
+        
+        if tenant is not None and settings.TENANT_LOCAL_CACHE_ENABLED:
+            _slug_cache[slug] = tenant.id
+        return tenant
     
     async def list_tenants(
         self,
-        db: Session,
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
         status_filter: Optional[str] = None,
         plan_filter: Optional[str] = None,
         search: Optional[str] = None
-    ) -> List[Tenant]:
+    ) -> Tuple[List[RowMapping], int]:
         """
         List tenants with filtering and pagination.
         
@@ -164,35 +195,34 @@ class TenantService:
             search: Search in name, slug, or contact_email
         
         Returns:
-            List of tenants matching criteria
+            Tuple of the requested page of tenant summary rows and the total matching count
         """
-        query = db.query(Tenant).filter(Tenant.is_deleted == False)
+        # The window count rides along with the page instead of a second COUNT(*)
+        query = select(
+            *TENANT_SUMMARY_COLUMNS, func.count().over().label("total")
+        ).where(Tenant.is_deleted == False)
         
         # Apply filters
         if status_filter:
-            query = query.filter(Tenant.status == status_filter)
+            query = query.where(Tenant.status == status_filter)
         
         if plan_filter:
-            query = query.filter(Tenant.plan == plan_filter)
+            query = query.where(Tenant.plan == plan_filter)
         
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Tenant.name.ilike(search_term),
-                    Tenant.slug.ilike(search_term),
-                    Tenant.contact_email.ilike(search_term)
-                )
-            )
+            # Single concatenated expression so the trigram GIN index applies
+            query = query.where(TENANT_SEARCH_TEXT.ilike(f"%{search}%"))
         
         # Apply pagination
-        query = query.offset(skip).limit(limit)
+        query = query.order_by(Tenant.created_at.desc()).offset(skip).limit(limit)
         
-        return query.all()
+        rows = (await db.execute(query)).mappings().all()
+        total = rows[0]["total"] if rows else 0
+        return rows, total
     
     async def update_tenant(
         self,
-        db: Session,
+        db: AsyncSession,
         tenant_id: UUID,
         update_data: Dict[str, Any]
     ) -> Tenant:
@@ -234,28 +264,28 @@ class TenantService:
                 tenant.settings = {**(tenant.settings or {}), **update_data['settings']}
             
             tenant.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(tenant)
+            await db.commit()
             
+            await self._invalidate_tenant(tenant.id, tenant.slug)
             return tenant
             
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to update tenant: {str(e)}"
-            )
+        except Exception:
+            await db.rollback()
+            raise
     
-    async def delete_tenant(self, db: Session, tenant_id: UUID) -> bool:
+    async def delete_tenant(self, db: AsyncSession, tenant_id: UUID) -> bool:
         """
-        Soft delete a tenant and all associated data.
+        Schedule a tenant and all associated data for soft deletion.
+        
+        The tenant is marked as deleting here; the purge_tenant worker
+        soft deletes its data in batches and then the tenant itself.
         
         Args:
             db: Database session
             tenant_id: ID of tenant to delete
         
         Returns:
-            True if deletion successful
+            True if deletion was scheduled
         
         Raises:
             HTTPException: If tenant not found or deletion fails
@@ -268,32 +298,24 @@ class TenantService:
             )
         
         try:
-            # Soft delete tenant
-            tenant.is_deleted = True
-            tenant.deleted_at = datetime.utcnow()
-            tenant.status = TenantStatus.SUSPENDED.value
+            from app.workers.tenant_tasks import purge_tenant
             
-            # TODO: Soft delete all associated data
-            # - Events
-            # - Teams
-            # - Submissions
-            # - Tenant users
+            tenant.status = TenantStatus.DELETING.value
+            await db.commit()
+            await self._invalidate_tenant(tenant.id, tenant.slug)
             
-            db.commit()
+            purge_tenant.delay(str(tenant.id))
             return True
             
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to delete tenant: {str(e)}"
-            )
+        except Exception:
+            await db.rollback()
+            raise
     
     # Tenant User Management
     
     async def add_tenant_user(
         self,
-        db: Session,
+        db: AsyncSession,
         tenant_id: UUID,
         user_id: UUID,
         role: str,
@@ -326,7 +348,7 @@ class TenantService:
             )
         
         # Validate user exists
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -334,9 +356,12 @@ class TenantService:
             )
         
         # Check if user already exists in tenant
-        existing_tenant_user = db.query(TenantUser).filter(
-            and_(TenantUser.tenant_id == tenant_id, TenantUser.user_id == user_id)
-        ).first()
+        result = await db.execute(
+            select(TenantUser.id).where(
+                and_(TenantUser.tenant_id == tenant_id, TenantUser.user_id == user_id)
+            )
+        )
+        existing_tenant_user = result.first()
         
         if existing_tenant_user:
             raise HTTPException(
@@ -356,7 +381,7 @@ class TenantService:
     
     async def remove_tenant_user(
         self,
-        db: Session,
+        db: AsyncSession,
         tenant_id: UUID,
         user_id: UUID
     ) -> bool:
@@ -374,9 +399,12 @@ class TenantService:
         Raises:
             HTTPException: If tenant user not found
         """
-        tenant_user = db.query(TenantUser).filter(
-            and_(TenantUser.tenant_id == tenant_id, TenantUser.user_id == user_id)
-        ).first()
+        result = await db.execute(
+            select(TenantUser).where(
+                and_(TenantUser.tenant_id == tenant_id, TenantUser.user_id == user_id)
+            )
+        )
+        tenant_user = result.scalar_one_or_none()
         
         if not tenant_user:
             raise HTTPException(
@@ -385,20 +413,18 @@ class TenantService:
             )
         
         try:
-            db.delete(tenant_user)
-            db.commit()
+            await db.delete(tenant_user)
+            await db.commit()
+            await tenant_cache.invalidate_users(tenant_id)
             return True
             
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to remove user from tenant: {str(e)}"
-            )
+        except Exception:
+            await db.rollback()
+            raise
     
     async def update_tenant_user_role(
         self,
-        db: Session,
+        db: AsyncSession,
         tenant_id: UUID,
         user_id: UUID,
         new_role: str,
@@ -420,9 +446,12 @@ class TenantService:
         Raises:
             HTTPException: If tenant user not found
         """
-        tenant_user = db.query(TenantUser).filter(
-            and_(TenantUser.tenant_id == tenant_id, TenantUser.user_id == user_id)
-        ).first()
+        result = await db.execute(
+            select(TenantUser).where(
+                and_(TenantUser.tenant_id == tenant_id, TenantUser.user_id == user_id)
+            )
+        )
+        tenant_user = result.scalar_one_or_none()
         
         if not tenant_user:
             raise HTTPException(
@@ -435,21 +464,18 @@ class TenantService:
             if permissions:
                 tenant_user.permissions = permissions
             
-            db.commit()
-            db.refresh(tenant_user)
+            await db.commit()
             
+            await tenant_cache.invalidate_users(tenant_id)
             return tenant_user
             
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to update tenant user role: {str(e)}"
-            )
+        except Exception:
+            await db.rollback()
+            raise
     
     async def get_tenant_users(
         self,
-        db: Session,
+        db: AsyncSession,
         tenant_id: UUID,
         role_filter: Optional[str] = None,
         active_only: bool = True
@@ -466,21 +492,66 @@ class TenantService:
         Returns:
             List of TenantUser instances
         """
-        query = db.query(TenantUser).filter(TenantUser.tenant_id == tenant_id)
+        query = select(TenantUser).where(TenantUser.tenant_id == tenant_id)
+        
+        if role_filter:
+            query = query.where(TenantUser.role == role_filter)
+        
+        if active_only:
+            query = query.where(TenantUser.is_active == True)
+        
+        result = await db.execute(query)
+        return list(result.scalars().all())
+    
+    async def get_tenant_user_details(
+        self,
+        db: AsyncSession,
+        tenant_id: UUID,
+        role_filter: Optional[str] = None,
+        active_only: bool = True
+    ) -> List[RowMapping]:
+        """
+        Get a tenant's users joined with their email and name in one query.
+        
+        Args:
+            db: Database session
+            tenant_id: ID of tenant
+            role_filter: Filter by specific role
+            active_only: Only return active users
+        
+        Returns:
+            Row mappings with the TenantUserResponse fields
+        """
+        query = (
+            select(
+                TenantUser.user_id,
+                TenantUser.tenant_id,
+                TenantUser.role,
+                TenantUser.permissions,
+                TenantUser.is_active,
+                TenantUser.joined_at,
+                TenantUser.invited_by_id,
+                User.email.label("user_email"),
+                (User.first_name + " " + User.last_name).label("user_name")
+            )
+            .join(User, User.id == TenantUser.user_id)
+            .where(TenantUser.tenant_id == tenant_id)
+        )
         
         if role_filter:
-            query = query.filter(TenantUser.role == role_filter)
+            query = query.where(TenantUser.role == role_filter)
         
         if active_only:
-            query = query.filter(TenantUser.is_active == True)
+            query = query.where(TenantUser.is_active == True)
         
-        return query.all()
+        result = await db.execute(query)
+        return list(result.mappings().all())
     
     # Usage Tracking and Billing
     
     async def track_usage(
         self,
-        db: Session,
+        db: AsyncSession,
         tenant_id: UUID,
         metric: str,
         amount: int = 1
@@ -488,6 +559,9 @@ class TenantService:
         """
         Track usage for a specific metric.
         
+        Increments are buffered in Redis and written to the tenant row in
+        batches by the usage flusher; without Redis they are applied directly.
+        
         Args:
             db: Database session
             tenant_id: ID of tenant
@@ -500,38 +574,54 @@ class TenantService:
         Raises:
             HTTPException: If tenant not found or usage limit exceeded
         """
-        tenant = await self.get_tenant(db, tenant_id)
-        if not tenant:
+        current_column, max_column = USAGE_METRICS[metric]
+        result = await db.execute(
+            select(getattr(Tenant, current_column), getattr(Tenant, max_column)).where(
+                and_(Tenant.id == tenant_id, Tenant.is_deleted == False)
+            )
+        )
+        row = result.first()
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Tenant not found"
             )
         
-        # Check usage limits
-        current_usage = getattr(tenant, f"current_{metric}", 0)
-        max_usage = getattr(tenant, f"max_{metric}", 0)
+        stored_usage, max_usage = row
+        
+        # Buffer first so concurrent increments are counted before the limit check
+        pending = await usage_counter.incr(tenant_id, metric, amount)
+        if pending is not None:
+            current_usage = stored_usage + pending - amount
+            if current_usage + amount > max_usage:
+                await usage_counter.incr(tenant_id, metric, -amount)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Usage limit exceeded for {metric}. Current: {current_usage}, Max: {max_usage}"
+                )
+            return True
         
-        if current_usage + amount > max_usage:
+        # Check usage limits
+        if stored_usage + amount > max_usage:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Usage limit exceeded for {metric}. Current: {current_usage}, Max: {max_usage}"
+                detail=f"Usage limit exceeded for {metric}. Current: {stored_usage}, Max: {max_usage}"
             )
         
         try:
             # Update usage counter
-            setattr(tenant, f"current_{metric}", current_usage + amount)
-            db.commit()
+            column = getattr(Tenant, current_column)
+            await db.execute(update(Tenant).where(Tenant.id == tenant_id).values({column: column + amount}))
+            await db.commit()
             
+            await self._invalidate_tenant(tenant_id)
             return True
             
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to track usage: {str(e)}"
-            )
+        except Exception:
+            await db.rollback()
+            raise
     
-    async def get_usage_stats(self, db: Session, tenant_id: UUID) -> Dict[str, Any]:
+    async def get_usage_stats(self, db: AsyncSession, tenant_id: UUID) -> Dict[str, Any]:
         """
         Get usage statistics for a tenant.
         
@@ -549,31 +639,22 @@ class TenantService:
                 detail="Tenant not found"
             )
         
+        # Stored counters plus increments still buffered in Redis
+        pending = await usage_counter.pending(tenant_id)
+        usage = {}
+        for metric, (current_column, max_column) in USAGE_METRICS.items():
+            current = getattr(tenant, current_column) + pending.get(metric, 0)
+            maximum = getattr(tenant, max_column)
+            usage[metric] = {
+                "current": current,
+                "max": maximum,
+                "percentage": (current / maximum) * 100 if maximum > 0 else 0
+            }
+        
         return {
             "plan": tenant.plan,
             "status": tenant.status,
-            "usage": {
-                "events": {
-                    "current": tenant.current_events,
-                    "max": tenant.max_events,
-                    "percentage": tenant.get_usage_percentage("events")
-                },
-                "participants": {
-                    "current": tenant.current_participants,
-                    "max": tenant.max_participants_per_event,
-                    "percentage": tenant.get_usage_percentage("participants")
-                },
-                "storage": {
-                    "current": tenant.current_storage_gb,
-                    "max": tenant.max_storage_gb,
-                    "percentage": tenant.get_usage_percentage("storage_gb")
-                },
-                "admins": {
-                    "current": tenant.current_admins,
-                    "max": tenant.max_admins,
-                    "percentage": tenant.get_usage_percentage("admins")
-                }
-            },
+            "usage": usage,
             "features_enabled": tenant.features_enabled,
             "subscription_ends_at": tenant.subscription_ends_at.isoformat() if tenant.subscription_ends_at else None,
             "trial_ends_at": tenant.trial_ends_at.isoformat() if tenant.trial_ends_at else None
@@ -581,9 +662,15 @@ class TenantService:
     
     # Private helper methods
     
+    async def _invalidate_tenant(self, tenant_id: UUID, slug: Optional[str] = None) -> None:
+        """Drop a tenant from the per-process slug and Redis caches after it changes."""
+        if slug:
+            _slug_cache.pop(slug, None)
+        await tenant_cache.invalidate(tenant_id, slug)
+    
     async def _add_tenant_user(
         self,
-        db: Session,
+        db: AsyncSession,
         tenant_id: UUID,
         user_id: UUID,
         role: str,
@@ -603,9 +690,9 @@ class TenantService:
         )
         
         db.add(tenant_user)
-        db.commit()
-        db.refresh(tenant_user)
+        await db.commit()
         
+        await tenant_cache.invalidate_users(tenant_id)
         return tenant_user
     
     def _get_plan_limits(self, plan: str) -> Dict[str, int]:
@@ -709,7 +796,7 @@ class TenantService:
             }
         }
     
-    async def _handle_plan_change(self, db: Session, tenant: Tenant, new_plan: str) -> None:
+    async def _handle_plan_change(self, db: AsyncSession, tenant: Tenant, new_plan: str) -> None:
         """Handle plan upgrade/downgrade logic."""
         old_plan = tenant.plan
         
@@ -733,7 +820,7 @@ class TenantService:
                 # New paid subscription
                 tenant.subscription_ends_at = datetime.utcnow() + timedelta(days=30)
     
-    async def _initialize_tenant_data(self, db: Session, tenant: Tenant) -> None:
+    async def _initialize_tenant_data(self, db: AsyncSession, tenant: Tenant) -> None:
         """Initialize default data for a new tenant."""
         # Create default categories, templates, etc.
         # This would be expanded with actual initialization logic
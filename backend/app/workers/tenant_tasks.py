@@ -0,0 +1,73 @@
+"""
+Tenant maintenance background tasks
+"""
+from datetime import datetime
+
+from celery import current_app as celery_app
+from sqlalchemy import select, update
+
+from app.core.database import SessionLocal
+from app.models.event import Event
+from app.models.submission import Submission
+from app.models.team import Team
+from app.models.tenant import Tenant, TenantStatus, TenantUser
+
+# Rows touched per transaction while purging a tenant
+PURGE_BATCH_SIZE = 10000
+
+
+def _soft_delete_in_batches(db, model, tenant_id: str, deleted_at: datetime) -> int:
+    """Soft delete a tenant's rows in a table, one short transaction per batch"""
+    total = 0
+    while True:
+        batch = (
+            select(model.id)
+            .where(model.tenant_id == tenant_id, model.is_deleted == False)
+            .limit(PURGE_BATCH_SIZE)
+            .scalar_subquery()
+        )
+        result = db.execute(
+            update(model)
+            .where(model.id.in_(batch))
+            .values(is_deleted=True, deleted_at=deleted_at)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        total += result.rowcount
+        if result.rowcount < PURGE_BATCH_SIZE:
+            return total
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def purge_tenant(self, tenant_id: str):
+    """Soft delete a tenant's events, teams and submissions, then the tenant itself"""
+    db = SessionLocal()
+    try:
+        deleted_at = datetime.utcnow()
+        counts = {
+            model.__tablename__: _soft_delete_in_batches(db, model, tenant_id, deleted_at)
+            for model in (Submission, Team, Event)
+        }
+
+        # Memberships have no soft delete flag; deactivate them instead
+        db.execute(
+            update(TenantUser)
+            .where(TenantUser.tenant_id == tenant_id, TenantUser.is_active == True)
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            update(Tenant)
+            .where(Tenant.id == tenant_id)
+            .values(is_deleted=True, deleted_at=deleted_at, status=TenantStatus.SUSPENDED.value)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        return {"status": "purged", "tenant_id": tenant_id, **counts}
+    except Exception as exc:
+        db.rollback()
+        print(f"Tenant purge failed for {tenant_id}: {exc}")
+        self.retry(exc=exc)
+    finally:
+        db.close()
@@ -15,6 +15,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.exceptions import ServiceValidationError
 from app.models.base import Base
 from app.core.database_utils import (
     startup_database, 
@@ -24,6 +25,11 @@ from app.core.database_utils import (
 )
 from app.core.dependencies import AuthenticationMiddleware
 from app.core.redis_client import redis_client
+from app.core.redis import init_redis, close_redis
+from app.core.oauth import oauth_manager
+from app.core.auth import token_manager, session_manager
+from app.core.usage import usage_counter
+from app.core.cache_warm import tenant_cache_warmer
 
 # Import API routes
 from app.api.v1.auth import router as auth_router
@@ -52,11 +58,19 @@ async def lifespan(app: FastAPI):
         
         # Initialize Redis connection
         await redis_client.connect()
+        await init_redis()
         logger.info("Redis connection established")
         
-        # You can add other startup tasks here:
-        # - Start background tasks
-        # - Warm up caches
+        # Share one instance of each stateful manager per worker
+        app.state.token_manager = token_manager
+        app.state.session_manager = session_manager
+        app.state.oauth_manager = oauth_manager
+        
+        # Periodically write buffered usage increments to the tenants table
+        usage_counter.start()
+        
+        # Warm tenant caches now and every few minutes, off the startup path
+        tenant_cache_warmer.start()
         
         yield
         
@@ -66,7 +80,11 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("Shutting down HackOps application...")
+        await tenant_cache_warmer.stop()
+        await usage_counter.stop()
         await redis_client.disconnect()
+        await close_redis()
+        await oauth_manager.aclose()
         await shutdown_database()
         logger.info("Application shutdown completed")
 
@@ -191,6 +209,18 @@ async def http_exception_handler(request, exc: HTTPException):
         }
     )
 
+@app.exception_handler(ServiceValidationError)
+async def service_validation_error_handler(request, exc: ServiceValidationError):
+    """Handle invalid input rejected by the service layer."""
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            "error": True,
+            "message": str(exc),
+            "status_code": status.HTTP_400_BAD_REQUEST
+        }
+    )
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """Handle general exceptions."""
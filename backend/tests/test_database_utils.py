@@ -0,0 +1,50 @@
+"""
+Test suite for bulk database operation helpers
+"""
+
+from app.core.config import settings
+from app.core.database_utils import MAX_BIND_PARAMS, BulkOperations
+from app.models.tenant import Tenant
+
+
+class TestBulkBatches:
+    """Test suite for splitting bulk writes into batches."""
+    
+    @staticmethod
+    def rows(count: int):
+        """Minimal tenant rows for batching."""
+        return [{"name": f"Tenant {index}", "slug": f"tenant-{index}"} for index in range(count)]
+    
+    def test_batches_cover_every_row_in_order(self):
+        """Test that batches keep every row exactly once and in order."""
+        data = self.rows(25)
+        
+        batches = list(BulkOperations._batches(Tenant, data, 10))
+        
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert [row for batch in batches for row in batch] == data
+    
+    def test_batches_default_size(self):
+        """Test that the configured batch size applies when none is given."""
+        data = self.rows(settings.DATABASE_BULK_BATCH_SIZE + 1)
+        
+        batches = list(BulkOperations._batches(Tenant, data, None))
+        
+        assert len(batches[0]) == min(
+            settings.DATABASE_BULK_BATCH_SIZE, MAX_BIND_PARAMS // len(Tenant.__table__.columns)
+        )
+        assert sum(len(batch) for batch in batches) == len(data)
+    
+    def test_batches_stay_under_bind_parameter_limit(self):
+        """Test that oversized batches are clamped by the table's column count."""
+        columns = len(Tenant.__table__.columns)
+        data = self.rows(MAX_BIND_PARAMS)
+        
+        batches = list(BulkOperations._batches(Tenant, data, MAX_BIND_PARAMS))
+        
+        assert max(len(batch) for batch in batches) * columns <= MAX_BIND_PARAMS
+        assert sum(len(batch) for batch in batches) == len(data)
+    
+    def test_batches_of_empty_data(self):
+        """Test that no rows produce no batches."""
+        assert list(BulkOperations._batches(Tenant, [], 10)) == []
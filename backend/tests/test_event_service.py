@@ -0,0 +1,47 @@
+"""
+Test suite for event list pagination helpers
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.services.event_service import decode_event_cursor, encode_event_cursor
+
+
+class TestEventCursor:
+    """Test suite for keyset pagination cursors."""
+    
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the position it was built from."""
+        start_at = datetime(2024, 12, 1, 10, 30, 15, 123456)
+        event_id = uuid4()
+        
+        cursor = encode_event_cursor(start_at, event_id)
+        
+        assert decode_event_cursor(cursor) == (start_at, event_id)
+    
+    def test_cursor_accepts_string_ids(self):
+        """Test that string ids from mapped rows encode like UUIDs."""
+        start_at = datetime(2024, 12, 1)
+        event_id = uuid4()
+        
+        assert encode_event_cursor(start_at, str(event_id)) == encode_event_cursor(start_at, event_id)
+    
+    def test_cursor_is_url_safe(self):
+        """Test that cursors can be passed as query parameters unescaped."""
+        cursor = encode_event_cursor(datetime(2024, 12, 1), uuid4())
+        
+        assert all(char.isalnum() or char in "-_=" for char in cursor)
+    
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        "",
+        encode_event_cursor(datetime(2024, 12, 1), "not-a-uuid"),
+        "WyIyMDI0LTEyLTAxIl0=",  # a one-element array
+    ])
+    def test_invalid_cursor(self, cursor: str):
+        """Test that malformed cursors raise ValueError for a 400 response."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_event_cursor(cursor)
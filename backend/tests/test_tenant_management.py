@@ -14,6 +14,7 @@ import pytest
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
+from unittest.mock import MagicMock, patch
 from uuid import uuid4, UUID
 
 from fastapi.testclient import TestClient
@@ -23,11 +24,13 @@ from sqlalchemy import text
 from main import app
 from app.core.database import get_db
 from app.models.user import User
+from app.models.submission import Submission
 from app.models.tenant import Tenant, TenantUser, TenantStatus, TenantPlan
 from app.services.tenant_service import tenant_service
 from app.services.base_tenant_service import TenantScopedService
 from app.core.tenant_rls import rls_manager, TenantIsolationContext
 from app.core.database_utils import tenant_manager as db_tenant_manager
+from app.workers.tenant_tasks import PURGE_BATCH_SIZE, _soft_delete_in_batches
 from tests.conftest import TestData, create_test_user, create_test_tenant
 
 
@@ -151,20 +154,60 @@ class TestTenantService:
         assert updated_tenant.branding_config["primary_color"] == "#FF5733"
     
     def test_delete_tenant(self, db: Session, test_tenant: Tenant):
-        """Test soft deleting a tenant."""
-        success = asyncio.run(tenant_service.delete_tenant(db, test_tenant.id))
+        """Test scheduling a tenant for deletion."""
+        with patch("app.workers.tenant_tasks.purge_tenant.delay") as purge_delay:
+            success = asyncio.run(tenant_service.delete_tenant(db, test_tenant.id))
         
         assert success is True
         
-        # Verify tenant is soft deleted
-        deleted_tenant = asyncio.run(tenant_service.get_tenant(db, test_tenant.id))
-        assert deleted_tenant is None  # Should not be found due to soft delete filter
+        # Verify the purge worker was enqueued for the tenant
+        purge_delay.assert_called_once_with(str(test_tenant.id))
         
-        # Verify tenant exists but is marked deleted
+        # Verify tenant is marked deleting; the worker soft deletes it later
         actual_tenant = db.query(Tenant).filter(Tenant.id == test_tenant.id).first()
-        assert actual_tenant.is_deleted is True
-        assert actual_tenant.status == TenantStatus.SUSPENDED.value
-        assert actual_tenant.deleted_at is not None
+        assert actual_tenant.status == TenantStatus.DELETING.value
+        assert actual_tenant.is_deleted is False
+        assert actual_tenant.deleted_at is None
+
+
+class TestTenantPurge:
+    """Test suite for the batched tenant purge worker."""
+    
+    @staticmethod
+    def _purge_db(rowcounts: List[int]) -> MagicMock:
+        """Session double whose UPDATEs report the given row counts in turn."""
+        db = MagicMock()
+        db.execute.side_effect = [MagicMock(rowcount=rowcount) for rowcount in rowcounts]
+        return db
+    
+    def test_soft_delete_stops_after_short_batch(self):
+        """Test that a batch smaller than the batch size ends the purge."""
+        db = self._purge_db([PURGE_BATCH_SIZE, PURGE_BATCH_SIZE, 7])
+        
+        total = _soft_delete_in_batches(db, Submission, str(uuid4()), datetime.utcnow())
+        
+        assert total == 2 * PURGE_BATCH_SIZE + 7
+        assert db.execute.call_count == 3
+        assert db.commit.call_count == 3
+    
+    def test_soft_delete_stops_on_empty_batch(self):
+        """Test that an exact multiple of the batch size ends on an empty batch."""
+        db = self._purge_db([PURGE_BATCH_SIZE, 0])
+        
+        total = _soft_delete_in_batches(db, Submission, str(uuid4()), datetime.utcnow())
+        
+        assert total == PURGE_BATCH_SIZE
+        assert db.execute.call_count == 2
+    
+    def test_soft_delete_with_no_rows(self):
+        """Test that a tenant without rows takes a single batch."""
+        db = self._purge_db([0])
+        
+        total = _soft_delete_in_batches(db, Submission, str(uuid4()), datetime.utcnow())
+        
+        assert total == 0
+        assert db.execute.call_count == 1
+        assert db.commit.call_count == 1
 
 
 class TestTenantUserManagement:
@@ -576,15 +619,17 @@ class TestTenantAPIs:
     
     def test_delete_tenant_api(self, client: TestClient, auth_headers: Dict[str, str], test_tenant: Tenant):
         """Test delete tenant API endpoint."""
-        response = client.delete(
-            f"/api/v1/tenants/{test_tenant.id}",
-            headers=auth_headers
-        )
+        with patch("app.workers.tenant_tasks.purge_tenant.delay") as purge_delay:
+            response = client.delete(
+                f"/api/v1/tenants/{test_tenant.id}",
+                headers=auth_headers
+            )
         
-        assert response.status_code == 200
+        assert response.status_code == 202
         data = response.json()
         assert data["success"] is True
         assert data["data"] is True
+        purge_delay.assert_called_once_with(str(test_tenant.id))
     
     def test_add_tenant_user_api(self, client: TestClient, auth_headers: Dict[str, str], 
                                 test_tenant: Tenant, db: Session):
@@ -0,0 +1,197 @@
+"""
+Test suite for Redis-buffered tenant usage tracking
+
+Covers:
+- Buffering increments in Redis and the atomic Lua drain
+- Flushing buffered deltas to Postgres and re-queueing on failure
+- The usage limit check in TenantService.track_usage
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fakeredis import aioredis
+from fastapi import HTTPException
+
+from app.core.redis import redis_manager
+from app.core.usage import UsageCounter
+from app.services.tenant_service import tenant_service
+
+
+@pytest.fixture
+def fake_redis():
+    """Point the shared Redis manager at an in-memory Redis."""
+    client = aioredis.FakeRedis(decode_responses=True)
+    with patch.object(redis_manager, "redis_client", client):
+        yield client
+
+
+def session_factory(session: AsyncMock):
+    """Stand-in for db_manager.get_session that always yields the given session."""
+    @asynccontextmanager
+    async def get_session():
+        yield session
+    return get_session
+
+
+def usage_row_db(stored: int, maximum: int) -> AsyncMock:
+    """Session double returning one (current usage, limit) row for a tenant."""
+    db = AsyncMock()
+    result = MagicMock()
+    result.first.return_value = (stored, maximum)
+    db.execute.return_value = result
+    return db
+
+
+class TestUsageCounter:
+    """Test suite for the usage counter buffer."""
+    
+    def test_incr_buffers_and_marks_dirty(self, fake_redis):
+        """Test that increments accumulate per tenant and flag the tenant for flushing."""
+        counter = UsageCounter()
+        tenant_id = str(uuid4())
+        
+        async def run() -> Tuple[Any, Any, Dict[str, int], Any]:
+            first = await counter.incr(tenant_id, "events", 2)
+            second = await counter.incr(tenant_id, "events", 3)
+            return first, second, await counter.pending(tenant_id), await fake_redis.smembers(counter.dirty_key)
+        
+        first, second, pending, dirty = asyncio.run(run())
+        
+        assert (first, second) == (2, 5)
+        assert pending == {"events": 5}
+        assert dirty == {tenant_id}
+    
+    def test_incr_without_redis(self):
+        """Test that the counter reports no buffer when Redis is not connected."""
+        counter = UsageCounter()
+        
+        with patch.object(redis_manager, "redis_client", None):
+            assert asyncio.run(counter.incr(str(uuid4()), "events", 1)) is None
+            assert asyncio.run(counter.pending(str(uuid4()))) == {}
+    
+    def test_drain_takes_and_clears_deltas(self, fake_redis):
+        """Test that the Lua drain returns every delta and clears the buffer and dirty flag."""
+        counter = UsageCounter()
+        tenant_id = str(uuid4())
+        
+        async def run():
+            await counter.incr(tenant_id, "events", 1)
+            await counter.incr(tenant_id, "participants", 40)
+            deltas = await counter._drain(tenant_id)
+            return deltas, await counter.pending(tenant_id), await fake_redis.smembers(counter.dirty_key)
+        
+        deltas, pending, dirty = asyncio.run(run())
+        
+        assert deltas == {"events": 1, "participants": 40}
+        assert pending == {}
+        assert dirty == set()
+    
+    def test_flush_applies_deltas(self, fake_redis):
+        """Test that a flush writes one UPDATE per tenant and empties the buffer."""
+        counter = UsageCounter()
+        tenant_id = str(uuid4())
+        session = AsyncMock()
+        
+        async def run():
+            await counter.incr(tenant_id, "events", 3)
+            with patch("app.core.usage.db_manager.get_session", session_factory(session)):
+                flushed = await counter.flush()
+            return flushed, await counter.pending(tenant_id)
+        
+        flushed, pending = asyncio.run(run())
+        
+        assert flushed == 1
+        assert pending == {}
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        stmt = session.execute.await_args.args[0]
+        assert "current_events" in str(stmt)
+    
+    def test_flush_requeues_on_database_error(self, fake_redis):
+        """Test that deltas are buffered again when the UPDATE fails."""
+        counter = UsageCounter()
+        tenant_id = str(uuid4())
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("database unavailable")
+        
+        async def run():
+            await counter.incr(tenant_id, "events", 2)
+            await counter.incr(tenant_id, "storage", 5)
+            with patch("app.core.usage.db_manager.get_session", session_factory(session)):
+                flushed = await counter.flush()
+            return flushed, await counter.pending(tenant_id), await fake_redis.smembers(counter.dirty_key)
+        
+        flushed, pending, dirty = asyncio.run(run())
+        
+        assert flushed == 0
+        assert pending == {"events": 2, "storage": 5}
+        assert dirty == {tenant_id}
+    
+    def test_flush_skips_zero_deltas(self, fake_redis):
+        """Test that increments that cancel out issue no UPDATE."""
+        counter = UsageCounter()
+        tenant_id = str(uuid4())
+        session = AsyncMock()
+        
+        async def run():
+            await counter.incr(tenant_id, "events", 1)
+            await counter.incr(tenant_id, "events", -1)
+            with patch("app.core.usage.db_manager.get_session", session_factory(session)):
+                return await counter.flush()
+        
+        assert asyncio.run(run()) == 0
+        session.execute.assert_not_awaited()
+
+
+class TestTrackUsageLimits:
+    """Test suite for the usage limit check on buffered increments."""
+    
+    def test_track_usage_within_limit(self, fake_redis):
+        """Test that an increment under the limit is buffered."""
+        tenant_id = uuid4()
+        db = usage_row_db(stored=3, maximum=5)
+        
+        async def run():
+            tracked = await tenant_service.track_usage(db, tenant_id, "events", 2)
+            return tracked, await UsageCounter().pending(tenant_id)
+        
+        tracked, pending = asyncio.run(run())
+        
+        assert tracked is True
+        assert pending == {"events": 2}
+    
+    def test_track_usage_counts_pending_deltas(self, fake_redis):
+        """Test that unflushed increments count towards the limit and a rejected one is undone."""
+        tenant_id = uuid4()
+        db = usage_row_db(stored=3, maximum=5)
+        
+        async def run():
+            await tenant_service.track_usage(db, tenant_id, "events", 2)
+            with pytest.raises(HTTPException) as exc_info:
+                await tenant_service.track_usage(db, tenant_id, "events", 1)
+            return exc_info.value, await UsageCounter().pending(tenant_id)
+        
+        error, pending = asyncio.run(run())
+        
+        assert error.status_code == 400
+        assert "Current: 5, Max: 5" in error.detail
+        assert pending == {"events": 2}
+    
+    def test_track_usage_unknown_tenant(self, fake_redis):
+        """Test that usage for a missing tenant is rejected before buffering."""
+        tenant_id = uuid4()
+        db = AsyncMock()
+        result = MagicMock()
+        result.first.return_value = None
+        db.execute.return_value = result
+        
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(tenant_service.track_usage(db, tenant_id, "events", 1))
+        
+        assert exc_info.value.status_code == 404
+        assert asyncio.run(UsageCounter().pending(tenant_id)) == {}